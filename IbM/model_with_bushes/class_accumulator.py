@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 17:31:05
+Date last modified: 2026-10-18 17:31:05
+Purpose: This script defines the Accumulator class, which summarizes the output of many
+runs of the model without storing the output of every run.
+
+Broad idea:
+Each run of the model produces a row of the output file. Instead of keeping every row in
+memory until all the runs are over, an Accumulator keeps a fixed amount of information per
+column: the number of (non-NaN) values, their mean, the sums of the 2nd, 3rd and 4th powers
+of the deviations from the mean, and the minimum and maximum. These are updated as each row
+arrives (Welford's algorithm), and two accumulators (e.g. from different workers or different
+batches of runs) can be merged exactly using the pairwise formulas of Chan et al. and Pebay.
+The mean, sd, skew, kurtosis and confidence interval of every column are therefore available
+after any number of runs, and the accumulators can be saved to disk (see save_checkpoint)
+without ever holding the full results matrix.
+'''
+
+import os
+import numpy as np
+from scipy.stats import t as student_t
+
+class Accumulator:
+
+    def __init__(self,num_columns):
+
+        '''
+        num_columns is the number of values in each row that will be added
+        '''
+
+        self.count = np.zeros(num_columns)
+        self.mean = np.zeros(num_columns)
+        self.m2 = np.zeros(num_columns)
+        self.m3 = np.zeros(num_columns)
+        self.m4 = np.zeros(num_columns)
+        self.min = np.full(num_columns,np.inf)
+        self.max = np.full(num_columns,-np.inf)
+
+    def merge_moments(self,count,mean,m2,m3,m4,minimum,maximum):
+
+        '''
+        Merge the summary of another set of values (given column-wise, as the attributes of
+        an Accumulator) into this one. Columns where count is 0 are left unchanged
+        '''
+
+        count_a,count_b = self.count,np.asarray(count,dtype=float)
+        total = count_a + count_b
+        safe_total = np.where(total > 0,total,1)
+
+        delta = mean - self.mean
+        delta_n = delta/safe_total
+        cross = count_a*count_b
+
+        new_mean = self.mean + delta_n*count_b
+        new_m2 = self.m2 + m2 + delta*delta_n*cross
+        new_m3 = (self.m3 + m3 + delta*delta_n**2*cross*(count_a - count_b)
+                  + 3*delta_n*(count_a*m2 - count_b*self.m2))
+        new_m4 = (self.m4 + m4 + delta*delta_n**3*cross*(count_a**2 - count_a*count_b + count_b**2)
+                  + 6*delta_n**2*(count_a**2*m2 + count_b**2*self.m2) + 4*delta_n*(count_a*m3 - count_b*self.m3))
+
+        #columns without any new values stay as they are
+        changed = count_b > 0
+        self.mean = np.where(changed,new_mean,self.mean)
+        self.m2 = np.where(changed,new_m2,self.m2)
+        self.m3 = np.where(changed,new_m3,self.m3)
+        self.m4 = np.where(changed,new_m4,self.m4)
+        self.count = total
+        self.min = np.fmin(self.min,minimum)
+        self.max = np.fmax(self.max,maximum)
+
+    def add(self,row):
+
+        '''
+        Add a row of values (e.g. the output of one run of the model). NaN values are skipped,
+        so every column summarizes only the runs in which it was defined
+        '''
+
+        row = np.asarray(row,dtype=float)
+        present = ~np.isnan(row)
+        zeros = np.zeros(len(row))
+        self.merge_moments(present.astype(float),np.where(present,row,0),zeros,zeros,zeros,
+                           np.where(present,row,np.inf),np.where(present,row,-np.inf))
+
+    def merge(self,other):
+
+        '''
+        Merge another Accumulator (with the same number of columns) into this one
+        '''
+
+        self.merge_moments(other.count,other.mean,other.m2,other.m3,other.m4,other.min,other.max)
+
+    def variance(self):
+
+        '''
+        Sample variance of every column (NaN with less than two values)
+        '''
+
+        with np.errstate(all='ignore'):
+            return np.where(self.count > 1,self.m2/(self.count - 1),np.nan)
+
+    def sd(self):
+
+        '''
+        Sample standard deviation of every column
+        '''
+
+        return np.sqrt(self.variance())
+
+    def skew(self):
+
+        '''
+        Skew of every column (biased, as in scipy.stats.skew)
+        '''
+
+        with np.errstate(all='ignore'):
+            return np.where(self.m2 > 0,np.sqrt(self.count)*self.m3/self.m2**1.5,np.nan)
+
+    def kurtosis(self):
+
+        '''
+        Excess kurtosis of every column (biased, as in scipy.stats.kurtosis)
+        '''
+
+        with np.errstate(all='ignore'):
+            return np.where(self.m2 > 0,self.count*self.m4/self.m2**2 - 3,np.nan)
+
+    def confidence_interval(self,level=0.95):
+
+        '''
+        Confidence interval of the mean of every column, based on the t distribution.
+        Returns (lower,upper)
+        '''
+
+        with np.errstate(all='ignore'):
+            half_width = student_t.ppf(0.5 + level/2,self.count - 1)*self.sd()/np.sqrt(self.count)
+
+        return self.mean - half_width,self.mean + half_width
+
+    def state(self):
+
+        '''
+        Everything that is needed to reconstruct the Accumulator, as a dict of arrays
+        '''
+
+        return {'count':self.count,'mean':self.mean,'m2':self.m2,'m3':self.m3,'m4':self.m4,'min':self.min,'max':self.max}
+
+    @classmethod
+    def from_state(cls,state):
+
+        '''
+        Reconstruct an Accumulator from the output of state
+        '''
+
+        accumulator = cls(len(state['count']))
+        for name in ['count','mean','m2','m3','m4','min','max']:
+            setattr(accumulator,name,np.array(state[name],dtype=float))
+
+        return accumulator
+
+
+def save_checkpoint(path,accumulators,colnames):
+
+    '''
+    Save a list of Accumulators (e.g. one per set of parameters) to path (a .npz file), together
+    with the names of their columns. The file is first written under a temporary name and then
+    renamed, so that an interrupted write never destroys the previous checkpoint
+    '''
+
+    states = [accumulator.state() for accumulator in accumulators]
+    arrays = {name:np.array([state[name] for state in states]) for name in states[0]}
+
+    temp_path = path + '.tmp.npz'
+    np.savez(temp_path,colnames=np.array(colnames),**arrays)
+    os.replace(temp_path,path)
+
+def load_checkpoint(path):
+
+    '''
+    Load the Accumulators saved by save_checkpoint. Returns (accumulators,colnames)
+    '''
+
+    with np.load(path) as data:
+        colnames = list(data['colnames'])
+        accumulators = [Accumulator.from_state({name:data[name][i] for name in data.files if name != 'colnames'})
+                        for i in range(len(data['count']))]
+
+    return accumulators,colnames
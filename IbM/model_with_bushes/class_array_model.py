@@ -0,0 +1,751 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 11:02:37
+Date last modified: 2026-10-18 11:02:37
+Purpose: This script defines the ArrayModel class, an alternative engine for
+the model in class_model.py. Instead of keeping every cricket as a Signaller or
+Receiver object, the state of the population (positions, velocities, SPLs,
+calling/mating flags, timers, bush ids and movement counters) is stored in
+contiguous numpy arrays, and calling, phonotaxis, mating and the computation of
+the output are implemented as array operations. The behavioural rules are the
+same as the ones in class_model.py, so the two engines can be used
+interchangeably (see combined_run in set_up_parallelization.py).
+'''
+
+import numpy as np
+from summary_statistics import mate_counts, BAFFLER, CALLER, SILENT
+from class_bush import locations_in_bushes
+from class_male_and_female import call_schedule, audible_radius, audible_dist_sq
+from class_grid import close_pairs, expand_ranges
+from sampling import conditional_lognormal
+from class_random_streams import RandomStreams, SETUP, pick
+from class_params import DEFAULT_PARAMS
+
+class ArrayModel:
+
+    def __init__(self,N_sig,N_rec,landscape,mating_dist=None,threshold_SPL=None,seed=None,params=DEFAULT_PARAMS):
+
+        '''
+        N_sig is number of signallers
+        N_rec is number of receivers
+        landscape is the object (of class Landscape) where the simulation will take place
+        threshold_SPL is the sensitivity of the receiver in dB
+        mating_dist is the maximum distance between a male and a female which can be considered as a mating
+        seed is the seed of the random streams of the run (see class_random_streams.py). If it is not
+        given, it is drawn from the global numpy random state
+        params holds the static parameters of the run (see class_params.py). threshold_SPL and mating_dist
+        are taken from it if they are not given
+        '''
+        self.N_sig = int(N_sig)
+        self.N_rec = int(N_rec)
+        self.params = params
+        self.threshold_SPL = params.threshold_SPL if threshold_SPL is None else threshold_SPL
+        self.mating_dist = params.mating_dist if mating_dist is None else mating_dist
+        self.night_dur = params.night_dur
+        self.landscape = landscape
+
+        #whether crickets can move across bushes (not in the homogeneous habitat, see class_habitat.py)
+        self.across_bushes = landscape.habitat.across_bushes
+
+        #distance within which females look for males to listen to in the homogeneous habitat (set in gen_callers),
+        #None if females listen to all the males of their bush
+        self.listening_radius = None
+
+        #all random decisions are drawn from the same streams as in Model, so that both engines
+        #make the same decisions when they are given the same seed
+        if seed is None:
+            seed = np.random.randint(0,2**63,dtype=np.int64)
+        self.streams = RandomStreams(seed)
+
+        #bush information as arrays (bush i is landscape.bushlist[i])
+        if landscape.adj_ptr is None:
+            landscape.make_distance_list()
+        self.num_bushes = len(landscape.bushlist)
+
+        #amplitude of each bush. As in Bush, a running sum of the sound pressure (10**(SPL/20))
+        #of the audible males in each bush is kept up to date as males start or stop calling,
+        #start or stop mating, and move across bushes
+        self.bush_pressure = np.zeros(self.num_bushes) #summed sound pressure of the audible males
+        self.bush_num_loud = np.zeros(self.num_bushes,dtype=np.int64) #number of audible males
+        self.bush_amp = np.full(self.num_bushes,-np.inf) #mean amplitude of each bush (in dB SPL)
+
+        #number of cut off distances drawn during across bush phonotaxis, and the expected number of
+        #lognormal draws that redrawing until a loud bush is within the cut off would have needed
+        #(the sum of 1/P(X >= nearest loud bush) over the draws, see conditional_lognormal, not a simulated count).
+        #Neither is part of the output of a run (see single_run in set_up_parallelization.py for how to get them)
+        self.cut_off_draws = 0
+        self.expected_legacy_cut_off_draws = 0
+
+        #male velocities are drawn from a lognormal distribution
+        male_vel = self.streams.lognormal('male_velocity',SETUP,self.N_sig,self.params.male_vel_mean,self.params.male_vel_sd).copy()
+
+        #decompose into orthogonal components
+        male_vel /= np.sqrt(2)
+
+        self.male_vel_list = male_vel
+
+        #Make a truncated normal distribution that is within (0,1]
+        call_effort = np.zeros((0,)) #empty list to fill below
+        attempt = 0
+        while call_effort.shape[0] < self.N_sig:
+            sample = self.streams.normal('call_effort',attempt,self.N_sig,self.params.effort_mean,self.params.effort_sd)
+            attempt += 1
+
+            #only accept those samples which are in (0,1]
+            accepted = sample[(sample>0)&(sample<=1)]
+            call_effort = np.concatenate((call_effort,accepted),axis=0)
+        self.call_effort = call_effort[:self.N_sig] #discard extra values
+
+        '''State of the signallers (males). Element i of each array belongs to male i'''
+        #Position variables (in cm) and the bush each male is located in
+        self.sig_x = np.zeros(self.N_sig)
+        self.sig_y = np.zeros(self.N_sig)
+        self.sig_bush = np.zeros(self.N_sig,dtype=np.int64)
+
+        #Velocity variables (in cm/timestep)
+        self.sig_velx = np.zeros(self.N_sig)
+        self.sig_vely = np.zeros(self.N_sig)
+
+        #Call variables
+        self.sig_SPL = np.zeros(self.N_sig)
+        self.sig_baffler = np.zeros(self.N_sig,dtype=bool)
+        self.sig_call_effort = np.zeros(self.N_sig)
+        self.sig_calling = np.zeros(self.N_sig,dtype=bool)
+        self.sig_pressure = np.zeros(self.N_sig) #contribution of the call to the amplitude of the bush (in Pa)
+        self.sig_audible_dist_sq = np.zeros(self.N_sig) #squared radius of the active space of the call (in cm^2)
+        self.sig_in_bush_amp = np.zeros(self.N_sig,dtype=bool) #whether the call is currently counted in the amplitude of the bush
+        #call times of each male, padded with -1 (row i holds sig_num_call_times[i] valid entries)
+        self.sig_call_times = np.full((self.N_sig,0),-1,dtype=np.int64)
+        self.sig_num_call_times = np.zeros(self.N_sig,dtype=np.int64)
+        self.sig_call_instances = np.zeros(self.N_sig,dtype=np.int64)
+
+        #Mating variables
+        self.sig_mating = np.zeros(self.N_sig,dtype=bool)
+        self.sig_mating_timer = np.zeros(self.N_sig,dtype=np.int64)
+        self.sig_mated_count = np.zeros(self.N_sig,dtype=np.int64)
+
+        #Movement variables
+        self.sig_within_bush_steps = np.zeros(self.N_sig,dtype=np.int64)
+        self.sig_within_bush_distance = np.zeros(self.N_sig)
+        self.sig_across_bush_steps = np.zeros(self.N_sig,dtype=np.int64)
+        self.sig_across_bush_distance = np.zeros(self.N_sig)
+
+        '''State of the receivers (females). Element i of each array belongs to female i'''
+        self.rec_x = np.zeros(self.N_rec)
+        self.rec_y = np.zeros(self.N_rec)
+        self.rec_bush = np.zeros(self.N_rec,dtype=np.int64)
+        self.rec_velx = np.zeros(self.N_rec)
+        self.rec_vely = np.zeros(self.N_rec)
+
+        self.rec_mating = np.zeros(self.N_rec,dtype=bool)
+        self.rec_mating_timer = np.zeros(self.N_rec,dtype=np.int64)
+        self.rec_mated_count = np.zeros(self.N_rec,dtype=np.int64)
+
+        self.rec_within_bush_steps = np.zeros(self.N_rec,dtype=np.int64)
+        self.rec_within_bush_distance = np.zeros(self.N_rec)
+        self.rec_across_bush_steps = np.zeros(self.N_rec,dtype=np.int64)
+        self.rec_across_bush_distance = np.zeros(self.N_rec)
+        self.rec_within_bush_phonotaxis_steps = np.zeros(self.N_rec,dtype=np.int64)
+        self.rec_within_bush_phonotaxis_distance = np.zeros(self.N_rec)
+        self.rec_across_bush_phonotaxis_steps = np.zeros(self.N_rec,dtype=np.int64)
+        self.rec_across_bush_phonotaxis_distance = np.zeros(self.N_rec)
+
+    def random_locations(self,bushes,ux,uy):
+
+        '''
+        Returns random x and y coordinates that are uniformly distributed within
+        the bushes specified by the array of bush indices (one location per element),
+        using the uniform random values ux and uy
+        '''
+
+        return locations_in_bushes(self.landscape.bush_x[bushes],self.landscape.bush_y[bushes],self.landscape.bush_sizes[bushes],ux,uy)
+
+    #Make the signallers (males)
+    def gen_callers(self,baffle_prop,SPL,side):
+
+        #baffle_prop is proportion of N_sig that use baffles
+        baffle_num = int(round(baffle_prop*self.N_sig))
+
+        #the first baffle_num males are bafflers, the rest are non-bafflers
+        #We'll distinguish between callers and silent males later
+        self.sig_baffler[:baffle_num] = True
+
+        #SPL of the signaller is drawn from a Normal dist with specified mean and sd
+        #bafflers receive a boost to their SPL
+        self.sig_SPL = self.streams.normal('male_SPL',SETUP,self.N_sig,SPL,self.params.SPL_sd).copy()
+        self.sig_SPL[:baffle_num] += self.streams.normal('baffle_advantage',SETUP,self.N_sig,self.params.baffle_advantage_mean,self.params.baffle_advantage_SD)[:baffle_num]
+        self.sig_pressure = 10**(self.sig_SPL/20)
+
+        #squared distance beyond which each male cannot be heard (see audible_dist_sq)
+        self.sig_audible_dist_sq = audible_dist_sq(self.sig_SPL,self.threshold_SPL)
+
+        self.sig_call_effort = self.call_effort[self.streams.integers('male_call_effort',SETUP,self.N_sig,len(self.call_effort))]
+
+        #Assign each caller a location within one of the bushes present in the landscape
+        self.sig_bush = self.streams.integers('male_bush',SETUP,self.N_sig,self.num_bushes)
+        self.sig_x,self.sig_y = self.random_locations(self.sig_bush,self.streams.uniform('male_location_x',SETUP,self.N_sig),
+                                                      self.streams.uniform('male_location_y',SETUP,self.N_sig))
+
+        #In the homogeneous habitat, all the males are in the same bush, so a female is only paired with the males
+        #that are close enough to be heard at all (see listen). This is the distance at which the loudest male can still
+        #be heard (slightly larger, so that no audible male is lost to rounding)
+        if not self.across_bushes and self.N_sig:
+            self.listening_radius = audible_radius(self.sig_SPL.max(),self.threshold_SPL)*(1+1e-9)
+
+    #Make the receivers (females)
+    def gen_receivers(self,velx,vely,side):
+
+        '''
+        velx and vely are the x and y components of the velocity of females (array of values)
+        these values are from data in the lab
+        '''
+
+        self.rec_velx = velx[self.streams.integers('female_velocity_x',SETUP,self.N_rec,len(velx))]
+        self.rec_vely = vely[self.streams.integers('female_velocity_y',SETUP,self.N_rec,len(vely))]
+
+        #Assign each receiver a location within one of the bushes present in the landscape
+        self.rec_bush = self.streams.integers('female_bush',SETUP,self.N_rec,self.num_bushes)
+        self.rec_x,self.rec_y = self.random_locations(self.rec_bush,self.streams.uniform('female_location_x',SETUP,self.N_rec),
+                                                      self.streams.uniform('female_location_y',SETUP,self.N_rec))
+
+    def add_to_bush_amp(self,bushes,pressure,num_loud):
+
+        '''
+        Add the sound pressure (in Pa) of num_loud males to the amplitude of each of the
+        given bushes (negative values remove males from the amplitude). Only the
+        amplitudes of the given bushes are recomputed
+        '''
+
+        np.add.at(self.bush_pressure,bushes,pressure)
+        np.add.at(self.bush_num_loud,bushes,num_loud)
+
+        #reset silent bushes exactly, so that rounding errors in the running sum don't accumulate
+        silent = bushes[self.bush_num_loud[bushes] == 0]
+        self.bush_pressure[silent] = 0
+        self.bush_amp[silent] = -np.inf
+
+        loud = bushes[self.bush_num_loud[bushes] > 0]
+        self.bush_amp[loud] = 20*np.log10(self.bush_pressure[loud]) #convert back to dB
+
+    def update_bush_amp(self):
+
+        '''
+        A male contributes to the amplitude of his bush while he is calling and not mating.
+        Add or remove the calls of the males whose state has changed since the last update
+        '''
+
+        audible = self.sig_calling & ~self.sig_mating
+        changed = np.flatnonzero(audible != self.sig_in_bush_amp)
+        sign = np.where(audible[changed],1,-1)
+        self.add_to_bush_amp(self.sig_bush[changed],sign*self.sig_pressure[changed],sign)
+        self.sig_in_bush_amp[changed] = audible[changed]
+
+    def move(self,x,y,velx,vely,bush,inds,target_x,target_y):
+
+        '''
+        Vectorized version of Signaller.move and Receiver.move. Moves the individuals
+        with indices inds towards (target_x,target_y) according to their velocities,
+        with the boundaries of their bushes acting as reflective boundaries.
+        x, y, velx, vely and bush are the state arrays of either the males or the
+        females, and are modified in place. Returns the distance moved by each individual.
+        '''
+
+        old_x = x[inds]
+        old_y = y[inds]
+        vx = velx[inds]
+        vy = vely[inds]
+
+        #Find out where to go
+        dist = np.sqrt((old_x - target_x)**2+(old_y - target_y)**2)
+        safe_dist = np.where(dist > 0,dist,1)
+        unit_x = np.where(dist > 0,(target_x - old_x)/safe_dist,0) #unit vector pointing towards the target
+        unit_y = np.where(dist > 0,(target_y - old_y)/safe_dist,0)
+
+        #Move according to your velocity, without overshooting the target
+        overshoot = dist <= np.sqrt((unit_x*vx)**2+(unit_y*vy)**2)
+        new_x = np.where(overshoot,target_x,old_x + unit_x*vx)
+        new_y = np.where(overshoot,target_y,old_y + unit_y*vy)
+
+        #Make the boundaries of the bush an absolute reflective boundary
+        half_size = 0.5*self.landscape.bush_sizes[bush[inds]]
+        right_boundary = self.landscape.bush_x[bush[inds]] + half_size
+        left_boundary = self.landscape.bush_x[bush[inds]] - half_size
+        upper_boundary = self.landscape.bush_y[bush[inds]] + half_size
+        lower_boundary = self.landscape.bush_y[bush[inds]] - half_size
+
+        outside = new_x > right_boundary
+        new_x = np.where(outside,right_boundary - (new_x - right_boundary),new_x)
+        vx = np.where(outside & (vx > 0),-vx,vx)
+
+        outside = new_x < left_boundary
+        new_x = np.where(outside,left_boundary + (left_boundary - new_x),new_x)
+        vx = np.where(outside & (vx < 0),-vx,vx)
+
+        outside = new_y > upper_boundary
+        new_y = np.where(outside,upper_boundary - (new_y - upper_boundary),new_y)
+        vy = np.where(outside & (vy > 0),-vy,vy)
+
+        outside = new_y < lower_boundary
+        new_y = np.where(outside,lower_boundary + (lower_boundary - new_y),new_y)
+        vy = np.where(outside & (vy < 0),-vy,vy)
+
+        x[inds] = new_x
+        y[inds] = new_y
+        velx[inds] = vx
+        vely[inds] = vy
+
+        return np.sqrt((new_x-old_x)**2 + (new_y-old_y)**2)
+
+    def relocate(self,x,y,bush,inds,new_bushes,ux,uy):
+
+        '''
+        Moves the individuals with indices inds to random locations within new_bushes
+        (using the uniform random values ux and uy of each individual).
+        Returns the distance moved by each individual.
+        '''
+
+        new_x,new_y = self.random_locations(new_bushes,ux[inds],uy[inds])
+        distance = np.sqrt((new_x-x[inds])**2 + (new_y-y[inds])**2)
+
+        x[inds] = new_x
+        y[inds] = new_y
+        bush[inds] = new_bushes
+
+        return distance
+
+    def adjacent_pairs(self,bushes):
+
+        '''
+        Expand the adjacency lists of the given bushes. Returns (owner,pos), where
+        owner[k] is the position in bushes that adjacency entry pos[k] belongs to
+        (pos indexes into landscape.adj_index and landscape.adj_dist)
+        '''
+
+        starts = self.landscape.adj_ptr[bushes]
+        counts = self.landscape.adj_ptr[bushes+1] - starts
+
+        return expand_ranges(starts,counts)
+
+    def pick_random(self,owner,mask,num_owners,u):
+
+        '''
+        For every owner (0,...,num_owners-1), pick one of its entries at random among
+        the entries for which mask is True, using the uniform random value u[owner].
+        The entries must be sorted by owner, and the choice is made in the order in which
+        the entries of each owner appear (as in the Model class, where one of the options
+        in a list is picked). Returns an array of positions (into owner/mask) of length
+        num_owners, with -1 where no entry was available.
+        '''
+
+        entries = np.flatnonzero(mask)
+        counts = np.bincount(owner[entries],minlength=num_owners)
+        starts = np.cumsum(counts) - counts
+
+        chosen = np.full(num_owners,-1,dtype=np.int64)
+        has_entries = counts > 0
+        chosen[has_entries] = entries[starts[has_entries] + pick(u[has_entries],counts[has_entries])]
+
+        return chosen
+
+    def choose_nearby_bushes(self,bushes,cut_off_distance,u):
+
+        '''
+        Lognormal dispersal: for every bush in bushes, pick one of the adjacent bushes within
+        the corresponding (lognormally distributed) cut off distance at random, using the
+        uniform random values u. Returns the new bushes, with -1 where no bush was within the
+        cut off. Since the neighbours of each bush are sorted by distance, the bushes within the
+        cut off are the first num_close neighbours, and one of them is picked with a single
+        random integer (as in Bush.choose_nearby_bush).
+        '''
+
+        num_close = self.landscape.num_adj_within(bushes,cut_off_distance)
+        chosen = pick(u,num_close)
+
+        new_bushes = np.full(len(bushes),-1,dtype=np.int64)
+        has_close = num_close > 0
+        new_bushes[has_close] = self.landscape.adj_index[self.landscape.adj_ptr[bushes[has_close]] + chosen[has_close]]
+        return new_bushes
+
+    def listen(self,fems,u):
+
+        '''
+        Vectorized version of the within-bush part of Receiver.listen. For every
+        female in fems, pick one of the loudest audible males in her bush (subject to
+        the amplitude resolution constraint enforced by threshold_SPL_diff), using the
+        uniform random values u (one for every female). Returns (caller,focal_SPL),
+        with caller = -1 for females that cannot hear any male.
+        '''
+
+        #only males that are vocalizing and not mating are audible
+        audible = np.flatnonzero(self.sig_calling & ~self.sig_mating)
+
+        if self.listening_radius is None:
+            #group the audible males by bush (in order of their id), and pair every female with the males in her bush
+            order = audible[np.argsort(self.sig_bush[audible],kind='stable')]
+            counts = np.bincount(self.sig_bush[audible],minlength=self.num_bushes)
+            starts = np.cumsum(counts) - counts
+
+            owner,positions = expand_ranges(starts[self.rec_bush[fems]],counts[self.rec_bush[fems]])
+            callers = order[positions]
+        else:
+            #pair every female with the males that are within the listening radius (all in the same bush),
+            #in order of their id as above
+            owner,positions,_ = close_pairs(self.rec_x[fems],self.rec_y[fems],self.sig_x[audible],self.sig_y[audible],self.listening_radius)
+            callers = audible[positions]
+            order = np.lexsort((callers,owner))
+            owner = owner[order]
+            callers = callers[order]
+
+        #rule out the males that are too far away to be heard at all
+        dist_sq = (self.rec_x[fems][owner]-self.sig_x[callers])**2 + (self.rec_y[fems][owner]-self.sig_y[callers])**2
+        close = dist_sq <= self.sig_audible_dist_sq[callers]
+        owner = owner[close]
+        callers = callers[close]
+
+        #SPL of each remaining male at the location of the female
+        dist = np.sqrt(dist_sq[close])
+        SPLs = self.sig_SPL[callers] - 20*np.log10(np.where(dist > 0,dist,20)/20)
+
+        #keep the calls that are loud enough
+        loud_enough = SPLs >= self.threshold_SPL
+        owner = owner[loud_enough]
+        callers = callers[loud_enough]
+        SPLs = SPLs[loud_enough]
+
+        #Find the loudest males
+        focal_SPL = np.full(len(fems),-np.inf)
+        np.maximum.at(focal_SPL,owner,SPLs)
+
+        #pick a random male subject to amplitude resolution constraint
+        chosen = self.pick_random(owner,abs(SPLs - focal_SPL[owner]) < self.params.threshold_SPL_diff,len(fems),u)
+
+        loudest_caller = np.full(len(fems),-1,dtype=np.int64)
+        loudest_caller[chosen >= 0] = callers[chosen[chosen >= 0]]
+        return loudest_caller,focal_SPL
+
+    def phonotaxis(self,time):
+
+        '''
+        this function implements proabilistic phonotaxis according to perceived call amplitude,
+        as well as random movement within and across bushes. See Model.phonotaxis for the rules
+        '''
+
+        '''phonotaxis performed by females'''
+        fems = np.flatnonzero(~self.rec_mating) #Individuals can't perform phonotaxis when they're mating
+
+        #random values used by the females in this timestep (element i is used by female i, as in Model.phonotaxis)
+        ux = self.streams.uniform('female_location_x',time,self.N_rec)
+        uy = self.streams.uniform('female_location_y',time,self.N_rec)
+
+        #Each female decides whether to move within her bush or (if she doesn't) across bushes.
+        #Females that have already mated only perform phonotaxis with probability mated_phonotaxis_prop
+        moves_within = self.streams.uniform('female_within_bush',time,self.N_rec)[fems] <= self.params.fem_mov_prop_within_bush
+        if self.across_bushes:
+            moves_across = ~moves_within & (self.streams.uniform('female_across_bush',time,self.N_rec)[fems] <= self.params.fem_mov_prop_across_bush)
+        no_phonotaxis = (self.rec_mated_count[fems] > 0) & (self.streams.uniform('female_mated_phonotaxis',time,self.N_rec)[fems] > self.params.mated_phonotaxis_prop)
+
+        '''Within bush movement'''
+        within = fems[moves_within]
+        phonotactic = within[~no_phonotaxis[moves_within]]
+        loudest_caller,focal_SPL = self.listen(phonotactic,self.streams.uniform('female_caller_choice',time,self.N_rec)[phonotactic])
+        heard = loudest_caller >= 0
+
+        #Probabilistic phonotaxis, dependent on amplitude
+        approach = heard & (focal_SPL/self.params.min_SPL_for_movement >= self.streams.uniform('female_approach',time,self.N_rec)[phonotactic])
+        inds = phonotactic[approach]
+        target = loudest_caller[approach]
+        distance = self.move(self.rec_x,self.rec_y,self.rec_velx,self.rec_vely,self.rec_bush,inds,self.sig_x[target],self.sig_y[target])
+        self.rec_within_bush_phonotaxis_steps[inds] += 1
+        self.rec_within_bush_phonotaxis_distance[inds] += distance
+
+        #random movement if female does not hear males within a bush or does not perform phonotaxis
+        inds = np.concatenate((within[no_phonotaxis[moves_within]],phonotactic[~heard]))
+        target_x,target_y = self.random_locations(self.rec_bush[inds],ux[inds],uy[inds])
+        distance = self.move(self.rec_x,self.rec_y,self.rec_velx,self.rec_vely,self.rec_bush,inds,target_x,target_y)
+        self.rec_within_bush_steps[inds] += 1
+        self.rec_within_bush_distance[inds] += distance
+
+        '''Across bush movement'''
+        if self.across_bushes:
+            self.female_across_bush_movement(time,fems[moves_across],no_phonotaxis[moves_across],ux,uy)
+
+        '''movement performed by males'''
+        #males can't move while mating or baffling
+        males = np.flatnonzero(~self.sig_mating & ~self.sig_baffler)
+
+        #random values used by the males in this timestep (element i is used by male i, as in Model.phonotaxis)
+        ux = self.streams.uniform('male_location_x',time,self.N_sig)
+        uy = self.streams.uniform('male_location_y',time,self.N_sig)
+
+        #Males do not perform phonotaxis, they simply move around randomly
+        #Decide whether or not to move within the same bush based on your movement propensity
+        moves_within = self.streams.uniform('male_within_bush',time,self.N_sig)[males] <= self.params.male_mov_prop_within_bush
+        inds = males[moves_within]
+        target_x,target_y = self.random_locations(self.sig_bush[inds],ux[inds],uy[inds])
+        distance = self.move(self.sig_x,self.sig_y,self.sig_velx,self.sig_vely,self.sig_bush,inds,target_x,target_y)
+        self.sig_within_bush_steps[inds] += 1
+        self.sig_within_bush_distance[inds] += distance
+
+        #Males that don't move within their bush may move across bushes
+        if self.across_bushes:
+            self.male_across_bush_movement(time,males[~moves_within],ux,uy)
+
+    def female_across_bush_movement(self,time,across,no_phonotaxis,ux,uy):
+
+        '''
+        Movement of the females that decided to move across bushes in phonotaxis (across, with no_phonotaxis
+        True for those that don't perform phonotaxis because they have already mated): random movement to
+        a nearby bush, or phonotaxis towards the loudest adjacent bushes. ux and uy are the random values
+        used to place the females in their new bushes
+        '''
+
+        has_adj = np.diff(self.landscape.adj_ptr)[self.rec_bush[across]] > 0
+
+        #If a female isn't performing phonotaxis, it moves to a random bush
+        random_movers = across[no_phonotaxis & has_adj]
+        cut_off_distance = self.streams.lognormal('female_mated_dispersal',time,self.N_rec,self.params.fem_dist_mean,self.params.fem_dist_sd)[random_movers]
+        bush_choice = self.streams.uniform('female_mated_bush_choice',time,self.N_rec)[random_movers]
+        new_bushes = self.choose_nearby_bushes(self.rec_bush[random_movers],cut_off_distance,bush_choice)
+        moved = new_bushes >= 0
+        inds = random_movers[moved]
+        distance = self.relocate(self.rec_x,self.rec_y,self.rec_bush,inds,new_bushes[moved],ux,uy)
+        self.rec_across_bush_steps[inds] += 1
+        self.rec_across_bush_distance[inds] += distance
+
+        #Remaining females listen to the adjacent bushes (see Receiver.listen)
+        phonotactic = np.setdiff1d(across[has_adj],inds)
+        owner,pos = self.adjacent_pairs(self.rec_bush[phonotactic])
+        bush_dists = self.landscape.adj_dist[pos]
+        bush_SPLs = self.bush_amp[self.landscape.adj_index[pos]] - 20*np.log10(bush_dists/20)
+        audible = bush_SPLs >= self.threshold_SPL
+        hears = np.bincount(owner[audible],minlength=len(phonotactic)) > 0
+
+        #random movement across bushes if the phonotactic female does not hear anything
+        random_movers = phonotactic[~hears]
+        cut_off_distance = self.streams.lognormal('female_dispersal',time,self.N_rec,self.params.fem_dist_mean,self.params.fem_dist_sd)[random_movers]
+        bush_choice = self.streams.uniform('female_bush_choice',time,self.N_rec)[random_movers]
+        new_bushes = self.choose_nearby_bushes(self.rec_bush[random_movers],cut_off_distance,bush_choice)
+        moved = new_bushes >= 0
+        inds = random_movers[moved]
+        distance = self.relocate(self.rec_x,self.rec_y,self.rec_bush,inds,new_bushes[moved],ux,uy)
+        self.rec_across_bush_steps[inds] += 1
+        self.rec_across_bush_distance[inds] += distance
+
+        #If female can hear males across bushes, she performs phonotaxis towards the loudest bushes
+        listeners = phonotactic[hears]
+        if len(listeners):
+            owner = (np.cumsum(hears)-1)[owner[audible]] #renumber the owners among the listening females
+            pos = pos[audible]
+            bush_dists = bush_dists[audible]
+            bush_SPLs = bush_SPLs[audible]
+
+            #Find the loudest bushes subject to amplitude resolution constraints
+            max_SPL = np.full(len(listeners),-np.inf)
+            np.maximum.at(max_SPL,owner,bush_SPLs)
+            loud = abs(bush_SPLs - max_SPL[owner]) < self.params.threshold_SPL_diff
+
+            #sample according to lognormal dist, conditioned on at least one of the loud bushes being within the cut off
+            nearest = np.full(len(listeners),np.inf)
+            np.minimum.at(nearest,owner[loud],bush_dists[loud])
+            u = self.streams.uniform('female_phonotaxis_cut_off',time,self.N_rec)[listeners]
+            cut_off_distance,legacy_iterations = conditional_lognormal(self.params.fem_dist_mean,self.params.fem_dist_sd,nearest,u)
+            self.cut_off_draws += len(listeners)
+            self.expected_legacy_cut_off_draws += legacy_iterations.sum()
+
+            #pick one of these bushes at random
+            u = self.streams.uniform('female_phonotaxis_bush_choice',time,self.N_rec)[listeners]
+            chosen = self.pick_random(owner,loud & (bush_dists <= cut_off_distance[owner]),len(listeners),u)
+            distance = self.relocate(self.rec_x,self.rec_y,self.rec_bush,listeners,self.landscape.adj_index[pos[chosen]],ux,uy)
+            self.rec_across_bush_phonotaxis_steps[listeners] += 1
+            self.rec_across_bush_phonotaxis_distance[listeners] += distance
+
+    def male_across_bush_movement(self,time,males,ux,uy):
+
+        '''
+        Movement across bushes of the males that did not move within their bush in phonotaxis (males).
+        ux and uy are the random values used to place the males in their new bushes
+        '''
+
+        #Decide whether or not to move across bushes based on your movement propensity
+        across = males[self.streams.uniform('male_across_bush',time,self.N_sig)[males] <= self.params.male_mov_prop_across_bush]
+        across = across[np.diff(self.landscape.adj_ptr)[self.sig_bush[across]] > 0]
+        cut_off_distance = self.streams.lognormal('male_dispersal',time,self.N_sig,self.params.male_dist_mean,self.params.male_dist_sd)[across]
+        bush_choice = self.streams.uniform('male_bush_choice',time,self.N_sig)[across]
+        new_bushes = self.choose_nearby_bushes(self.sig_bush[across],cut_off_distance,bush_choice)
+        moved = new_bushes >= 0
+        inds = across[moved]
+
+        #the calls of the males that move are moved to the amplitude of their new bush
+        loud = self.sig_in_bush_amp[inds]
+        self.add_to_bush_amp(self.sig_bush[inds[loud]],-self.sig_pressure[inds[loud]],-1)
+        self.add_to_bush_amp(new_bushes[moved][loud],self.sig_pressure[inds[loud]],1)
+
+        distance = self.relocate(self.sig_x,self.sig_y,self.sig_bush,inds,new_bushes[moved],ux,uy)
+        self.sig_across_bush_steps[inds] += 1
+        self.sig_across_bush_distance[inds] += distance
+
+    def mate(self,time):
+
+        '''
+        this function implements mating.
+        A male and a female mate if they are less than a specified distance apart
+        Once they begin mating, they are mating for some period and have a refractory period during
+        which they cannot mate again.
+        '''
+
+        #females that are not mating, in random order (the same order as in Model.mate)
+        receivers = np.flatnonzero(~self.rec_mating)
+        order = self.streams.uniform('mating_order',time,self.N_rec)
+        receivers = receivers[np.argsort(order[receivers],kind='stable')]
+        mate_choice = self.streams.uniform('mate_choice',time,self.N_rec)
+
+        #Find out which males are close to each female, using a grid with cells of size mating_dist
+        #(the males close to each female are kept in order of their id)
+        free_callers = np.flatnonzero(~self.sig_mating)
+        rows,callers,_ = close_pairs(self.rec_x[receivers],self.rec_y[receivers],self.sig_x[free_callers],self.sig_y[free_callers],self.mating_dist)
+        callers = free_callers[callers]
+        order = np.lexsort((callers,rows))
+        rows = rows[order]
+        callers = callers[order]
+
+        #females are processed one after the other, so that each male mates with at most one female.
+        #Only females that have a male close to them need to be visited
+        group_starts = np.flatnonzero(np.diff(rows,prepend=-1))
+        group_ends = np.append(group_starts[1:],len(rows))
+        for start,end in zip(group_starts,group_ends):
+            close_callers = callers[start:end]
+            close_callers = close_callers[~self.sig_mating[close_callers]]
+            if len(close_callers):
+
+                receiver = receivers[rows[start]]
+                lucky_caller = close_callers[pick(mate_choice[receiver],len(close_callers))] #Choose one of the males within threshold distance
+                self.sig_mating[lucky_caller] = True
+                self.rec_mating[receiver] = True
+
+                #add to total mate counts of each individual
+                self.sig_mated_count[lucky_caller] += 1
+                self.rec_mated_count[receiver] += 1
+
+        #keep track of how long each individual has been mating for, and reset the timer when it is done mating
+        self.sig_mating_timer[self.sig_mating] += 1
+        done = self.sig_mating_timer % self.params.mating_duration == 0
+        self.sig_mating[done] = False
+        self.sig_mating_timer[done] = 0
+
+        self.rec_mating_timer[self.rec_mating] += 1
+        done = np.flatnonzero(self.rec_mating & (self.rec_mating_timer % self.params.mating_duration == 0))
+        self.rec_mating[done] = False
+        self.rec_mating_timer[done] = 0
+
+        #mating males don't contribute to the amplitude of their bush
+        self.update_bush_amp()
+
+        #Move the receivers to a random bush once they mate
+        new_bushes = self.streams.integers('female_relocation_bush',time,self.N_rec,self.num_bushes)[done]
+        self.rec_x[done],self.rec_y[done] = self.random_locations(new_bushes,self.streams.uniform('female_relocation_x',time,self.N_rec)[done],
+                                                                  self.streams.uniform('female_relocation_y',time,self.N_rec)[done])
+        self.rec_bush[done] = new_bushes
+
+    def decide_to_call(self,time):
+
+        '''
+        this function lets each caller decide the times during which it will call in a given night
+        the difference between callers and silent males is implemented here
+        '''
+
+        #Decide how many males (among the non-bafflers) are going to be callers
+        #male_call_prop is from data
+        #(the callers are the non-bafflers with the smallest random keys)
+        non_bafflers = np.flatnonzero(~self.sig_baffler)
+        num_callers = int(round(len(non_bafflers)*self.params.male_call_prop))
+        keys = self.streams.uniform('male_caller_choice',time,self.N_sig)
+        callers = non_bafflers[np.argsort(keys[non_bafflers],kind='stable')][:num_callers]
+
+        #Assign calling times to the bafflers and the non-baffling callers
+        calling_males = np.concatenate((np.flatnonzero(self.sig_baffler),callers))
+        effort = np.rint(self.sig_call_effort[calling_males]*self.params.decision_dur).astype(np.int64)
+
+        #(male i uses the first effort entries of row i of the stream, as in Model.decide_to_call)
+        call_times = np.full((self.N_sig,self.params.decision_dur),-1,dtype=np.int64)
+        call_times[:,:self.sig_call_times.shape[1]] = self.sig_call_times
+        draws = self.streams.integers('male_call_times',time,(self.N_sig,self.params.decision_dur),self.params.decision_dur)[calling_males]
+        call_times[calling_males] = np.where(np.arange(self.params.decision_dur)[None,:] < effort[:,None],draws,-1)
+        self.sig_call_times = call_times
+        self.sig_num_call_times[calling_males] = effort
+
+        #Precompute the calling schedule of every male for the coming night
+        self.call_schedule,self.call_checks = call_schedule(self.sig_call_times,self.sig_num_call_times,self.params.decision_dur)
+
+        #Assign velocities to the non-baffling callers and to the remaining males
+        #(silent males, which do not call at all)
+        movers = np.union1d(callers,np.flatnonzero(self.sig_num_call_times == 0))
+        self.sig_velx[movers] = self.male_vel_list[self.streams.integers('male_velocity_x',time,self.N_sig,len(self.male_vel_list))[movers]]
+        self.sig_vely[movers] = self.male_vel_list[self.streams.integers('male_velocity_y',time,self.N_sig,len(self.male_vel_list))[movers]]
+
+    def call(self,time):
+
+        '''
+        this function implements actual calling based on the call times
+        determined in the previous function
+        '''
+
+        #A male calls if the time is one of his call times and he is not mating. As in Model.call,
+        #call_instances is increased as counted in the habitat (see class_habitat.py)
+        not_mating = ~self.sig_mating
+        calls = self.call_schedule[:,time % self.params.decision_dur]
+        self.sig_calling = calls & not_mating
+        call_instances = self.landscape.habitat.call_instances(calls,self.call_checks[:,time % self.params.decision_dur])
+        self.sig_call_instances[not_mating] += call_instances[not_mating]
+
+        #keep the amplitudes of the bushes up to date
+        self.update_bush_amp()
+
+    def run(self, timesteps,side):
+
+        '''
+        implement all the functions defined above to actually run a simulation
+        for a given length of time (specified by timesteps)
+        '''
+
+        time = 0
+        while time < timesteps:
+
+            #not relevant if we only run for a single night
+            if time%self.params.decision_dur == 0:
+                self.decide_to_call(time)
+
+            self.call(time) #calling
+            self.phonotaxis(time) #movement + phonotaxis
+            self.mate(time) #mating
+
+            #reset mating status each night
+            if time % self.params.night_dur == 0:
+                self.rec_mated_count[:] = 0 #Reset mate counts of receivers each night
+
+            #progress to next timestep
+            time += 1
+
+    def get_mate_counts(self,baffle_prop):
+
+        '''
+        get the average mating success per individual for each of the three strategies
+        this will be the 'output' of our model, and we will use mating success as a
+        proxy for fitness. The output is in the same format as Model.get_mate_counts
+        '''
+
+        #the three male strategies
+        tactic = np.where(self.sig_baffler,BAFFLER,np.where(self.sig_num_call_times > 0,CALLER,SILENT))
+
+        male_metrics = np.column_stack((self.sig_mated_count,self.sig_call_instances,self.sig_within_bush_steps,self.sig_within_bush_distance,
+                                        self.sig_across_bush_steps,self.sig_across_bush_distance))
+
+        female_metrics = np.column_stack((self.rec_mated_count,self.rec_within_bush_steps,self.rec_within_bush_distance,
+                                          self.rec_across_bush_steps,self.rec_across_bush_distance,
+                                          self.rec_within_bush_phonotaxis_steps,self.rec_within_bush_phonotaxis_distance,
+                                          self.rec_across_bush_phonotaxis_steps,self.rec_across_bush_phonotaxis_distance))
+
+        #NOTE: the strategies of the males that each female mated with are not being returned here
+        return mate_counts(male_metrics,tactic,female_metrics)
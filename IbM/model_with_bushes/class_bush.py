@@ -17,11 +17,26 @@ amplitude difference between their current bush and the adjacent bushes. We need
 time since last mating. Alternatively, we could have males not move at all between bushes. 
 '''
 
-import random as rd
 import numpy as np
 from numpy.lib.arraysetops import isin
 
 from class_male_and_female import Receiver, Signaller
+from class_random_streams import pick
+
+def locations_in_bushes(cent_x,cent_y,bush_size,ux,uy):
+
+    '''
+    Vectorized version of Bush.assign_locations_in_bush. cent_x, cent_y and bush_size are
+    arrays holding the centers and sizes of a set of bushes (the same bush can appear many times),
+    and ux and uy are arrays of uniform random values in [0,1), one for each location.
+    Returns x and y coordinates that are uniformly distributed within each of these bushes
+    '''
+
+    x = cent_x + (ux - 0.5)*bush_size
+    y = cent_y + (uy - 0.5)*bush_size
+
+    return x,y
+
 
 class Bush:
 
@@ -33,27 +48,101 @@ class Bush:
         self.cent_x = cent_x #x coordinate of the center, in cm
         self.cent_y = cent_y #y coordinate of the center, in cm
         self.bush_size = bush_size #length of the side of the bush, in cm
-        self.adj_bushes = [] #bushes which are close to a focal bush. We will fill this in later
+        #bushes which are close to a focal bush, sorted by their distance from it. We will fill these in later
+        self.adj_bushes = [] #the adjacent bushes
+        self.adj_dists = np.zeros(0) #their distances from the focal bush (in increasing order)
 
         #inhabitants of the bush
         #we will fill these lists when running the model
         self.callerlist = [] #males
         self.receiverlist = [] #females
 
-        self.bush_amp = 0 #mean amplitude of the bush (in dB SPL)
+        #amplitude of the bush. Since dB is logarithmic, the calls of the males in the bush are added in Pa.
+        #pressure is a running sum of 10**(SPL/20) over the males that are audible (calling and not mating),
+        #and is updated every time a male starts or stops being audible, or moves in or out of the bush
+        self.pressure = 0 #summed sound pressure of the audible males
+        self.num_loud = 0 #number of audible males
+        self.bush_amp = -np.inf #mean amplitude of the bush (in dB SPL). A bush with no audible males is silent
 
-    def update_mean_amp(self): #update the mean amplitude of the bush at each instant
+    def add_pressure(self,caller):
 
-        num_callers = len(self.callerlist)
-        if num_callers:
-            loudness = 0
-            for caller in self.callerlist:
-                if caller.calling:
-                    loudness += 10**(caller.SPL/20) #since dB is logarithmic, adding should be done in Pa
-            
-            self.bush_amp = 20*np.log10(loudness) #convert back to dB
+        '''
+        Add the call of a male to the amplitude of the bush
+        '''
+
+        self.pressure += caller.pressure
+        self.num_loud += 1
+        self.bush_amp = 20*np.log10(self.pressure) #convert back to dB
+
+    def remove_pressure(self,caller):
+
+        '''
+        Remove the call of a male from the amplitude of the bush
+        '''
+
+        self.num_loud -= 1
+        if self.num_loud:
+            self.pressure -= caller.pressure
+            self.bush_amp = 20*np.log10(self.pressure) #convert back to dB
         else:
-            self.bush_amp = 0
+            #reset exactly, so that rounding errors in the running sum don't accumulate
+            self.pressure = 0
+            self.bush_amp = -np.inf
+
+    def update_mean_amp(self):
+
+        '''
+        Recompute the mean amplitude of the bush from scratch by going through all
+        the males in the bush. This is not needed while running the model (the amplitude
+        is kept up to date incrementally), but is useful to check the running sum
+        '''
+
+        self.pressure = 0
+        self.num_loud = 0
+        self.bush_amp = -np.inf
+        for caller in self.callerlist:
+            caller.in_bush_amp = caller.calling and not caller.mating
+            if caller.in_bush_amp:
+                self.add_pressure(caller)
+
+    def add_caller(self,caller):
+
+        '''
+        Add a male to the bush
+        '''
+
+        self.callerlist.append(caller)
+        caller.bush = self
+        if caller.in_bush_amp:
+            self.add_pressure(caller)
+
+    def remove_caller(self,caller):
+
+        '''
+        Remove a male from the bush, and return it
+        '''
+
+        caller = self.callerlist.pop(self.find_cricket_index(caller))
+        if caller.in_bush_amp:
+            self.remove_pressure(caller)
+
+        return caller
+
+    def choose_nearby_bush(self,cut_off_distance,u):
+
+        '''
+        Lognormal dispersal: pick one of the adjacent bushes that are at most cut_off_distance
+        away at random. Since adj_bushes is sorted by distance, these bushes are the first few
+        adjacent bushes. u is a uniform random value in [0,1) used to make the choice (from
+        the random streams of the model, see class_random_streams.py). Returns None if no
+        adjacent bush is close enough.
+        '''
+
+        num_close = np.searchsorted(self.adj_dists,cut_off_distance,side='right')
+        if num_close:
+            return self.adj_bushes[pick(u,num_close)]
+
+        return None
 
     def bush_amp_decay(self,dist):
 
@@ -87,29 +176,27 @@ class Bush:
             return False
 
 
-    def assign_locations_in_bush(self,obj=None):
+    def assign_locations_in_bush(self,obj,u):
         
         '''
-        when given an object, this function assigns the obj an x and y
+        when given an object (obj is not None), this function assigns the obj an x and y
         coordinate that is within the focal bush. The obj MUST contain 
         x and y attributes for this to work. We will use this to assign 
         random locations within the bush to callers and receivers.
 
-        When not given an object, the function instead returns a random
+        When obj is None, the function instead returns a random
         and y value that is within the bush. We will use this to program
         random movement within a bush
+
+        The bush is a square, so the x and y coordinates are drawn
+        independently and uniformly from the sides of the square
+        (see locations_in_bushes for a version for many bushes at once).
+        u is a tuple (ux,uy) of uniform random values in [0,1) used to
+        place the point (from the random streams of the model, see class_random_streams.py)
         '''
         
-        accept_values = False
-        while not accept_values:
-
-            #pick an x and y coordinate randomly
-            rand_x = rd.uniform(self.cent_x-self.bush_size,self.cent_x+self.bush_size)
-            rand_y = rd.uniform(self.cent_y-self.bush_size,self.cent_y+self.bush_size)
-
-            #check if this point is within the bush
-            #If the point is within the bush, accept these x and y values
-            accept_values = self.within_bush(rand_x,rand_y)
+        rand_x = self.cent_x + (u[0] - 0.5)*self.bush_size
+        rand_y = self.cent_y + (u[1] - 0.5)*self.bush_size
         
         if obj is not None:
             obj.x = rand_x
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 19:36:50
+Date last modified: 2026-10-18 19:36:50
+Purpose: This script defines the CostModel class, which predicts how long a run of the model
+(a task, see run_task in set_up_parallelization.py) will take, so that a sweep can run the
+longest tasks first.
+
+Broad idea:
+The time taken by a run varies by orders of magnitude with the number of individuals, the
+population density, the bush density and the engine. The logarithm of the run time is modelled
+as a linear function of the logarithms of these quantities (i.e. the run time is a product of
+powers of them), plus the baffling trait frequency and the sex ratio. Runs in the homogeneous habitat (a bush
+density of 0, see class_habitat.py) have a term of their own instead of the term of the bush density. The coefficients are fitted
+by least squares to the run times recorded in the result stores of earlier sweeps, and are pulled
+towards rough default values (measured on a laptop) when there are too few records to pin them down.
+'''
+
+import numpy as np
+import pandas as pd
+from class_params import DEFAULT_PARAMS
+from class_result_store import ResultStore
+
+#names of the features of a task (see task_features)
+FEATURES = ['intercept','log_N','log_density','log_bush_dens','baffle_prop','prop_males','array_engine','homogeneous']
+
+#default coefficients, used when there are no (or few) recorded run times
+DEFAULT_COEFFICIENTS = np.array([-4.1,1.0,-0.4,0.5,0.0,0.0,-2.0,0.5])
+
+def features(N,baffle_prop,density,prop_males,bush_dens,engine):
+
+    '''
+    The features (see FEATURES) of a run with the given parameters. All arguments can be arrays
+    (engine is then an array of strings). Returns an array with one row per run
+    '''
+
+    N = np.asarray(N,dtype=float)
+    ones = np.ones_like(N)
+
+    #the homogeneous habitat has no bush density (its log_bush_dens is 0)
+    bush_dens = np.asarray(bush_dens,dtype=float)
+    homogeneous = bush_dens == 0
+
+    return np.column_stack((ones,np.log(N),np.log(np.asarray(density,dtype=float))*ones,
+                            np.log(np.where(homogeneous,1,bush_dens))*ones,np.asarray(baffle_prop,dtype=float)*ones,
+                            np.asarray(prop_males,dtype=float)*ones,(np.asarray(engine) == 'array')*ones,homogeneous*ones))
+
+def task_features(tasks):
+
+    '''
+    The features of a list of tasks (see run_task), one row per task
+    '''
+
+    if len(tasks) == 0:
+        return np.zeros((0,len(FEATURES)))
+
+    return features([task[1] for task in tasks],[task[0][0] for task in tasks],[task[0][1] for task in tasks],
+                    [task[0][2] for task in tasks],[task[5].get('bush_dens',DEFAULT_PARAMS.bush_dens) for task in tasks],
+                    [task[2] for task in tasks])
+
+def lpt_makespan(costs,workers):
+
+    '''
+    Total time taken to run tasks with the given costs on a number of workers, when every task is
+    given to the first worker that becomes free and the tasks are taken longest first (longest
+    processing time first, LPT). Returns (makespan,order), where order is the order of the tasks
+    '''
+
+    order = np.argsort(-np.asarray(costs),kind='stable')
+    loads = np.zeros(max(1,int(workers)))
+    for task in order:
+        loads[np.argmin(loads)] += costs[task]
+
+    return loads.max(),order
+
+class CostModel:
+
+    def __init__(self,coefficients=DEFAULT_COEFFICIENTS):
+
+        '''
+        coefficients holds one coefficient per feature (see FEATURES)
+        '''
+
+        self.coefficients = np.array(coefficients,dtype=float)
+
+        #number of run times that the coefficients were fitted to
+        self.num_records = 0
+
+    def fit(self,X,run_times,prior_weight=1.0):
+
+        '''
+        Fit the coefficients to recorded run times (in seconds), given the features X of the runs
+        (one row per run). This is a ridge regression of the log run times on the features, in which
+        the coefficients are pulled towards their current values with weight prior_weight, so that
+        features that do not vary among the records (e.g. if all the runs used the same engine) keep
+        their current coefficients
+        '''
+
+        X = np.asarray(X,dtype=float)
+        y = np.log(np.maximum(np.asarray(run_times,dtype=float),1e-6))
+
+        #ridge regression towards the current coefficients, as an augmented least squares problem
+        penalty = np.sqrt(prior_weight)*np.eye(len(FEATURES))
+        A = np.vstack((X,penalty))
+        b = np.concatenate((y,penalty @ self.coefficients))
+        self.coefficients = np.linalg.lstsq(A,b,rcond=None)[0]
+        self.num_records = len(y)
+
+        return self
+
+    def fit_stores(self,store_paths,prior_weight=1.0):
+
+        '''
+        Fit the coefficients to the run times recorded in result stores of earlier sweeps (see
+        set_up_sweep.py and class_result_store.py). Stores that do not exist, or that have no run
+        times, are skipped
+        '''
+
+        records = []
+        for path in store_paths:
+            try:
+                store = ResultStore(path).read()
+            except pd.errors.EmptyDataError:
+                continue
+            if 'run_time' not in store.columns:
+                continue
+            store = store[store['run_time'].notna()]
+            if len(store) == 0:
+                continue
+            bush_dens = store['bush_dens'] if 'bush_dens' in store.columns else DEFAULT_PARAMS.bush_dens
+            N = np.rint(store['area(m^2)']*store['density'])
+            records.append((features(N,store['baffle_prop'],store['density'],store['prop_males'],bush_dens,store['engine']),store['run_time']))
+
+        if records:
+            self.fit(np.vstack([X for X,run_times in records]),np.concatenate([run_times for X,run_times in records]),prior_weight)
+
+        return self
+
+    def predict(self,tasks):
+
+        '''
+        Predicted run time (in seconds) of every task in a list of tasks (see run_task)
+        '''
+
+        return np.exp(task_features(tasks) @ self.coefficients)
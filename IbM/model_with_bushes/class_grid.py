@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 13:20:11
+Date last modified: 2026-10-18 23:12:40
+Purpose: Spatial indexing used to find individuals that are close to each other
+without comparing every pair of individuals in the landscape. The CellGrid class
+is used by the Model class (where individuals are objects), and the close_pairs
+function does the same job for the ArrayModel class (where individuals are
+elements of numpy arrays).
+
+Broad idea:
+The landscape is divided into a uniform grid of square cells whose side is equal to
+the search radius (e.g. mating_dist). Two individuals that are closer than the search
+radius must then be in the same cell or in adjacent cells, so only the 3x3 block of
+cells around an individual needs to be searched.
+Both models use this to find the females and males that are close enough to mate, and,
+in the homogeneous habitat (where every female is in the same bush as every male), to
+find the males that are close enough to be heard by a female (the search radius is then
+the distance at which the loudest male can still be heard, see audible_radius in
+class_male_and_female.py).
+'''
+
+import math
+import numpy as np
+
+class CellGrid:
+
+    def __init__(self,cell_size):
+
+        '''
+        cell_size is the length of the side of each (square) cell, in cm.
+        This should be at least as large as the distance within which we want to find individuals
+        '''
+
+        self.cell_size = cell_size
+        self.cells = {} #maps a cell (i,j) to the objects in it, stored as a dict of the form {id(obj):obj}
+        self.obj_cells = {} #maps id(obj) to the cell the object is currently in
+
+    def cell(self,x,y):
+
+        '''
+        Find out which cell a given location is in
+        '''
+
+        return (math.floor(x/self.cell_size),math.floor(y/self.cell_size))
+
+    def insert(self,obj):
+
+        '''
+        Add an object to the grid. The obj MUST contain x and y attributes for this to work
+        '''
+
+        cell = self.cell(obj.x,obj.y)
+        self.cells.setdefault(cell,{})[id(obj)] = obj
+        self.obj_cells[id(obj)] = cell
+
+    def remove(self,obj):
+
+        '''
+        Remove an object from the grid
+        '''
+
+        cell = self.obj_cells.pop(id(obj))
+        del self.cells[cell][id(obj)]
+        if not self.cells[cell]:
+            del self.cells[cell]
+
+    def update(self,obj):
+
+        '''
+        Move an object to the correct cell after it has moved. This should be called
+        every time the location of an object that is in the grid changes
+        '''
+
+        cell = self.cell(obj.x,obj.y)
+        if cell != self.obj_cells[id(obj)]:
+            self.remove(obj)
+            self.cells.setdefault(cell,{})[id(obj)] = obj
+            self.obj_cells[id(obj)] = cell
+
+    def neighbours(self,x,y):
+
+        '''
+        Returns all objects in the 3x3 block of cells around the location (x,y).
+        Every object within cell_size of (x,y) is guaranteed to be in this list
+        (but objects further away may also be in it)
+        '''
+
+        cell_x,cell_y = self.cell(x,y)
+        close_objs = []
+        for i in (cell_x-1,cell_x,cell_x+1):
+            for j in (cell_y-1,cell_y,cell_y+1):
+                if (i,j) in self.cells:
+                    close_objs.extend(self.cells[(i,j)].values())
+
+        return close_objs
+
+
+def expand_ranges(starts,counts):
+
+    '''
+    Given a set of ranges [starts[k],starts[k]+counts[k]), returns (owner,positions),
+    where positions contains every element of every range and owner[m] is the index k
+    of the range that positions[m] belongs to
+    '''
+
+    owner = np.repeat(np.arange(len(counts)),counts)
+    positions = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts,counts) + np.repeat(starts,counts)
+
+    return owner,positions
+
+
+def close_pairs(x1,y1,x2,y2,radius):
+
+    '''
+    Find all pairs (i,j) such that point i of the first set of points (x1,y1) and
+    point j of the second set of points (x2,y2) are less than radius apart, using a
+    uniform grid with cells of size radius. Returns (i,j,dist), sorted by i.
+    '''
+
+    if not len(x1) or not len(x2):
+        return np.zeros(0,dtype=np.int64),np.zeros(0,dtype=np.int64),np.zeros(0)
+
+    #cell of each point
+    cell_x1 = np.floor(x1/radius).astype(np.int64)
+    cell_y1 = np.floor(y1/radius).astype(np.int64)
+    cell_x2 = np.floor(x2/radius).astype(np.int64)
+    cell_y2 = np.floor(y2/radius).astype(np.int64)
+
+    #number each cell with a single integer (with a margin of one cell on each side)
+    min_x = min(cell_x1.min(),cell_x2.min()) - 1
+    min_y = min(cell_y1.min(),cell_y2.min()) - 1
+    num_y = max(cell_y1.max(),cell_y2.max()) - min_y + 2
+
+    #sort the second set of points by cell
+    keys = (cell_x2 - min_x)*num_y + (cell_y2 - min_y)
+    order = np.argsort(keys,kind='stable')
+    keys = keys[order]
+
+    #look up the points of the second set in the 3x3 block of cells around each point of the first set
+    first = []
+    second = []
+    for dx in (-1,0,1):
+        for dy in (-1,0,1):
+            query = (cell_x1 + dx - min_x)*num_y + (cell_y1 + dy - min_y)
+            starts = np.searchsorted(keys,query,side='left')
+            counts = np.searchsorted(keys,query,side='right') - starts
+            owner,positions = expand_ranges(starts,counts)
+            first.append(owner)
+            second.append(order[positions])
+
+    i = np.concatenate(first)
+    j = np.concatenate(second)
+
+    #only keep the pairs that are close enough
+    dist = np.sqrt((x2[j]-x1[i])**2 + (y2[j]-y1[i])**2)
+    close = dist < radius
+    i = i[close]
+    j = j[close]
+    dist = dist[close]
+
+    order = np.argsort(i,kind='stable')
+    return i[order],j[order],dist[order]
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 22:41:52
+Date last modified: 2026-10-18 22:41:52
+Purpose: This script defines the habitats in which the model can be run: a habitat of bushes
+(Bushes), and a homogeneous habitat (Homogeneous), which used to be a separate copy of the
+model (model_with_homogeneous_habitat).
+
+Broad idea:
+A habitat decides how the landscape is divided into bushes, and which bushes are close enough
+to each other for crickets to move between them. The homogeneous habitat is a single bush that
+covers the whole landscape, so that every cricket can hear and move towards every other cricket,
+and nobody ever moves across bushes. The Landscape asks its habitat for the layout of its bushes
+and for their adjacency, and the models (Model and ArrayModel) skip all the across bush movement
+when the habitat has no across bush movement (across_bushes is False). The two versions of the model
+also counted the calls of the males (call_instances) differently, and each habitat keeps the count of
+its own version (see call_instances), so the output matches that of the version it replaces.
+The habitat of a run follows from its static parameters (see habitat_of): a bush density of 0
+denotes the homogeneous habitat, as in the datasets of the figures.
+'''
+
+import numpy as np
+from scipy.spatial import cKDTree
+from class_random_streams import RandomStreams, SETUP
+
+class Bushes:
+
+    '''
+    Bushes distributed according to a uniform random 2D distribution, with sizes that follow a
+    (truncated) Normal distribution. Crickets move across bushes that are closer than threshold_bush_dist
+    '''
+
+    name = 'bushes'
+    across_bushes = True
+
+    def bush_layout(self,xdims,ydims,bush_dens,bush_size_mean,bush_size_sd,seed):
+
+        '''
+        The centers (x and y) and sizes of the bushes of a landscape with the given dimensions (see
+        Landscape), as arrays. The random numbers are drawn from streams keyed by seed (see
+        class_random_streams.py), and bush i always uses element i of each stream
+        '''
+
+        #compute area of the landcscape in square meters
+        #the 10^-4 is to convert from sq cm to sq m
+        landscape_area = (xdims[1]-xdims[0])*(ydims[1]-ydims[0])*(10**-4)
+
+        num_bushes = int(round(bush_dens*landscape_area))
+
+        streams = RandomStreams(seed)
+
+        #spatial locations - drawn from uniform random 2D distribution
+        x_locs = xdims[0] + streams.uniform('bush_x',SETUP,num_bushes)*(xdims[1]-xdims[0])
+        y_locs = ydims[0] + streams.uniform('bush_y',SETUP,num_bushes)*(ydims[1]-ydims[0])
+
+        #bush sizes - drawn from truncated Normal distribution
+        #(every negative size is redrawn, from the stream of the next attempt)
+        bush_sizes = streams.normal('bush_size',0,num_bushes,bush_size_mean,bush_size_sd)
+        attempt = 0
+        while np.any(bush_sizes <= 0):
+            attempt += 1
+            redraw = bush_sizes <= 0
+            bush_sizes = np.where(redraw,streams.normal('bush_size',attempt,num_bushes,bush_size_mean,bush_size_sd),bush_sizes)
+
+        return x_locs,y_locs,bush_sizes
+
+    def adjacency(self,bush_x,bush_y,threshold_bush_dist):
+
+        '''
+        The pairs of bushes that are closer than threshold_bush_dist, in compressed sparse row (CSR) form
+        (adj_ptr,adj_index,adj_dist): the neighbours of bush i are adj_index[adj_ptr[i]:adj_ptr[i+1]], sorted in
+        increasing order of distance, and their distances are adj_dist[adj_ptr[i]:adj_ptr[i+1]].
+        These pairs are found using a KD-tree instead of comparing every pair of bushes
+        '''
+
+        num_bushes = len(bush_x)
+
+        #find all pairs of bushes (i,j) with i < j that are within the threshold distance
+        #(the search radius is slightly larger so that no pair is lost to rounding, and the exact
+        #condition is checked below)
+        tree = cKDTree(np.column_stack((bush_x,bush_y)))
+        pairs = tree.query_pairs(threshold_bush_dist*(1+1e-9),output_type='ndarray')
+
+        #every pair appears once in each direction in the adjacency
+        first = np.concatenate((pairs[:,0],pairs[:,1])).astype(np.int64)
+        second = np.concatenate((pairs[:,1],pairs[:,0])).astype(np.int64)
+        dist = np.sqrt((bush_x[first]-bush_x[second])**2 + (bush_y[first]-bush_y[second])**2)
+
+        #If the bushes are not too far away from each other
+        close = (dist < threshold_bush_dist) & (dist > 0)
+        first = first[close]
+        second = second[close]
+        dist = dist[close]
+
+        #sort by bush, and by distance (then index) within each bush
+        order = np.lexsort((second,dist,first))
+        adj_ptr = np.zeros(num_bushes+1,dtype=np.int64)
+        adj_ptr[1:] = np.cumsum(np.bincount(first,minlength=num_bushes))
+
+        return adj_ptr,second[order],dist[order]
+
+    def call_instances(self,calls,checked):
+
+        '''
+        The increase in call_instances of every male at a timestep, where calls says whether each male calls
+        and checked is the number of his call times that are checked without a match (see call_schedule in
+        class_male_and_female.py). As in the model with bushes, this is the number of checked call times
+        '''
+
+        return checked
+
+class Homogeneous:
+
+    '''
+    A homogeneous habitat: a single bush that covers the whole landscape, so there is no across bush movement
+    '''
+
+    name = 'homogeneous'
+    across_bushes = False
+
+    def bush_layout(self,xdims,ydims,bush_dens,bush_size_mean,bush_size_sd,seed):
+
+        '''
+        The center and size of the single bush (see Bushes.bush_layout). No random numbers are needed
+        '''
+
+        x_locs = np.array([(xdims[0]+xdims[1])/2])
+        y_locs = np.array([(ydims[0]+ydims[1])/2])
+        bush_sizes = np.array([float(xdims[1]-xdims[0])])
+
+        return x_locs,y_locs,bush_sizes
+
+    def adjacency(self,bush_x,bush_y,threshold_bush_dist):
+
+        '''
+        The single bush has no neighbours (see Bushes.adjacency)
+        '''
+
+        return np.zeros(len(bush_x)+1,dtype=np.int64),np.zeros(0,dtype=np.int64),np.zeros(0)
+
+    def call_instances(self,calls,checked):
+
+        '''
+        As in the model with a homogeneous habitat, call_instances counts the timesteps at which each male calls
+        (see Bushes.call_instances)
+        '''
+
+        return calls.astype(np.int64)
+
+#the habitats in which the model can be run
+habitats = {'bushes':Bushes(),'homogeneous':Homogeneous()}
+
+def habitat_of(params):
+
+    '''
+    The habitat of runs with the given static parameters (see class_params.py): the homogeneous
+    habitat if the bush density is 0, and bushes otherwise
+    '''
+
+    return habitats['homogeneous'] if params.bush_dens == 0 else habitats['bushes']
@@ -10,10 +10,10 @@ this is a series of bushes and distances between them
 '''
 
 import numpy as np
-import random as rd
 from class_male_and_female import Receiver, Signaller
 from class_bush import Bush
-from static_params import threshold_bush_dist
+from class_habitat import habitats, habitat_of
+from class_params import DEFAULT_PARAMS
 
 def bush_dist(bush1,bush2):
         '''
@@ -26,7 +26,14 @@ def bush_dist(bush1,bush2):
 
 class Landscape:
 
-    def __init__(self,xdims,ydims):
+    def __init__(self,xdims,ydims,params=DEFAULT_PARAMS,habitat=None):
+
+        #static parameters of the runs on this landscape (see class_params.py)
+        self.params = params
+
+        #the habitat ('bushes' or 'homogeneous', see class_habitat.py). If it is not given,
+        #it follows from the bush density (a bush density of 0 is the homogeneous habitat)
+        self.habitat = habitat_of(params) if habitat is None else habitats[habitat]
 
         #Size parameters
         #xdims and ydims are lists of the form [min,max,step]
@@ -45,38 +52,52 @@ class Landscape:
         self.bushcenters = []
         self.bushdists = []
 
+        #array versions of the bush information (bush i is bushlist[i])
+        #will be filled in by make_bushes and make_distance_list
+        self.bush_x = None
+        self.bush_y = None
+        self.bush_sizes = None
+        self.adj_ptr = None
+        self.adj_index = None
+        self.adj_dist = None
+
     
-    def make_bushes(self,bush_dens,bush_size_mean,bush_size_sd):
+    def make_bushes(self,bush_dens=None,bush_size_mean=None,bush_size_sd=None,seed=None):
 
         '''
-        Fill in the landscape with bushes. Bushes are assumed to be distributed
-        according to a uniform random 2D distribution. Bush sizes are assumed to 
-        follow a Normal distribution with specified mean and variance 
-        (both of these can be changed to other distributions later if required)
+        Fill in the landscape with bushes, as laid out by the habitat of the landscape. With bushes,
+        bushes are assumed to be distributed according to a uniform random 2D distribution. Bush sizes
+        are assumed to follow a Normal distribution with specified mean and variance
+        (both of these can be changed to other distributions later if required).
+        The homogeneous habitat is a single bush that covers the whole landscape (see class_habitat.py)
+
+        The random numbers are drawn from streams keyed by seed (see class_random_streams.py;
+        a seed is drawn from numpy's global random state if it is not given), and bush i
+        always uses element i of each stream. Landscapes made with the same seed therefore
+        share their bushes as far as possible: for a different density or landscape size,
+        bush i is at the same relative position and has the same size
+        bush_dens, bush_size_mean and bush_size_sd are taken from the parameters of the landscape if they are not given
         '''
-        #compute area of the landcscape in square meters
-        #the 10^-4 is to convert from sq cm to sq m
-        landscape_area = (self.xdims[1]-self.xdims[0])*(self.ydims[1]-self.ydims[0])*(10**-4)
-        
-        num_bushes = int(round(bush_dens*landscape_area))
-
-        #spatial locations - drawn from uniform random 2D distribution
-        x_locs = np.random.uniform(self.xdims[0],self.xdims[1],size=num_bushes)
-        y_locs = np.random.uniform(self.ydims[0],self.ydims[1],size=num_bushes)
-
-        #bush sizes - drawn from truncated Normal distribution
-        bush_sizes = np.zeros((0,)) #empty list to fill below
-        while bush_sizes.shape[0] < num_bushes:
-            sample = np.random.normal(bush_size_mean,bush_size_sd,size=(num_bushes,))
-
-            #only accept those samples which are non-negative
-            accepted = sample[sample>0]
-            bush_sizes = np.concatenate((bush_sizes,accepted),axis=0)
-        bush_sizes = bush_sizes[:num_bushes] #discard extra values
+        if bush_dens is None:
+            bush_dens = self.params.bush_dens
+        if bush_size_mean is None:
+            bush_size_mean = self.params.bush_size_mean
+        if bush_size_sd is None:
+            bush_size_sd = self.params.bush_size_sd
+
+        if seed is None:
+            seed = np.random.randint(0,2**63,dtype=np.int64)
+
+        x_locs,y_locs,bush_sizes = self.habitat.bush_layout(self.xdims,self.ydims,bush_dens,bush_size_mean,bush_size_sd,seed)
+
+        #remember the bushes as arrays as well
+        self.bush_x = np.asarray(x_locs,dtype=float)
+        self.bush_y = np.asarray(y_locs,dtype=float)
+        self.bush_sizes = np.asarray(bush_sizes,dtype=float).flatten()
 
         bush_sizes = list((bush_sizes).flatten())
 
-        for i in range(num_bushes):
+        for i in range(len(bush_sizes)):
 
             #make the bushes
             bush = Bush(x_locs[i],y_locs[i],bush_sizes[i])
@@ -92,33 +113,64 @@ class Landscape:
         all inter-bush distances at the beginning and store
         these results 
         (so that we don't need to recompute at each step)
+
+        Only pairs of bushes that are closer than threshold_bush_dist are needed (see
+        Bushes.adjacency in class_habitat.py, the homogeneous habitat has none).
+        The result is stored in compressed sparse row (CSR) form: the neighbours of
+        bush i are adj_index[adj_ptr[i]:adj_ptr[i+1]], sorted in increasing order of
+        distance, and the corresponding distances are adj_dist[adj_ptr[i]:adj_ptr[i+1]].
+        Because of this ordering, the adjacent bushes within any cut off distance are
+        always the first few neighbours of a bush (see num_adj_within).
+        Each bush also remembers its own neighbours (adj_bushes) and distances (adj_dists)
         '''
 
-        for bush in self.bushlist:
-            for otherbush in self.bushlist:
-                dist = bush_dist(bush,otherbush)
-                if dist < threshold_bush_dist and dist > 0: #If the bushes are not too far away from each other
+        self.adj_ptr,self.adj_index,self.adj_dist = self.habitat.adjacency(self.bush_x,self.bush_y,self.params.threshold_bush_dist)
+
+        #Remember the bushes and distances
+        for i,bush in enumerate(self.bushlist):
+            start,stop = self.adj_ptr[i],self.adj_ptr[i+1]
+            bush.adj_bushes = [self.bushlist[j] for j in self.adj_index[start:stop].tolist()]
+            bush.adj_dists = self.adj_dist[start:stop]
+
+    def num_adj_within(self,bushes,cut_off_distance):
+
+        '''
+        For every bush in bushes (an array of indices into bushlist), find the number of
+        adjacent bushes that are at most cut_off_distance away. Since the neighbours of each
+        bush are sorted by distance, this is a binary search within each row of the adjacency
+        (done for all the bushes at once)
+        '''
+
+        lo = self.adj_ptr[bushes]
+        hi = self.adj_ptr[bushes+1]
+        start = lo.copy()
 
-                    #Remember the bushes and distances
-                    bush.adj_bushes.append((otherbush,dist))
-                    #otherbush.adj_bushes.append((bush,dist))
+        #invariant: every neighbour before lo is within the cut off, every neighbour from hi on is not
+        active = np.flatnonzero(lo < hi)
+        while len(active):
+            mid = (lo[active] + hi[active])//2
+            within = self.adj_dist[mid] <= cut_off_distance[active]
+            lo[active[within]] = mid[within] + 1
+            hi[active[~within]] = mid[~within]
+            active = active[lo[active] < hi[active]]
+
+        return lo - start
     
-    def assign_locations(self,obj):
+    def assign_locations(self,obj,rand_bush,u):
 
         '''
         this function assigns the obj an x and y coordinate that is
         within one of the bushes present in the landscape. The obj 
         MUST contain x and y attributes for this to work. We will use
         this to assign random locations to callers and receivers.
+        rand_bush is the bush to use (picked at random by the model), and u is
+        passed on to Bush.assign_locations_in_bush
         '''
 
-        #Pick a random bush
-        rand_bush = rd.choice(self.bushlist)
-
         #Assign the object a random location within the bush
-        rand_bush.assign_locations_in_bush(obj)
+        rand_bush.assign_locations_in_bush(obj,u)
         if isinstance(obj,Signaller):
-            rand_bush.callerlist.append(obj)
+            rand_bush.add_caller(obj)
         elif isinstance(obj,Receiver):
             rand_bush.receiverlist.append(obj)
         else:
@@ -127,3 +179,17 @@ class Landscape:
         #Make sure the object remembers which bush it is in
         obj.bush = rand_bush
 
+    def clear_bushes(self):
+
+        '''
+        Remove all males and females from the bushes (and reset the bush amplitudes),
+        so that the same landscape can be used for another run of the model
+        '''
+
+        for bush in self.bushlist:
+            bush.callerlist = []
+            bush.receiverlist = []
+            bush.pressure = 0
+            bush.num_loud = 0
+            bush.bush_amp = -np.inf
+
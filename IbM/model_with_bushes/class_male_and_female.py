@@ -12,11 +12,55 @@ receivers perceive these signals.
 '''
 
 import numpy as np
-from static_params import baffle_advantage_mean,baffle_advantage_SD, threshold_SPL
+from class_params import DEFAULT_PARAMS
+
+def call_schedule(call_times,num_call_times,decision_dur):
+
+    '''
+    Precompute when each male will call during the coming night, so that calling does not
+    need to scan the call times of every male at every timestep.
+
+    call_times is a (num_males x width) array of call times, padded with -1 (row i holds
+    num_call_times[i] valid call times), and decision_dur is the number of timesteps between two
+    decisions to call (see Params). Returns (schedule,checked), two (num_males x decision_dur)
+    arrays: schedule[i,t] is True if male i calls at time t (mod decision_dur), and checked[i,t] is
+    the number of call times of male i before the first one equal to t (all of them if none is).
+    checked is what Model.call has always added to call_instances.
+    '''
+
+    checked = np.repeat(num_call_times[:,None],decision_dur,axis=1)
+
+    #the first position at which each time appears among the call times of each male
+    males,positions = np.nonzero(call_times >= 0)
+    np.minimum.at(checked,(males,call_times[males,positions]),positions)
+
+    schedule = checked < num_call_times[:,None]
+
+    return schedule,checked
+
+def audible_radius(SPL,threshold_SPL):
+
+    '''
+    The distance (in cm) up to which a call of the given SPL (at the source, in dB SPL) is
+    at least threshold_SPL loud, i.e. the radius of the active space of the caller (see
+    Signaller.decay). SPL can be an array
+    '''
+
+    return 20*10**((np.asarray(SPL)-threshold_SPL)/20)
+
+def audible_dist_sq(SPL,threshold_SPL):
+
+    '''
+    The square of audible_radius, made slightly larger so that no caller at the edge of the active
+    space is lost to rounding. Callers that are further away than this (in squared distance) cannot be
+    heard, so the SPL of their call need not be computed. SPL can be an array
+    '''
+
+    return audible_radius(SPL,threshold_SPL)**2*(1+1e-9)
 
 class Signaller: #Traditionally the male, this class represents the individuals which signal for mates
     
-    def __init__(self,x,y,SPL,call_effort,baffler):
+    def __init__(self,x,y,SPL,call_effort,baffler,baffle_advantage=None,params=DEFAULT_PARAMS):
         
         '''
         x and y describe the position of the signaller in 2D space
@@ -24,7 +68,11 @@ class Signaller: #Traditionally the male, this class represents the individuals
         call_effort represents the call effort of the signaller, defined as proportion of
         the night during which the signaller will be calling.
         baffler is a boolean describing whether the signaller is currently using a baffle
+        baffle_advantage is the boost to the SPL of a baffler (drawn here if not given)
+        params holds the static parameters of the run (see class_params.py)
         '''
+
+        self.params = params
         
         #Position variables (in cm)
         self.x = x
@@ -39,15 +87,26 @@ class Signaller: #Traditionally the male, this class represents the individuals
         self.calling = False #Boolean describing whether the signaller is currently calling
         self.baffler = bool(baffler) #Boolean describing whether the signaller is a baffler
         self.call_times = [] #call_times is a list describing the times at which a male will call
+        self.index = None #id of the male in the model (his position in the calling schedule and in the random streams)
         self.call_effort = call_effort
         self.mating = False #To keep track of whether the male is currently mating
         self.mating_timer = 0 #To keep track of mating duration
         
         #If the individual is a baffler, it receives a boost to its SPL
         if self.baffler:
-            self.SPL = SPL + np.random.normal(baffle_advantage_mean,baffle_advantage_SD)
+            if baffle_advantage is None:
+                baffle_advantage = np.random.normal(params.baffle_advantage_mean,params.baffle_advantage_SD)
+            self.SPL = SPL + baffle_advantage
         else:
             self.SPL = SPL
+
+        #Contribution of the call to the amplitude of the bush (in Pa, see Bush.add_pressure)
+        self.pressure = 10**(self.SPL/20)
+
+        #Squared distance (in cm^2) beyond which the call is quieter than audible_threshold (see audible_dist_sq)
+        self.set_audible_threshold(params.threshold_SPL)
+
+        self.in_bush_amp = False #whether the call is currently counted in the amplitude of the bush
         
         #Fitness variables
         self.mated_count = 0 #When initialized, all individuals are unmated
@@ -118,6 +177,17 @@ class Signaller: #Traditionally the male, this class represents the individuals
             else:
                 return self.SPL
     
+    def set_audible_threshold(self,threshold_SPL):
+
+        '''
+        Remember the squared radius of the active space of the signaller for receivers with the given
+        threshold_SPL (see audible_dist_sq), which is used by Receiver.listen to rule out signallers
+        that are too far away to be heard
+        '''
+
+        self.audible_threshold = threshold_SPL
+        self.audible_dist_sq = audible_dist_sq(self.SPL,threshold_SPL)
+
     def move(self,location): #location is a 2-tuple (loc_x,loc_y) that is within the bush
 
         '''
@@ -170,25 +240,44 @@ class Signaller: #Traditionally the male, this class represents the individuals
            if self.vely<0:
                self.vely *= -1
     
+    def update_bush_amp(self):
+
+        '''
+        A male contributes to the amplitude of his bush while he is calling and not mating.
+        This function should be called whenever self.calling or self.mating changes, and
+        adds or removes the male's contribution to the amplitude of his bush if required
+        '''
+
+        audible = self.calling and not self.mating
+        if audible != self.in_bush_amp:
+            self.in_bush_amp = audible
+            if audible:
+                self.bush.add_pressure(self)
+            else:
+                self.bush.remove_pressure(self)
+
     def find_active_space(self): #For visualization purposes
-        SPL = self.SPL
-        return (20*10**((SPL-threshold_SPL)/20))
+        return audible_radius(self.SPL,self.params.threshold_SPL)
         
 
 class Receiver: #Traditionally the female, this class represents the individuals which find signallers
     
-    def __init__(self,x,y, velx, vely):
+    def __init__(self,x,y, velx, vely, params=DEFAULT_PARAMS):
         
         '''
         x and y describe the position of the reciever in 2D space
         velx and vely describe the x and y components of its velocity respectively
         mov_prop describes the propensity of the receiver to move in any given timestep
+        params holds the static parameters of the run (see class_params.py)
         '''    
+
+        self.params = params
         
         #Position variables (in cm)
         self.x = x
         self.y = y
         self.bush = None #Which bush the individual is located in
+        self.index = None #id of the female in the model (her position in the random streams)
 
         #Velocity variables (in cm/timestep)
         self.velx = velx
@@ -248,34 +337,46 @@ class Receiver: #Traditionally the female, this class represents the individuals
         
         return np.sqrt(xdist**2 + ydist**2) #Euclidean distance
 
-    def listen(self,threshold_SPL): 
+    def listen(self,threshold_SPL=None,candidates=None): 
         
-        '''Returns which callers are audible to the focal individual.'''
+        '''Returns which callers are audible to the focal individual (louder than threshold_SPL,
+        which is the threshold_SPL of the parameters of the receiver if it is not given).
+        candidates are the callers of the bush that may be audible (e.g. those near the receiver,
+        found with a CellGrid); all the callers of the bush are listened to if it is not given.'''
+
+        if threshold_SPL is None:
+            threshold_SPL = self.params.threshold_SPL
         
         '''Within bush'''
-        callerlist = self.bush.callerlist
+        #the callers are listed in order of their id, so that the order does not depend on when they entered the bush
+        callerlist = sorted(self.bush.callerlist if candidates is None else candidates,key=lambda caller: caller.index)
 
         closecallers = [] #We will add audible callers to this list
         SPLs = [] #We will add corresponding SPL values to this list
         for caller in callerlist:
-            dist = self.dist(caller)
             if caller.calling and not caller.mating: #If the signaller is vocalizing and not mating
-                if caller.decay(dist) >= threshold_SPL: #If the call is loud enough
-                    #add to list
-                    closecallers.append(caller)
-                    SPLs.append(caller.decay(dist))
+                if caller.audible_threshold != threshold_SPL:
+                    caller.set_audible_threshold(threshold_SPL)
+                dist_sq = (self.x - caller.x)**2 + (self.y - caller.y)**2
+                if dist_sq <= caller.audible_dist_sq: #If the caller is close enough to be heard at all
+                    SPL = caller.decay(np.sqrt(dist_sq))
+                    if SPL >= threshold_SPL: #If the call is loud enough
+                        #add to list
+                        closecallers.append(caller)
+                        SPLs.append(SPL)
         
         '''Across bush'''
         close_bushes = []
         bush_dists = []
         bush_SPL = []
-        adj_bushes = self.bush.adj_bushes
 
-        #each element of adj_bushes is a tuple (bush,dist_to_bush)
-        for bush in adj_bushes:
-            close_bushes.append(bush[0])
-            bush_dists.append(bush[1])
-            bush_SPL.append(bush[0].bush_amp_decay(bush[1]))
+        #adj_bushes and adj_dists store the adjacent bushes and their distances
+        for bush,dist in zip(self.bush.adj_bushes,self.bush.adj_dists):
+            SPL = bush.bush_amp_decay(dist)
+            if SPL >= threshold_SPL: #If the bush is loud enough
+                close_bushes.append(bush)
+                bush_dists.append(dist)
+                bush_SPL.append(SPL)
 
         return closecallers, SPLs, close_bushes, bush_dists, bush_SPL
     
@@ -12,11 +12,14 @@ and, as such, is an improvement over the null model that was the uniform
 2D distribution case.
 '''
 
-from class_male_and_female import Signaller, Receiver
-import random as rd
+import numpy as np
+from class_male_and_female import Signaller, Receiver, call_schedule, audible_radius
+from class_grid import CellGrid
+from sampling import conditional_lognormal
+from class_random_streams import RandomStreams, SETUP, pick
 import matplotlib.pyplot as plt
-from scipy.stats import kurtosis, skew
-from static_params import *
+from summary_statistics import mate_counts, BAFFLER, CALLER, SILENT
+from class_params import DEFAULT_PARAMS
 
 '''This class is an instance of a 'night'. It contains males and females distributed on a landscape
 according to specified parameter values, and then runs an 'experiment' and records the mating success
@@ -24,7 +27,7 @@ of various strategies.'''
 
 class Model:
     
-    def __init__(self,N_sig,N_rec,landscape,mating_dist=mating_dist,threshold_SPL=threshold_SPL):
+    def __init__(self,N_sig,N_rec,landscape,mating_dist=None,threshold_SPL=None,seed=None,params=DEFAULT_PARAMS):
 
         '''
         N_sig is number of signallers
@@ -32,18 +35,47 @@ class Model:
         landscape is the object (of class Landscape) where the simulation will take place
         threshold_SPL is the sensitivity of the receiver in dB
         mating_dist is the maximum distance between a male and a female which can be considered as a mating
+        seed is the seed of the random streams of the run (see class_random_streams.py). If it is not
+        given, it is drawn from the global numpy random state
+        params holds the static parameters of the run (see class_params.py). threshold_SPL and mating_dist
+        are taken from it if they are not given
         '''
         self.N_sig = int(N_sig)
         self.N_rec = int(N_rec)
         self.callerlist = []
         self.receiverlist = []
-        self.threshold_SPL = threshold_SPL
-        self.mating_dist = mating_dist
-        self.night_dur = night_dur
+        self.params = params
+        self.threshold_SPL = params.threshold_SPL if threshold_SPL is None else threshold_SPL
+        self.mating_dist = params.mating_dist if mating_dist is None else mating_dist
+        self.night_dur = params.night_dur
         self.landscape = landscape
 
+        #whether crickets can move across bushes (not in the homogeneous habitat, see class_habitat.py)
+        self.across_bushes = landscape.habitat.across_bushes
+
+        #all random decisions are drawn from streams keyed by the seed, the kind of decision and the timestep,
+        #and individual i always uses element i of a stream (so the order of individuals doesn't matter)
+        if seed is None:
+            seed = np.random.randint(0,2**63,dtype=np.int64)
+        self.streams = RandomStreams(seed)
+
+        #spatial index of the callers, with cells of size mating_dist
+        #used to find the males that are close enough to a female to mate with her
+        self.caller_grid = CellGrid(self.mating_dist)
+
+        #spatial index of the callers used to find the males that a female may hear, in the homogeneous
+        #habitat (see gen_callers). With bushes, a female only listens to the few males of her own bush
+        self.listening_grid = None
+
+        #number of cut off distances drawn during across bush phonotaxis, and the expected number of
+        #lognormal draws that redrawing until a loud bush is within the cut off would have needed
+        #(the sum of 1/P(X >= nearest loud bush) over the draws, see conditional_lognormal, not a simulated count).
+        #Neither is part of the output of a run (see single_run in set_up_parallelization.py for how to get them)
+        self.cut_off_draws = 0
+        self.expected_legacy_cut_off_draws = 0
+
         #male velocities are drawn from a lognormal distribution
-        male_vel = np.random.lognormal(male_vel_mean,male_vel_sd,size=int(N_sig))
+        male_vel = self.streams.lognormal('male_velocity',SETUP,self.N_sig,self.params.male_vel_mean,self.params.male_vel_sd).copy()
 
         #decompose into orthogonal components
         male_vel /= np.sqrt(2)
@@ -52,8 +84,10 @@ class Model:
 
         #Make a truncated normal distribution that is within (0,1]
         call_effort = np.zeros((0,)) #empty list to fill below
+        attempt = 0
         while call_effort.shape[0] < N_sig:
-            sample = np.random.normal(effort_mean,effort_sd,size=(int(N_sig),))
+            sample = self.streams.normal('call_effort',attempt,self.N_sig,self.params.effort_mean,self.params.effort_sd)
+            attempt += 1
 
             #only accept those samples which are in (0,1]
             accepted = sample[(sample>0)&(sample<=1)]
@@ -69,37 +103,43 @@ class Model:
         
         callerlist = []
         baffle_num = int(round(baffle_prop*self.N_sig))
-                
-        #Make bafflers
-        for i in range(0,(baffle_num)): #Make as many bafflers as specified by baffle_num
-            
-            #Make the signaller
-            #SPL of the signaller is drawn from a Normal dist with specified mean and sd
-            caller = Signaller(0,0,np.random.normal(loc=SPL,scale=SPL_sd),rd.choice(self.call_effort),baffler=True)
 
-            #Assign the caller a location within one of the bushes present in the landscape
-            self.landscape.assign_locations(caller)
-
-            #Append to list of all callers
-            callerlist.append(caller)
-        
-        #Make non-bafflers
+        #random values used to make the males (element i is used by male i)
+        SPLs = self.streams.normal('male_SPL',SETUP,self.N_sig,SPL,self.params.SPL_sd)
+        baffle_advantages = self.streams.normal('baffle_advantage',SETUP,self.N_sig,self.params.baffle_advantage_mean,self.params.baffle_advantage_SD)
+        efforts = self.streams.integers('male_call_effort',SETUP,self.N_sig,len(self.call_effort))
+        bushes = self.streams.integers('male_bush',SETUP,self.N_sig,len(self.landscape.bushlist))
+        ux = self.streams.uniform('male_location_x',SETUP,self.N_sig)
+        uy = self.streams.uniform('male_location_y',SETUP,self.N_sig)
+                
+        #Make bafflers first (males 0,...,baffle_num-1), and then non-bafflers
         #We'll distinguish between callers and silent males later
-        for i in range(0,int(self.N_sig)-baffle_num):
-
+        for i in range(0,int(self.N_sig)):
+            
             #Make the signaller
             #SPL of the signaller is drawn from a Normal dist with specified mean and sd
-            caller = Signaller(0,0,np.random.normal(loc=SPL,scale=SPL_sd),rd.choice(self.call_effort),baffler=False)
+            caller = Signaller(0,0,SPLs[i],self.call_effort[efforts[i]],baffler=(i < baffle_num),baffle_advantage=baffle_advantages[i],params=self.params)
+            caller.index = i
+            caller.set_audible_threshold(self.threshold_SPL)
 
             #Assign the caller a location within one of the bushes present in the landscape
-            self.landscape.assign_locations(caller)
+            self.landscape.assign_locations(caller,self.landscape.bushlist[bushes[i]],(ux[i],uy[i]))
+            self.caller_grid.insert(caller)
 
             #Append to list of all callers
             callerlist.append(caller)
         
-        rd.shuffle(callerlist) #shuffle is just to make the order random
-        
         self.callerlist = callerlist
+
+        #In the homogeneous habitat, all the males are in the same bush, so every female would listen to every
+        #male at every timestep. Instead, the males are kept in a grid with cells as large as the distance at which
+        #the loudest male can still be heard, so a female only listens to the males in the 3x3 block of cells around her
+        #(the cells are slightly larger, so that no audible male is lost to rounding)
+        if not self.across_bushes and len(callerlist):
+            radius = audible_radius(max(caller.SPL for caller in callerlist),self.threshold_SPL)
+            self.listening_grid = CellGrid(radius*(1+1e-9))
+            for caller in callerlist:
+                self.listening_grid.insert(caller)
         del callerlist #To save memory
     
     #Make the receivers (females)
@@ -114,28 +154,52 @@ class Model:
         
         reclist = []    
 
+        #random values used to make the females (element i is used by female i)
+        velx_choice = self.streams.integers('female_velocity_x',SETUP,self.N_rec,len(velx))
+        vely_choice = self.streams.integers('female_velocity_y',SETUP,self.N_rec,len(vely))
+        bushes = self.streams.integers('female_bush',SETUP,self.N_rec,len(self.landscape.bushlist))
+        ux = self.streams.uniform('female_location_x',SETUP,self.N_rec)
+        uy = self.streams.uniform('female_location_y',SETUP,self.N_rec)
+
         for i in range(0,self.N_rec):
 
-            receiver = Receiver(0,0,rd.choice(velx),rd.choice(vely))
+            receiver = Receiver(0,0,velx[velx_choice[i]],vely[vely_choice[i]],self.params)
+            receiver.index = i
 
             #Assign the receiver a location within one of the bushes present in the landscape
-            self.landscape.assign_locations(receiver)
+            self.landscape.assign_locations(receiver,self.landscape.bushlist[bushes[i]],(ux[i],uy[i]))
 
             #Append to list of all recievers
             reclist.append(receiver)
         
-        #shuffle is just so that the order is random, to prevent any accidental systemic biases
-        rd.shuffle(reclist)
         self.receiverlist = reclist
         del reclist #To save memory
     
     #Simulate phonotaxis
-    def phonotaxis(self):
+    def phonotaxis(self,time):
 
         '''
         this function implements proabilistic phonotaxis according to perceived call amplitude. The 
         phonotaxis function is from Rittik's data. 
         '''  
+
+        #random values used by the females in this timestep (element i is used by female i)
+        moves_within = self.streams.uniform('female_within_bush',time,self.N_rec)
+        no_phonotaxis = self.streams.uniform('female_mated_phonotaxis',time,self.N_rec)
+        caller_choice = self.streams.uniform('female_caller_choice',time,self.N_rec)
+        approach = self.streams.uniform('female_approach',time,self.N_rec)
+        ux = self.streams.uniform('female_location_x',time,self.N_rec)
+        uy = self.streams.uniform('female_location_y',time,self.N_rec)
+
+        #(the streams are keyed, so skipping the across bush values in the homogeneous habitat changes no other value)
+        if self.across_bushes:
+            moves_across = self.streams.uniform('female_across_bush',time,self.N_rec)
+            mated_cut_off = self.streams.lognormal('female_mated_dispersal',time,self.N_rec,self.params.fem_dist_mean,self.params.fem_dist_sd)
+            mated_bush_choice = self.streams.uniform('female_mated_bush_choice',time,self.N_rec)
+            phonotaxis_cut_off = self.streams.uniform('female_phonotaxis_cut_off',time,self.N_rec)
+            phonotaxis_bush_choice = self.streams.uniform('female_phonotaxis_bush_choice',time,self.N_rec)
+            random_cut_off = self.streams.lognormal('female_dispersal',time,self.N_rec,self.params.fem_dist_mean,self.params.fem_dist_sd)
+            random_bush_choice = self.streams.uniform('female_bush_choice',time,self.N_rec)
         
 
         '''phonotaxis performed by females'''
@@ -143,19 +207,23 @@ class Model:
             
             if receiver.mating: #Individuals can't perform phonotaxis when they're mating
                 continue
+            i = receiver.index
             
             #Find out which males/bushes are audible to the female and find out their corresponding SPLs
-            callers,SPLs,audible_bushes,bush_dists,bush_SPLs = receiver.listen(self.threshold_SPL)
+            if self.listening_grid is None:
+                callers,SPLs,audible_bushes,bush_dists,bush_SPLs = receiver.listen(self.threshold_SPL)
+            else:
+                callers,SPLs,audible_bushes,bush_dists,bush_SPLs = receiver.listen(self.threshold_SPL,self.listening_grid.neighbours(receiver.x,receiver.y))
             audible_bushes = np.array(audible_bushes)
             bush_dists = np.array(bush_dists)
 
 
-            if rd.uniform(0,1) <= fem_mov_prop_within_bush:
+            if moves_within[i] <= self.params.fem_mov_prop_within_bush:
                 if receiver.mated_count: #If a female has already mated, it doesn't perform phonotaxis and instead moves randomly depending on mated phonotaxis propensity criteria
-                    if np.random.uniform(0,1) > mated_phonotaxis_prop:
+                    if no_phonotaxis[i] > self.params.mated_phonotaxis_prop:
                         temp_x = receiver.x             #Temporary variable that holds value of x coordinate to calculate distance moved across bush
                         temp_y = receiver.y             #Temporary variable that holds value of x coordinate to calculate distance moved across bush
-                        receiver.move(receiver.bush.assign_locations_in_bush())
+                        receiver.move(receiver.bush.assign_locations_in_bush(None,(ux[i],uy[i])))
                         receiver.within_bush_steps +=1          ##Stores total number of across bush steps moved by caller
                         receiver.within_bush_distance += np.sqrt((receiver.x-temp_x)**2 + (receiver.y-temp_y)**2) #Stores total across bush distance moved
                         continue
@@ -166,9 +234,10 @@ class Model:
                     #Find the loudest males
                     focal_SPL = max(SPLs)
                     #pick a random male subject to amplitude resolution constraint (enforced by threshold_SPL_diff)
-                    loudest_caller = callers[rd.choice(np.where(abs(SPLs - max(SPLs))<threshold_SPL_diff)[0])]
+                    loudest_callers = np.where(abs(SPLs - max(SPLs))<self.params.threshold_SPL_diff)[0]
+                    loudest_caller = callers[loudest_callers[pick(caller_choice[i],len(loudest_callers))]]
                     
-                    if focal_SPL/min_SPL_for_movement >= np.random.uniform(): #Probabilistic phonotaxis, dependent on amplitude
+                    if focal_SPL/self.params.min_SPL_for_movement >= approach[i]: #Probabilistic phonotaxis, dependent on amplitude
                                             
                         '''gradually move to location according to specified velocity'''
                         temp_x = receiver.x             #Temporary variable that holds value of x coordinate to calculate distance moved across bush
@@ -183,35 +252,28 @@ class Model:
                 else:
                     temp_x = receiver.x             #Temporary variable that holds value of x coordinate to calculate distance moved across bush
                     temp_y = receiver.y             #Temporary variable that holds value of x coordinate to calculate distance moved across bush
-                    receiver.move(receiver.bush.assign_locations_in_bush())
+                    receiver.move(receiver.bush.assign_locations_in_bush(None,(ux[i],uy[i])))
                     receiver.within_bush_steps +=1          ##Stores total number of across bush steps moved by caller
                     receiver.within_bush_distance += np.sqrt((receiver.x-temp_x)**2 + (receiver.y-temp_y)**2)
                     continue
                 
                 
+            #There are no other bushes to move to in the homogeneous habitat
+            if not self.across_bushes:
+                continue
+
             #Decide whether to move to a new bush   
-            if rd.uniform(0,1) <= fem_mov_prop_across_bush:
+            if moves_across[i] <= self.params.fem_mov_prop_across_bush:
                 if receiver.mated_count: #If a female has already mated, it doesn't perform phonotaxis and instead moves randomly depending on mated phonotaxis propensity criteria
-                    if np.random.uniform(0,1) > mated_phonotaxis_prop:
+                    if no_phonotaxis[i] > self.params.mated_phonotaxis_prop:
                         #If female is not doing phonotaxis,it moves to a random bush
                         if len(receiver.bush.adj_bushes):
 
-                            #adj_bushes stores values as (bush,distance)
-                            bush_distr = [var[0] for var in receiver.bush.adj_bushes]
-                            distance_distr = [var[1] for var in receiver.bush.adj_bushes]
-
-                            bush_distr = np.array(bush_distr)
-                            distance_distr = np.array(distance_distr)
-
                             #Find potential bushes according to specified lognormal distribution
-                            distance_distr = np.array(distance_distr)
-                            cut_off_distance = np.random.lognormal(fem_dist_mean,fem_dist_sd,size=1)
-                            potential_bushes = bush_distr[distance_distr <= cut_off_distance]
+                            #and pick one of the acceptable bushes at random
+                            new_bush = receiver.bush.choose_nearby_bush(mated_cut_off[i],mated_bush_choice[i])
                             
-                            if len(potential_bushes):
-
-                            #pick one of the acceptable bushes at random
-                                new_bush = rd.choice(potential_bushes)
+                            if new_bush is not None:
     
                                 receiver_index = receiver.bush.find_cricket_index(receiver)
                                 receiver = receiver.bush.receiverlist.pop(receiver_index)
@@ -221,7 +283,7 @@ class Model:
                                 new_bush.receiverlist.append(receiver)
                                 temp_x = receiver.x             #Temporary variable that hold value of x coordinate to calculate distance moved across bush
                                 temp_y = receiver.y              #Temporary variable that hold value of x coordinate to calculate distance moved across bush
-                                new_bush.assign_locations_in_bush(receiver)
+                                new_bush.assign_locations_in_bush(receiver,(ux[i],uy[i]))
                                 receiver.across_bush_steps +=1          #Stores total number of across bush steps moved by caller
                                 receiver.across_bush_distance += np.sqrt((receiver.x-temp_x)**2 + (receiver.y-temp_y)**2) #Stores total across bush distance moved
     
@@ -233,19 +295,19 @@ class Model:
                         bush_SPLs = np.array(bush_SPLs,dtype='object')
 
                         #Find the loudest bushes subject to amplitude resolution constraints
-                        bush_indices = np.where(abs(bush_SPLs - max(bush_SPLs))<threshold_SPL_diff)[0]
+                        bush_indices = np.where(abs(bush_SPLs - max(bush_SPLs))<self.params.threshold_SPL_diff)[0]
 
                         loud_bushes = audible_bushes[bush_indices]
                         bush_dists = bush_dists[bush_indices]
 
-                        #sample according to lognormal dist
-                        potential_bushes = []
-                        while not len(potential_bushes):
-                            cut_off_distance = np.random.lognormal(fem_dist_mean,fem_dist_sd,size=1)
-                            potential_bushes = loud_bushes[bush_dists <= cut_off_distance]
+                        #sample according to lognormal dist, conditioned on at least one of the loud bushes being within the cut off
+                        cut_off_distance,legacy_iterations = conditional_lognormal(self.params.fem_dist_mean,self.params.fem_dist_sd,min(bush_dists),phonotaxis_cut_off[i])
+                        potential_bushes = loud_bushes[bush_dists <= cut_off_distance]
+                        self.cut_off_draws += 1
+                        self.expected_legacy_cut_off_draws += legacy_iterations
                         
                         #pick one of these bushes at random
-                        loudest_bush = rd.choice(potential_bushes)
+                        loudest_bush = potential_bushes[pick(phonotaxis_bush_choice[i],len(potential_bushes))]
 
                         #remove the receiver from its original bush
                         receiver_index = receiver.bush.find_cricket_index(receiver)
@@ -256,7 +318,7 @@ class Model:
                         loudest_bush.receiverlist.append(receiver)
                         temp_x = receiver.x             #Temporary variable that hold value of x coordinate to calculate distance moved across bush
                         temp_y = receiver.y              #Temporary variable that hold value of x coordinate to calculate distance moved across bush
-                        loudest_bush.assign_locations_in_bush(receiver)
+                        loudest_bush.assign_locations_in_bush(receiver,(ux[i],uy[i]))
                         receiver.across_bush_phonotaxis_steps +=1          #Stores total number of across bush steps moved by caller
                         receiver.across_bush_phonotaxis_distance += np.sqrt((receiver.x-temp_x)**2 + (receiver.y-temp_y)**2) #Stores total across bush distance moved
                         #Move on to the next receiver
@@ -265,22 +327,11 @@ class Model:
                     #random movement across bushes if the phonotactic female does not hear anything
                 elif len(receiver.bush.adj_bushes):
 
-                        #adj_bushes stores values as (bush,distance)
-                        bush_distr = [var[0] for var in receiver.bush.adj_bushes]
-                        distance_distr = [var[1] for var in receiver.bush.adj_bushes]
-
-                        bush_distr = np.array(bush_distr)
-                        distance_distr = np.array(distance_distr)
-
                         #Find potential bushes according to specified lognormal distribution
-                        distance_distr = np.array(distance_distr)
-                        cut_off_distance = np.random.lognormal(fem_dist_mean,fem_dist_sd,size=1)
-                        potential_bushes = bush_distr[distance_distr <= cut_off_distance]
+                        #and pick one of the acceptable bushes at random
+                        new_bush = receiver.bush.choose_nearby_bush(random_cut_off[i],random_bush_choice[i])
                         
-                        if len(potential_bushes):
-
-                            #pick one of the acceptable bushes at random
-                            new_bush = rd.choice(potential_bushes)
+                        if new_bush is not None:
     
                             receiver_index = receiver.bush.find_cricket_index(receiver)
                             receiver = receiver.bush.receiverlist.pop(receiver_index)
@@ -291,7 +342,7 @@ class Model:
                             
                             temp_x = receiver.x             #Temporary variable that hold value of x coordinate to calculate distance moved across bush
                             temp_y = receiver.y             #Temporary variable that hold value of x coordinate to calculate distance moved across bush
-                            new_bush.assign_locations_in_bush(receiver)
+                            new_bush.assign_locations_in_bush(receiver,(ux[i],uy[i]))
                             receiver.across_bush_steps +=1          #Stores total number of across bush steps moved by caller
                             receiver.across_bush_distance += np.sqrt((receiver.x-temp_x)**2 + (receiver.y-temp_y)**2) #Stores total across bush distance moved
     
@@ -300,44 +351,50 @@ class Model:
 
         
         '''movement performed by males'''
+        #random values used by the males in this timestep (element i is used by male i)
+        moves_within = self.streams.uniform('male_within_bush',time,self.N_sig)
+        ux = self.streams.uniform('male_location_x',time,self.N_sig)
+        uy = self.streams.uniform('male_location_y',time,self.N_sig)
+        if self.across_bushes:
+            moves_across = self.streams.uniform('male_across_bush',time,self.N_sig)
+            cut_off = self.streams.lognormal('male_dispersal',time,self.N_sig,self.params.male_dist_mean,self.params.male_dist_sd)
+            bush_choice = self.streams.uniform('male_bush_choice',time,self.N_sig)
+
         for caller in self.callerlist:
 
             
             if caller.mating or caller.baffler: #males can't move while mating or baffling
                 continue
+            i = caller.index
             #Males do not perform phonotaxis, they simply move around randomly
             #Decide whether or not to move within the same bush based on your movement propensity
-            if rd.uniform(0,1) <= male_mov_prop_within_bush:
+            if moves_within[i] <= self.params.male_mov_prop_within_bush:
 
                 temp_x = caller.x             #Temporary variable that holds value of x coordinate to calculate distance moved across bush
                 temp_y = caller.y             #Temporary variable that holds value of x coordinate to calculate distance moved across bush
-                caller.move(caller.bush.assign_locations_in_bush())
+                caller.move(caller.bush.assign_locations_in_bush(None,(ux[i],uy[i])))
+                self.caller_grid.update(caller)
+                if self.listening_grid is not None:
+                    self.listening_grid.update(caller)
                 caller.within_bush_steps +=1          ##Stores total number of across bush steps moved by caller
                 caller.within_bush_distance += np.sqrt((caller.x-temp_x)**2 + (caller.y-temp_y)**2) #Stores total across bush distance moved
                 continue
             #Decide whether or not to move across bushes based on your movement propensity
-            if rd.uniform (0,1) <=male_mov_prop_across_bush and len(caller.bush.adj_bushes):
-
-                bush_distr = [var[0] for var in caller.bush.adj_bushes]
-                distance_distr = [var[1] for var in caller.bush.adj_bushes]
-                bush_distr = np.array(bush_distr)
-                distance_distr = np.array(distance_distr)
+            if self.across_bushes and moves_across[i] <=self.params.male_mov_prop_across_bush and len(caller.bush.adj_bushes):
 
                 #Find potential bushes according to specified lognormal distribution
-                cut_off_distance = np.random.lognormal(male_dist_mean,male_dist_sd,size=1)
-                potential_bushes = bush_distr[distance_distr <= cut_off_distance]
+                #and pick one of the acceptable bushes at random
+                new_bush = caller.bush.choose_nearby_bush(cut_off[i],bush_choice[i])
 
-                if len(potential_bushes)>0:
-                    new_bush = rd.choice(potential_bushes)  #pick one of the acceptable bushes at random
-                    caller_index = caller.bush.find_cricket_index(caller)
-                    caller = caller.bush.callerlist.pop(caller_index)
+                if new_bush is not None:
+                    caller = caller.bush.remove_caller(caller)
                     
-                    #Move this caller to its new bush
-                    caller.bush = new_bush
-                    new_bush.callerlist.append(caller)
+                    #Move this caller to its new bush (this also moves his call to the amplitude of the new bush)
+                    new_bush.add_caller(caller)
                     temp_x = caller.x             #Temporary variable that hold value of x coordinate to calculate distance moved across bush
                     temp_y = caller.y              #Temporary variable that hold value of x coordinate to calculate distance moved across bush
-                    new_bush.assign_locations_in_bush(caller)
+                    new_bush.assign_locations_in_bush(caller,(ux[i],uy[i]))
+                    self.caller_grid.update(caller)
                     caller.across_bush_steps +=1          #Stores total number of across bush steps moved by caller
                     caller.across_bush_distance += np.sqrt((caller.x-temp_x)**2 + (caller.y-temp_y)**2) #Stores total across bush distance moved
                     continue
@@ -354,22 +411,32 @@ class Model:
         Once they begin mating, they are mating for some period and have a refractory period during
         which they cannot mate again.
         '''
+
+        #random values used in this timestep: females are visited in a random order, and the
+        #choice of each female is made with a uniform value (element i is used by female i)
+        order = self.streams.uniform('mating_order',time,self.N_rec)
+        mate_choice = self.streams.uniform('mate_choice',time,self.N_rec)
         
-        for receiver in self.receiverlist:
+        for receiver in sorted(self.receiverlist,key=lambda receiver: order[receiver.index]):
                 
                 if receiver.mating: #If reciever is already mating, skip it
                     continue
                 
-                #Find out which males are close to the focal female on the same bush
+                #Find out which males are close to the focal female
+                #only the callers in the grid cells around the female need to be checked
                 close_callers = []
-                for caller in self.callerlist:
+                for caller in self.caller_grid.neighbours(receiver.x,receiver.y):
                     if caller.dist(receiver) < self.mating_dist and not caller.mating:
                         close_callers.append(caller)
                         
                 if len(close_callers):
+
+                    #keep the males in order of their id
+                    close_callers.sort(key=lambda caller: caller.index)
                     
-                    lucky_caller = rd.choice(close_callers) #Choose one of the males within threshold distance
+                    lucky_caller = close_callers[pick(mate_choice[receiver.index],len(close_callers))] #Choose one of the males within threshold distance
                     lucky_caller.mating = True
+                    lucky_caller.update_bush_amp() #mating males don't contribute to the amplitude of the bush
                     receiver.mating = True
 
                     #keep track of which strategies the focal female is mating with
@@ -384,14 +451,20 @@ class Model:
         for caller in self.callerlist:
             if caller.mating:
                 caller.mating_timer += 1 #keep track of how long each individual has been mating for
-            if caller.mating_timer % mating_duration == 0: #if it is done mating, reset the timer
+            if caller.mating_timer % self.params.mating_duration == 0: #if it is done mating, reset the timer
                 caller.mating = False
                 caller.mating_timer = 0
+                caller.update_bush_amp()
         
+        #random values used to move the females that are done mating (element i is used by female i)
+        new_bushes = self.streams.integers('female_relocation_bush',time,self.N_rec,len(self.landscape.bushlist))
+        ux = self.streams.uniform('female_relocation_x',time,self.N_rec)
+        uy = self.streams.uniform('female_relocation_y',time,self.N_rec)
+
         for receiver in self.receiverlist:
             if receiver.mating:
                 receiver.mating_timer += 1
-                if receiver.mating_timer % mating_duration == 0:
+                if receiver.mating_timer % self.params.mating_duration == 0:
 
                     receiver.mating = False
                     receiver.mating_timer = 0
@@ -404,9 +477,9 @@ class Model:
                     receiver = receiver.bush.receiverlist.pop(receiver_index)
 
                     #add it to a new bush in the landscape
-                    self.landscape.assign_locations(receiver)                                  
+                    self.landscape.assign_locations(receiver,self.landscape.bushlist[new_bushes[receiver.index]],(ux[receiver.index],uy[receiver.index]))                                  
 
-    def decide_to_call(self):
+    def decide_to_call(self,time):
 
         '''
         this function lets each caller decide the times during which it will call in a given night
@@ -425,21 +498,28 @@ class Model:
 
         #Decide how many males (among the non-bafflers) are going to be callers
         #male_call_prop is from data
-        num_callers = int(round(len(non_bafflers)*male_call_prop))    
-        callers = np.random.choice(non_bafflers,num_callers,replace=False)
+        #(the callers are the non-bafflers with the smallest random keys)
+        num_callers = int(round(len(non_bafflers)*self.params.male_call_prop))    
+        keys = self.streams.uniform('male_caller_choice',time,self.N_sig)
+        callers = sorted(non_bafflers,key=lambda caller: keys[caller.index])[:num_callers]
+
+        #random values used to assign call times and velocities (row/element i is used by male i)
+        call_times = self.streams.integers('male_call_times',time,(self.N_sig,self.params.decision_dur),self.params.decision_dur)
+        velx = self.streams.integers('male_velocity_x',time,self.N_sig,len(self.male_vel_list))
+        vely = self.streams.integers('male_velocity_y',time,self.N_sig,len(self.male_vel_list))
         
         #Assign calling times to the bafflers
         for caller in bafflers:
-            effort = int(round(caller.call_effort*decision_dur))
-            caller.call_times = np.random.randint(0,decision_dur,effort)
+            effort = int(round(caller.call_effort*self.params.decision_dur))
+            caller.call_times = call_times[caller.index,:effort]
 
         #Assign calling times and velocities to the non-baffling callers 
         for caller in callers:
-            effort = int(round(caller.call_effort*decision_dur))
-            caller.call_times = np.random.randint(0,decision_dur,effort)
+            effort = int(round(caller.call_effort*self.params.decision_dur))
+            caller.call_times = call_times[caller.index,:effort]
                  
-            caller.velx = rd.choice(self.male_vel_list)
-            caller.vely = rd.choice(self.male_vel_list)
+            caller.velx = self.male_vel_list[velx[caller.index]]
+            caller.vely = self.male_vel_list[vely[caller.index]]
         
         #Remaining males are silent males and do not call at all
         for caller in self.callerlist:
@@ -447,30 +527,41 @@ class Model:
             #If a male wasn't selected in the previous two loops,
             #its call times would be an empty list
             if not len(caller.call_times): 
-                caller.velx = rd.choice(self.male_vel_list)
-                caller.vely = rd.choice(self.male_vel_list)
+                caller.velx = self.male_vel_list[velx[caller.index]]
+                caller.vely = self.male_vel_list[vely[caller.index]]
 
         del callers, bafflers, non_bafflers #to save memory
 
+        #Precompute the calling schedule of every male for the coming night
+        num_call_times = np.zeros(self.N_sig,dtype=np.int64)
+        for caller in self.callerlist:
+            num_call_times[caller.index] = len(caller.call_times)
+        call_times = np.full((self.N_sig,num_call_times.max(initial=0)),-1,dtype=np.int64)
+        for caller in self.callerlist:
+            call_times[caller.index,:len(caller.call_times)] = caller.call_times
+        self.call_schedule,self.call_checks = call_schedule(call_times,num_call_times,self.params.decision_dur)
+
     def call(self,time):
 
         '''
         this function implements actual calling based on the call times
-        determined in the previous function
+        determined in the previous function (stored in the calling schedule)
         '''
+
+        #which males call at this time, and how much their call_instances increase (as counted in the habitat, see class_habitat.py)
+        calls = self.call_schedule[:,time % self.params.decision_dur]
+        call_instances = self.landscape.habitat.call_instances(calls,self.call_checks[:,time % self.params.decision_dur])
         
         for caller in self.callerlist:
-            if len(caller.call_times) and not caller.mating: #If the male actually intends to call
-                for call_time in caller.call_times:
-                    if time % decision_dur == call_time: #If the time is right
-                        caller.calling = True #Start calling
-                        break
-                    else:
-                        caller.calling = False #Don't call
-                        caller.call_instances +=1      #keeps track of number of sessions a caller calls
+            if not caller.mating: #Males that don't intend to call have no call times, and never call
+                caller.calling = bool(calls[caller.index]) #Start calling if the time is right
+                caller.call_instances += int(call_instances[caller.index]) #keeps track of number of sessions a caller calls
             else:
                 caller.calling = False
 
+            #keep the amplitude of the bush up to date
+            caller.update_bush_amp()
+
     def run(self, timesteps,side,store_images=False,directory=''):
 
         '''
@@ -481,20 +572,19 @@ class Model:
         time = 0
         while time < timesteps:
 
-            #shuffle is to randomize the order of individuals each time
-            rd.shuffle(self.callerlist)
-            rd.shuffle(self.receiverlist)
+            #the order of individuals does not matter: every individual uses its own random values
+            #(see class_random_streams.py), and mate() visits the females in a random order
 
             #not relevant if we only run for a single night
-            if time%decision_dur == 0:
-                self.decide_to_call()
+            if time%self.params.decision_dur == 0:
+                self.decide_to_call(time)
             
             self.call(time) #calling
-            self.phonotaxis() #movement + phonotaxis
+            self.phonotaxis(time) #movement + phonotaxis
             self.mate(time) #mating
             
             #reset mating status each night
-            if time % night_dur == 0:
+            if time % self.params.night_dur == 0:
                 for receiver in self.receiverlist:
                     receiver.mated_count = 0 #Reset mate counts of receivers each night
             
@@ -511,322 +601,24 @@ class Model:
         '''
         get the average mating success per individual for each of the three strategies
         this will be the 'output' of our model, and we will use mating success as a 
-        proxy for fitness.
+        proxy for fitness. Returns a MateCounts record (see summary_statistics)
         '''
 
-        #initialize empty lists
-        baffle_matings = []
-        baffle_call_effort = []
-        baffle_within_bush_steps = []
-        baffle_within_bush_distance = []
-        baffle_across_bush_steps = []
-        baffle_across_bush_distance = []
-        baffle_total_steps = []
-        baffle_total_distance = []
-        
-        caller_matings = []
-        caller_call_effort = []
-        caller_within_bush_steps = []
-        caller_within_bush_distance = []
-        caller_across_bush_steps = []
-        caller_across_bush_distance = []
-        caller_total_steps = []
-        caller_total_distance = []
-        
-        silent_matings = []
-        silent_call_effort = []
-        silent_within_bush_steps = []
-        silent_within_bush_distance = []
-        silent_across_bush_steps = []
-        silent_across_bush_distance = []
-        silent_total_steps = []
-        silent_total_distance = []
-        
-        
-        rec_matings = []
-        rec_within_bush_steps = []
-        rec_within_bush_distance = []
-        rec_across_bush_steps = []
-        rec_across_bush_distance = []
-        rec_within_bush_phonotaxis_steps = []
-        rec_within_bush_phonotaxis_distance = []
-        rec_across_bush_phonotaxis_steps = []
-        rec_across_bush_phonotaxis_distance = []
-        rec_within_bush_total_steps = []
-        rec_within_bush_total_distance = []
-        rec_across_bush_total_steps = []
-        rec_across_bush_total_distance = []
-        rec_total_steps = []
-        rec_total_distance = []
-        
-        
-        mated_maletypes =[]
-
-        #count number of mates obtained by each strategy
-        for caller in self.callerlist:
-            if caller.baffler:
-                baffle_matings.append(caller.mated_count)
-                baffle_call_effort.append(caller.call_instances)
-                baffle_within_bush_steps.append(caller.within_bush_steps)
-                baffle_within_bush_distance.append(caller.within_bush_distance)
-                baffle_across_bush_steps.append(caller.across_bush_steps)
-                baffle_across_bush_distance.append(caller.across_bush_distance)
-                baffle_total_steps.append(caller.within_bush_steps + caller.across_bush_steps)
-                baffle_total_distance.append(caller.within_bush_distance + caller.across_bush_distance)
-                
-            else:
-                if len(caller.call_times) != 0:
-                    caller_matings.append(caller.mated_count)
-                    caller_call_effort.append(caller.call_instances)
-                    caller_within_bush_steps.append(caller.within_bush_steps)
-                    caller_within_bush_distance.append(caller.within_bush_distance)
-                    caller_across_bush_steps.append(caller.across_bush_steps)
-                    caller_across_bush_distance.append(caller.across_bush_distance)
-                    caller_total_steps.append(caller.within_bush_steps + caller.across_bush_steps)
-                    caller_total_distance.append(caller.within_bush_distance + caller.across_bush_distance)
-                else:
-                    silent_matings.append(caller.mated_count)
-                    silent_call_effort.append(caller.call_instances)
-                    silent_within_bush_steps.append(caller.within_bush_steps)
-                    silent_within_bush_distance.append(caller.within_bush_distance)
-                    silent_across_bush_steps.append(caller.across_bush_steps)
-                    silent_across_bush_distance.append(caller.across_bush_distance)
-                    silent_total_steps.append(caller.within_bush_steps + caller.across_bush_steps)
-                    silent_total_distance.append(caller.within_bush_distance + caller.across_bush_distance)
-           
-
-        #track how many times each female mated and which strategies each female mated with
-        for receiver in self.receiverlist:
-            rec_matings.append(receiver.mated_count)
-            rec_within_bush_steps.append(receiver.within_bush_steps)
-            rec_within_bush_distance.append(receiver.within_bush_distance)
-            rec_within_bush_phonotaxis_steps.append(receiver.within_bush_phonotaxis_steps)
-            rec_within_bush_phonotaxis_distance.append(receiver.within_bush_phonotaxis_distance)
-            rec_within_bush_total_steps.append(receiver.within_bush_steps + receiver.within_bush_phonotaxis_steps)
-            rec_within_bush_total_distance.append(receiver.within_bush_distance + receiver.within_bush_phonotaxis_distance)
-            rec_across_bush_steps.append(receiver.across_bush_steps)
-            rec_across_bush_distance.append(receiver.across_bush_distance)
-            rec_across_bush_phonotaxis_steps.append(receiver.across_bush_phonotaxis_steps)
-            rec_across_bush_phonotaxis_distance.append(receiver.across_bush_phonotaxis_distance)
-            rec_across_bush_total_steps.append(receiver.across_bush_steps + receiver.across_bush_phonotaxis_steps)
-            rec_across_bush_total_distance.append(receiver.across_bush_distance + receiver.across_bush_phonotaxis_distance)
-            rec_total_steps.append(receiver.within_bush_steps + receiver.within_bush_phonotaxis_steps + receiver.across_bush_steps + receiver.across_bush_phonotaxis_steps)
-            rec_total_distance.append(receiver.within_bush_distance + receiver.within_bush_phonotaxis_distance + receiver.across_bush_distance + receiver.across_bush_phonotaxis_distance)
-            
-            
-            if len(receiver.mated_male_type)>0:
-                mated_maletypes.append(receiver.mated_male_type)
-        
-        #convert lists to arrays
-        total_male_matings = np.array(baffle_matings+caller_matings+silent_matings) #adding lists concatenates them
-        
-        baffle_matings = np.array(baffle_matings)
-        baffle_call_effort = np.array(baffle_call_effort)
-        baffle_within_bush_steps = np.array(baffle_within_bush_steps)
-        baffle_within_bush_distance = np.array(baffle_within_bush_distance)
-        baffle_across_bush_steps = np.array(baffle_across_bush_steps)
-        baffle_across_bush_distance = np.array(baffle_across_bush_distance)
-        baffle_total_steps = np.array(baffle_total_steps)
-        baffle_total_distance = np.array(baffle_total_distance)
-        
-        caller_matings = np.array(caller_matings)
-        caller_call_effort = np.array(caller_call_effort)
-        caller_within_bush_steps = np.array(caller_within_bush_steps)
-        caller_within_bush_distance = np.array(caller_within_bush_distance)
-        caller_across_bush_steps = np.array(caller_across_bush_steps)
-        caller_across_bush_distance = np.array(caller_across_bush_distance)
-        caller_total_steps = np.array(caller_total_steps)
-        caller_total_distance = np.array(caller_total_distance)
-        
-        silent_matings = np.array(silent_matings)
-        silent_call_effort = np.array(silent_call_effort)
-        silent_within_bush_steps = np.array(silent_within_bush_steps)
-        silent_within_bush_distance = np.array(silent_within_bush_distance)
-        silent_across_bush_steps = np.array(silent_across_bush_steps)
-        silent_across_bush_distance = np.array(silent_across_bush_distance)
-        silent_total_steps = np.array(silent_total_steps)
-        silent_total_distance = np.array(silent_total_distance)
-        
-        
-        rec_matings = np.array(rec_matings)
-        rec_within_bush_steps = np.array(rec_within_bush_steps)
-        rec_within_bush_distance = np.array(rec_within_bush_distance)
-        rec_across_bush_steps = np.array(rec_across_bush_steps)
-        rec_across_bush_distance = np.array(rec_across_bush_distance)
-        rec_within_bush_phonotaxis_steps = np.array(rec_within_bush_phonotaxis_steps)
-        rec_within_bush_phonotaxis_distance = np.array(rec_within_bush_phonotaxis_distance)
-        rec_across_bush_phonotaxis_steps = np.array(rec_across_bush_phonotaxis_steps)
-        rec_across_bush_phonotaxis_distance = np.array(rec_across_bush_phonotaxis_distance)
-        rec_within_bush_total_steps = np.array(rec_within_bush_total_steps)
-        rec_within_bush_total_distance = np.array(rec_within_bush_total_distance)
-        rec_across_bush_total_steps = np.array(rec_across_bush_total_steps)
-        rec_across_bush_total_distance = np.array(rec_across_bush_total_distance)
-        rec_total_steps = np.array(rec_total_steps)
-        rec_total_distance = np.array(rec_total_distance)
-        
-        
-
-        #mean mating success
-        mean_list = [np.mean(baffle_matings),np.mean(caller_matings),np.mean(silent_matings),
-                             np.mean(total_male_matings),np.mean(rec_matings),
-                             
-                             np.mean(baffle_call_effort),np.mean(baffle_within_bush_steps),
-                             np.mean(baffle_within_bush_distance),np.mean(baffle_across_bush_steps),np.mean(baffle_across_bush_distance),
-                             np.mean(baffle_total_steps),np.mean(baffle_total_distance),
-                             
-                             np.mean(caller_call_effort),np.mean(caller_within_bush_steps),
-                             np.mean(caller_within_bush_distance),np.mean(caller_across_bush_steps),np.mean(caller_across_bush_distance),
-                             np.mean(caller_total_steps),np.mean(caller_total_distance),
-                             
-                             np.mean(silent_call_effort),np.mean(silent_within_bush_steps),
-                             np.mean(silent_within_bush_distance),np.mean(silent_across_bush_steps),np.mean(silent_across_bush_distance),
-                             np.mean(silent_total_steps),np.mean(silent_total_distance),
-                             
-                             np.mean(rec_within_bush_steps),np.mean(rec_within_bush_distance),np.mean(rec_across_bush_steps),np.mean(rec_across_bush_distance),
-                             np.mean(rec_within_bush_phonotaxis_steps),np.mean(rec_within_bush_phonotaxis_distance),np.mean(rec_across_bush_phonotaxis_steps),
-                             np.mean(rec_across_bush_phonotaxis_distance),np.mean(rec_within_bush_total_steps),np.mean(rec_within_bush_total_distance),
-                             np.mean(rec_across_bush_total_steps),np.mean(rec_across_bush_total_distance),
-                             np.mean(rec_total_steps),np.mean(rec_total_distance)]
-
-        #sd mating success
-        sd_list = [np.std(baffle_matings),np.std(caller_matings),np.std(silent_matings),
-                             np.std(total_male_matings),np.std(rec_matings),
-                             
-                             np.std(baffle_call_effort),np.std(baffle_within_bush_steps),
-                             np.std(baffle_within_bush_distance),np.std(baffle_across_bush_steps),np.std(baffle_across_bush_distance),
-                             np.std(baffle_total_steps),np.std(baffle_total_distance),
-                             
-                             np.std(caller_call_effort),np.std(caller_within_bush_steps),
-                             np.std(caller_within_bush_distance),np.std(caller_across_bush_steps),np.std(caller_across_bush_distance),
-                             np.std(caller_total_steps),np.std(caller_total_distance),
-                             
-                             np.std(silent_call_effort),np.std(silent_within_bush_steps),
-                             np.std(silent_within_bush_distance),np.std(silent_across_bush_steps),np.std(silent_across_bush_distance),
-                             np.std(silent_total_steps),np.std(silent_total_distance),
-                             
-                             np.std(rec_within_bush_steps),np.std(rec_within_bush_distance),np.std(rec_across_bush_steps),np.std(rec_across_bush_distance),
-                             np.std(rec_within_bush_phonotaxis_steps),np.std(rec_within_bush_phonotaxis_distance),np.std(rec_across_bush_phonotaxis_steps),
-                             np.std(rec_across_bush_phonotaxis_distance),np.std(rec_within_bush_total_steps),np.std(rec_within_bush_total_distance),
-                             np.std(rec_across_bush_total_steps),np.std(rec_across_bush_total_distance),
-                             np.std(rec_total_steps),np.std(rec_total_distance)]
-
-        #kurtosis of mating success
-        kurt_list = [kurtosis(baffle_matings),kurtosis(caller_matings),kurtosis(silent_matings),
-                    kurtosis(total_male_matings), kurtosis(rec_matings),
-                    
-                    kurtosis(baffle_call_effort),kurtosis(baffle_within_bush_steps),
-                    kurtosis(baffle_within_bush_distance),kurtosis(baffle_across_bush_steps),kurtosis(baffle_across_bush_distance),
-                    kurtosis(baffle_total_steps),kurtosis(baffle_total_distance),
-                    
-                    kurtosis(caller_call_effort),kurtosis(caller_within_bush_steps),
-                    kurtosis(caller_within_bush_distance),kurtosis(caller_across_bush_steps),kurtosis(caller_across_bush_distance),
-                    kurtosis(caller_total_steps),kurtosis(caller_total_distance),
-                    
-                    kurtosis(silent_call_effort),kurtosis(silent_within_bush_steps),
-                    kurtosis(silent_within_bush_distance),kurtosis(silent_across_bush_steps),kurtosis(silent_across_bush_distance),
-                    kurtosis(silent_total_steps),kurtosis(silent_total_distance),
-                    
-                    kurtosis(rec_within_bush_steps),kurtosis(rec_within_bush_distance),kurtosis(rec_across_bush_steps),kurtosis(rec_across_bush_distance),
-                    kurtosis(rec_within_bush_phonotaxis_steps),kurtosis(rec_within_bush_phonotaxis_distance),kurtosis(rec_across_bush_phonotaxis_steps),
-                    kurtosis(rec_across_bush_phonotaxis_distance),kurtosis(rec_within_bush_total_steps),kurtosis(rec_within_bush_total_distance),
-                    kurtosis(rec_across_bush_total_steps),kurtosis(rec_across_bush_total_distance),
-                    kurtosis(rec_total_steps),kurtosis(rec_total_distance)]
-        #skew of mating success
-        skew_list = [skew(baffle_matings),skew(caller_matings),skew(silent_matings),
-                     skew(total_male_matings), skew(rec_matings),
-                     
-                     skew(baffle_call_effort),skew(baffle_within_bush_steps),
-                     skew(baffle_within_bush_distance),skew(baffle_across_bush_steps),skew(baffle_across_bush_distance),
-                     skew(baffle_total_steps),skew(baffle_total_distance),
-                     
-                     skew(caller_call_effort),skew(caller_within_bush_steps),
-                     skew(caller_within_bush_distance),skew(caller_across_bush_steps),skew(caller_across_bush_distance),
-                     skew(caller_total_steps),skew(caller_total_distance),
-                     
-                     skew(silent_call_effort),skew(silent_within_bush_steps),
-                     skew(silent_within_bush_distance),skew(silent_across_bush_steps),skew(silent_across_bush_distance),
-                     skew(silent_total_steps),skew(silent_total_distance),
-                     
-                     skew(rec_within_bush_steps),skew(rec_within_bush_distance),skew(rec_across_bush_steps),skew(rec_across_bush_distance),
-                     skew(rec_within_bush_phonotaxis_steps),skew(rec_within_bush_phonotaxis_distance),skew(rec_across_bush_phonotaxis_steps),
-                     skew(rec_across_bush_phonotaxis_distance),skew(rec_within_bush_total_steps),skew(rec_within_bush_total_distance),
-                     skew(rec_across_bush_total_steps),skew(rec_across_bush_total_distance),
-                     skew(rec_total_steps),skew(rec_total_distance)]
-
-        #min
-        min_list = [np.min(baffle_matings),np.min(caller_matings),np.min(silent_matings),
-                   np.min(total_male_matings), np.min(rec_matings),
-                   
-                   np.min(baffle_call_effort),np.min(baffle_within_bush_steps),
-                   np.min(baffle_within_bush_distance),np.min(baffle_across_bush_steps),np.min(baffle_across_bush_distance),
-                   np.min(baffle_total_steps),np.min(baffle_total_distance),
-                   
-                   np.min(caller_call_effort),np.min(caller_within_bush_steps),
-                   np.min(caller_within_bush_distance),np.min(caller_across_bush_steps),np.min(caller_across_bush_distance),
-                   np.min(caller_total_steps),np.min(caller_total_distance),
-                   
-                   np.min(silent_call_effort),np.min(silent_within_bush_steps),
-                   np.min(silent_within_bush_distance),np.min(silent_across_bush_steps),np.min(silent_across_bush_distance),
-                   np.min(silent_total_steps),np.min(silent_total_distance),
-                   
-                   np.min(rec_within_bush_steps),np.min(rec_within_bush_distance),np.min(rec_across_bush_steps),np.min(rec_across_bush_distance),
-                   np.min(rec_within_bush_phonotaxis_steps),np.min(rec_within_bush_phonotaxis_distance),np.min(rec_across_bush_phonotaxis_steps),
-                   np.min(rec_across_bush_phonotaxis_distance),np.min(rec_within_bush_total_steps),np.min(rec_within_bush_total_distance),
-                   np.min(rec_across_bush_total_steps),np.min(rec_across_bush_total_distance),
-                   np.min(rec_total_steps),np.min(rec_total_distance)]
-
-        #max
-        max_list = [np.max(baffle_matings),np.max(caller_matings),np.max(silent_matings),
-                   np.max(total_male_matings), np.max(rec_matings),
-                   
-                   np.max(baffle_call_effort),np.max(baffle_within_bush_steps),
-                   np.max(baffle_within_bush_distance),np.max(baffle_across_bush_steps),np.max(baffle_across_bush_distance),
-                   np.max(baffle_total_steps),np.max(baffle_total_distance),
-                   
-                   np.max(caller_call_effort),np.max(caller_within_bush_steps),
-                   np.max(caller_within_bush_distance),np.max(caller_across_bush_steps),np.max(caller_across_bush_distance),
-                   np.max(caller_total_steps),np.max(caller_total_distance),
-                   
-                   np.max(silent_call_effort),np.max(silent_within_bush_steps),
-                   np.max(silent_within_bush_distance),np.max(silent_across_bush_steps),np.max(silent_across_bush_distance),
-                   np.max(silent_total_steps),np.max(silent_total_distance),
-                   
-                   np.max(rec_within_bush_steps),np.max(rec_within_bush_distance),np.max(rec_across_bush_steps),np.max(rec_across_bush_distance),
-                   np.max(rec_within_bush_phonotaxis_steps),np.max(rec_within_bush_phonotaxis_distance),np.max(rec_across_bush_phonotaxis_steps),
-                   np.max(rec_across_bush_phonotaxis_distance),np.max(rec_within_bush_total_steps),np.max(rec_within_bush_total_distance),
-                   np.max(rec_across_bush_total_steps),np.max(rec_across_bush_total_distance),
-                   np.max(rec_total_steps),np.max(rec_total_distance)]
-
-        #median
-        median_list = [np.median(baffle_matings),np.median(caller_matings),np.median(silent_matings),
-                   np.median(total_male_matings), np.median(rec_matings),
-                   
-                   np.median(baffle_call_effort),np.median(baffle_within_bush_steps),
-                   np.median(baffle_within_bush_distance),np.median(baffle_across_bush_steps),np.median(baffle_across_bush_distance),
-                   np.median(baffle_total_steps),np.median(baffle_total_distance),
-                   
-                   np.median(caller_call_effort),np.median(caller_within_bush_steps),
-                   np.median(caller_within_bush_distance),np.median(caller_across_bush_steps),np.median(caller_across_bush_distance),
-                   np.median(caller_total_steps),np.median(caller_total_distance),
-                   
-                   np.median(silent_call_effort),np.median(silent_within_bush_steps),
-                   np.median(silent_within_bush_distance),np.median(silent_across_bush_steps),np.median(silent_across_bush_distance),
-                   np.median(silent_total_steps),np.median(silent_total_distance),
-                   
-                   np.median(rec_within_bush_steps),np.median(rec_within_bush_distance),np.median(rec_across_bush_steps),np.median(rec_across_bush_distance),
-                   np.median(rec_within_bush_phonotaxis_steps),np.median(rec_within_bush_phonotaxis_distance),np.median(rec_across_bush_phonotaxis_steps),
-                   np.median(rec_across_bush_phonotaxis_distance),np.median(rec_within_bush_total_steps),np.median(rec_within_bush_total_distance),
-                   np.median(rec_across_bush_total_steps),np.median(rec_across_bush_total_distance),
-                   np.median(rec_total_steps),np.median(rec_total_distance)]
-                   
-         #proportion of inds who obtained mates
-        mated_prop_list = [len(baffle_matings[baffle_matings>0])/len(baffle_matings),len(caller_matings[caller_matings>0])/len(caller_matings),
-        len(silent_matings[silent_matings>0])/len(silent_matings),len(total_male_matings[total_male_matings>0])/len(total_male_matings),len(rec_matings[rec_matings>0])/len(rec_matings)]          
-        
-
-        #return a named dict of values
-        #NOTE: mated_maletypes is not being returned here
-        return {'mean':mean_list,'sd':sd_list,'kurt':kurt_list,'skew':skew_list,'min':min_list,'max':max_list,'median':median_list,'proportion_mated':mated_prop_list}
+        #metrics of every male, and the strategy of every male
+        male_metrics = np.array([[caller.mated_count,caller.call_instances,caller.within_bush_steps,caller.within_bush_distance,
+                                  caller.across_bush_steps,caller.across_bush_distance] for caller in self.callerlist],dtype=float)
+        tactic = np.array([BAFFLER if caller.baffler else (CALLER if len(caller.call_times) != 0 else SILENT)
+                           for caller in self.callerlist],dtype=np.int64)
+
+        #metrics of every female
+        female_metrics = np.array([[receiver.mated_count,receiver.within_bush_steps,receiver.within_bush_distance,
+                                    receiver.across_bush_steps,receiver.across_bush_distance,
+                                    receiver.within_bush_phonotaxis_steps,receiver.within_bush_phonotaxis_distance,
+                                    receiver.across_bush_phonotaxis_steps,receiver.across_bush_phonotaxis_distance]
+                                   for receiver in self.receiverlist],dtype=float)
+
+        #NOTE: the strategies of the males that each female mated with are not being returned here
+        return mate_counts(male_metrics,tactic,female_metrics)
     
     
     def visualize(self,time,save=False,filename='plot.png'):
@@ -916,9 +708,10 @@ class Model:
         for circle in caller_circles:
             ax.add_patch(circle)
 
-        #plot the bushes
-        for rect in bush_rects:
-            ax.add_patch(rect)
+        #plot the bushes (the single bush of the homogeneous habitat is the whole landscape, and is not shown)
+        if self.across_bushes:
+            for rect in bush_rects:
+                ax.add_patch(rect)
 
 
         #Uncomment below lines if you want a regular grid to be part of the visualization
@@ -936,7 +729,7 @@ class Model:
 
         #Add a time counter for how many timesteps have passed
         plt.text(1.2, 0.05, 't = ' + str(time) , fontsize=18, transform=plt.gca().transAxes)
-        plt.text(1.2, 0, 'one night = ' + str(night_dur) , fontsize=18, transform=plt.gca().transAxes)
+        plt.text(1.2, 0, 'one night = ' + str(self.params.night_dur) , fontsize=18, transform=plt.gca().transAxes)
 
         #Add a legend
         legend = ax.legend(bbox_to_anchor=(1.7,1))
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 21:47:36
+Date last modified: 2026-10-18 21:47:36
+Purpose: This script defines the Params class, which holds the values of all the static parameters
+(see static_params.py) used by a run of the model.
+
+Broad idea:
+The model used to read the static parameters as module-level variables, so a run with other values
+(e.g. a lower within-bush movement propensity, as in the supplementary figures) needed the modules to
+be changed. Instead, every Landscape, Model, ArrayModel, Signaller and Receiver is now given a Params
+object and reads the parameters from it. A Params object cannot be changed once it is made: a run with
+other values gets a new Params object (see Params.with_overrides), so runs with different values can
+share a process, e.g. the worker processes of a sweep. The default value of every parameter is its
+value in static_params.py, which stays the place where the values of the parameters (and their sources)
+are written down.
+'''
+
+import static_params
+from typing import NamedTuple
+
+class Params(NamedTuple):
+
+    '''
+    The static parameters of a run (see static_params.py for what they mean and where their values come from)
+    '''
+
+    #Amplitude parameters
+    SPL: float = static_params.SPL
+    SPL_sd: float = static_params.SPL_sd
+
+    #Baffling related parameters
+    baffle_advantage_mean: float = static_params.baffle_advantage_mean
+    baffle_advantage_SD: float = static_params.baffle_advantage_SD
+
+    #Phonotaxis related parameters
+    threshold_SPL: float = static_params.threshold_SPL
+    min_SPL_for_movement: float = static_params.min_SPL_for_movement
+    threshold_SPL_diff: float = static_params.threshold_SPL_diff
+
+    #Timescales (in timesteps)
+    night_dur: int = static_params.night_dur
+    decision_dur: int = static_params.decision_dur
+    mating_duration: int = static_params.mating_duration
+
+    #Movement-related parameters
+    fem_vel_mean: float = static_params.fem_vel_mean
+    fem_vel_sd: float = static_params.fem_vel_sd
+    male_vel_mean: float = static_params.male_vel_mean
+    male_vel_sd: float = static_params.male_vel_sd
+    fem_dist_mean: float = static_params.fem_dist_mean
+    fem_dist_sd: float = static_params.fem_dist_sd
+    male_dist_mean: float = static_params.male_dist_mean
+    male_dist_sd: float = static_params.male_dist_sd
+    mating_dist: float = static_params.mating_dist
+
+    #Movement propensities
+    fem_mov_prop_across_bush: float = static_params.fem_mov_prop_across_bush
+    male_mov_prop_across_bush: float = static_params.male_mov_prop_across_bush
+    mated_phonotaxis_prop: float = static_params.mated_phonotaxis_prop
+    fem_mov_prop_within_bush: float = static_params.fem_mov_prop_within_bush
+    male_mov_prop_within_bush: float = static_params.male_mov_prop_within_bush
+
+    #Call effort related parameters
+    male_call_prop: float = static_params.male_call_prop
+    effort_mean: float = static_params.effort_mean
+    effort_sd: float = static_params.effort_sd
+
+    #Spatial organization (bush-related) parameters
+    threshold_bush_dist: float = static_params.threshold_bush_dist
+    bush_size_mean: float = static_params.bush_size_mean
+    bush_size_sd: float = static_params.bush_size_sd
+    bush_dens: float = static_params.bush_dens
+
+    def with_overrides(self,overrides):
+
+        '''
+        A copy of these parameters in which the parameters in overrides (a dict {name:value}) have
+        the given values. Parameters measured in timesteps must be whole numbers. As in static_params.py,
+        decision_dur follows night_dur if it is not given (and was equal to night_dur). Raises a
+        ValueError for names that are not parameters
+        '''
+
+        check_overrides(overrides)
+
+        values = {}
+        for name,value in overrides.items():
+            if Params.__annotations__[name] is int:
+                if float(value) != int(float(value)):
+                    raise ValueError(name+" must be a whole number, not "+str(value))
+                values[name] = int(float(value))
+            else:
+                values[name] = float(value)
+
+        if 'night_dur' in values and 'decision_dur' not in values and self.decision_dur == self.night_dur:
+            values['decision_dur'] = values['night_dur']
+
+        return self._replace(**values)
+
+#the values in static_params.py
+DEFAULT_PARAMS = Params()
+
+def param_names():
+
+    '''
+    Names of all the static parameters (the fields of Params)
+    '''
+
+    return list(Params._fields)
+
+def check_overrides(overrides):
+
+    '''
+    Raise a ValueError if overrides (a dict {name:value}) contains anything other than static parameters
+    '''
+
+    unknown = set(overrides) - set(param_names())
+    if unknown:
+        raise ValueError("Unknown static parameters: "+", ".join(sorted(unknown)))
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 16:12:40
+Date last modified: 2026-10-18 16:12:40
+Purpose: This script defines the RandomStreams class, which provides all the random
+numbers used by the Model and ArrayModel classes.
+
+Broad idea:
+If random numbers are drawn one after the other from a single generator, every draw
+depends on how many draws were made before it, i.e. on the order in which individuals
+are visited. Two implementations of the same model (or the same model split differently
+across cores) then produce different runs even when they are seeded identically.
+Here, every random decision is instead identified by a (kind, timestep) pair, e.g.
+('female_within_bush',12). Each such pair has its own stream, produced by a counter-based
+generator (Philox) whose key is made of the run seed, the kind and the timestep, and the
+stream always holds one value per individual. Individual i always uses element i of the
+stream, however many other individuals there are and in whichever order they are visited.
+'''
+
+import zlib
+import numpy as np
+
+#timestep used for the random decisions made while setting up a model (before the first timestep)
+SETUP = -1
+
+class RandomStreams:
+
+    def __init__(self,seed):
+
+        '''
+        seed is the seed of the run (a non-negative integer smaller than 2**64)
+        '''
+
+        self.seed = int(seed)
+
+        #streams of the current timestep, stored as {(distribution,kind,time,shape,params):values}.
+        #This is cleared whenever a new timestep starts, and lets the Model class (which makes its
+        #decisions one individual at a time) reuse the values instead of generating them again
+        self.cache = {}
+        self.cache_time = None
+
+    def generator(self,kind,time):
+
+        '''
+        Returns a numpy Generator for the stream of a given kind of decision at a given timestep.
+        The Philox key contains the run seed (upper 64 bits), a checksum of the kind (next 32 bits)
+        and the timestep (lowest 32 bits), so every (seed,kind,time) has its own independent stream
+        '''
+
+        key = (self.seed << 64) | (zlib.crc32(kind.encode()) << 32) | (int(time) & 0xffffffff)
+        return np.random.Generator(np.random.Philox(key=key))
+
+    def draw(self,distribution,kind,time,shape,*params):
+
+        '''
+        Returns the values of a stream (see generator) drawn from the given distribution
+        (the name of a method of numpy Generators, e.g. 'random' or 'normal'), with the given
+        shape and parameters. Repeated calls with the same arguments return the same array
+        '''
+
+        if time != self.cache_time:
+            self.cache = {}
+            self.cache_time = time
+
+        key = (distribution,kind,time,shape,params)
+        if key not in self.cache:
+            rng = self.generator(kind,time)
+            self.cache[key] = getattr(rng,distribution)(*params,size=shape)
+
+        return self.cache[key]
+
+    def uniform(self,kind,time,shape):
+
+        '''
+        Uniformly distributed values in [0,1)
+        '''
+
+        return self.draw('random',kind,time,shape)
+
+    def normal(self,kind,time,shape,loc,scale):
+
+        '''
+        Normally distributed values with mean loc and standard deviation scale
+        '''
+
+        return self.draw('normal',kind,time,shape,loc,scale)
+
+    def lognormal(self,kind,time,shape,mean,sd):
+
+        '''
+        Lognormally distributed values (mean and sd are the mean and standard deviation
+        of the underlying normal distribution, as in np.random.lognormal)
+        '''
+
+        return self.draw('lognormal',kind,time,shape,mean,sd)
+
+    def integers(self,kind,time,shape,high):
+
+        '''
+        Random integers in [0,high), computed from uniform values as floor(u*high) so that
+        the same value can be obtained from the corresponding uniform value (see pick)
+        '''
+
+        return pick(self.uniform(kind,time,shape),high)
+
+
+def pick(u,num):
+
+    '''
+    Use a uniform value u in [0,1) to pick one of num options at random (returns the
+    position of the chosen option). Works for numbers as well as for arrays.
+    (the minimum guards against u*num being rounded up to num)
+    '''
+
+    if isinstance(u,np.ndarray):
+        return np.minimum((u*num).astype(np.int64),np.maximum(np.asarray(num)-1,0))
+
+    return min(int(u*num),max(num-1,0))
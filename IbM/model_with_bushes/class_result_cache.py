@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 21:24:08
+Date last modified: 2026-10-18 21:24:08
+Purpose: This script defines the ResultCache class, which keeps the output of every run of the
+model (every task, see run_task in set_up_parallelization.py) so that a run that has already
+been made is loaded instead of being made again, e.g. when a sweep is run again after adding
+points to its grid or changing one of its parameters.
+
+Broad idea:
+A run is fully determined by its parameters, the values of all the static parameters, its seeds and
+the code of the model. The cache is content addressed: every run is saved in a file whose name is a
+hash (the key) of all of these, so a run is in the cache exactly when a run with the same key has been
+made before. The code of the model is hashed from the source of the modules that a run executes (see
+MODEL_MODULES), so any change to them gives new keys, and runs made with older code are never used (they
+can be removed by deleting the cache). Changes to the other modules (e.g. adding a scenario or a figure
+dataset, or changing how a sweep is scheduled) do not change what a run produces, so they keep the cache.
+'''
+
+import os
+import json
+import hashlib
+import tempfile
+import numpy as np
+import static_params
+from class_params import DEFAULT_PARAMS
+
+#the modules that are executed by a run (run_task in set_up_parallelization.py, and the models it runs).
+#A module that is imported by any of these and changes what a run produces must be added here
+MODEL_MODULES = ['class_model','class_array_model','class_bush','class_landscape','class_habitat',
+                 'class_male_and_female','class_grid','class_random_streams','sampling','summary_statistics',
+                 'class_params','static_params','set_up_parallelization']
+
+_model_version = None
+
+def model_version():
+
+    '''
+    Hash of the source of the modules in MODEL_MODULES (see the description of this script)
+    '''
+
+    global _model_version
+    if _model_version is None:
+        model_dir = os.path.dirname(os.path.abspath(static_params.__file__))
+        digest = hashlib.sha256()
+        for module in sorted(MODEL_MODULES):
+            with open(os.path.join(model_dir,module+'.py'),'rb') as source:
+                digest.update(module.encode() + b'.py\0' + source.read() + b'\0')
+        _model_version = digest.hexdigest()
+
+    return _model_version
+
+def task_key(task):
+
+    '''
+    The key of a task (see run_task): a hash of its parameters, of the value of every static parameter
+    (with the overrides of the task applied), of its seeds and of the version of the model
+    '''
+
+    values,N,engine,landscape_seed,run_seed,overrides = task
+    params = {name:float(value) for name,value in DEFAULT_PARAMS.with_overrides(overrides)._asdict().items()}
+    text = json.dumps({'values':[float(value) for value in values],'N':int(N),'engine':str(engine),
+                       'landscape_seed':int(landscape_seed),'run_seed':int(run_seed),
+                       'static_params':params,'model_version':model_version()},sort_keys=True)
+
+    return hashlib.sha256(text.encode()).hexdigest()
+
+class ResultCache:
+
+    def __init__(self,path):
+
+        '''
+        path is the directory in which the runs are kept (it is created when the first run is saved)
+        '''
+
+        self.path = path
+
+    def entry_path(self,key):
+
+        '''
+        The file in which the run with the given key is kept (in one of 256 subdirectories, so that
+        no directory gets too many files)
+        '''
+
+        return os.path.join(self.path,key[:2],key[2:]+'.npz')
+
+    def get(self,task):
+
+        '''
+        Returns (row of the output,run time in seconds) of a task if it is in the cache, and None otherwise
+        '''
+
+        path = self.entry_path(task_key(task))
+        if not os.path.exists(path):
+            return None
+
+        with np.load(path) as entry:
+            return entry['row'],float(entry['run_time'])
+
+    def put(self,task,row,run_time):
+
+        '''
+        Save the row of the output of a task and its run time (in seconds). The file is written under a
+        temporary name and then renamed, so an interrupted write never leaves a broken entry behind
+        '''
+
+        path = self.entry_path(task_key(task))
+        os.makedirs(os.path.dirname(path),exist_ok=True)
+
+        descriptor,temp_path = tempfile.mkstemp(dir=os.path.dirname(path),suffix='.tmp')
+        with os.fdopen(descriptor,'wb') as entry:
+            np.savez(entry,row=np.asarray(row,dtype=float),run_time=run_time)
+        os.replace(temp_path,path)
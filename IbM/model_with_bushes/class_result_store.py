@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 20:14:33
+Date last modified: 2026-10-18 20:14:33
+Purpose: This script defines the ResultStore class, a single compressed store to which the
+results of all the runs of the model are appended, and from which subsets of the results
+(e.g. the runs needed for one figure) can be read without parsing everything.
+
+Broad idea:
+Every run is a row of a table, with typed columns (the parameters, the output of the run,
+the seeds, the engine, the run time and the version of the code). The table is stored as a
+Parquet dataset (a directory) partitioned by bush density and population density, i.e. the
+rows of every (bush_dens,density) pair are in their own directory, compressed column by column.
+A read with filters (e.g. bush_dens == 1.625 and baffle_prop <= 0.5) then only opens the
+partitions that can match, and only the row groups of the files in them that can match.
+Parquet needs pyarrow. If pyarrow is not installed, the table is stored in a compressed HDF5
+file (which needs PyTables) instead, in which the parameter columns are indexed so that filtered
+reads are done by PyTables. If neither is installed, a plain .csv file is used.
+'''
+
+import os
+import json
+import uuid
+import hashlib
+import subprocess
+import importlib
+import numpy as np
+import pandas as pd
+
+#columns by which the Parquet dataset is partitioned
+PARTITION_COLUMNS = ['bush_dens','density']
+
+#columns of an HDF5 store that are indexed, so that filtered reads on them are done by PyTables
+HDF5_DATA_COLUMNS = ['point','run','bush_dens','density','baffle_prop','prop_males']
+
+#comparison operators that can be used in filters
+OPERATORS = ['==','!=','<','<=','>','>=','in']
+
+_code_version = None
+
+def code_version():
+
+    '''
+    The version of the code that produced the results: the git commit of this directory
+    (with '-dirty' if there are uncommitted changes), or 'unknown' outside of a git repository
+    '''
+
+    global _code_version
+    if _code_version is None:
+        directory = os.path.dirname(os.path.abspath(__file__))
+        try:
+            commit = subprocess.run(['git','rev-parse','--short','HEAD'],cwd=directory,capture_output=True,text=True,check=True).stdout.strip()
+            changes = subprocess.run(['git','status','--porcelain','--untracked-files=no','.'],cwd=directory,capture_output=True,text=True,check=True).stdout.strip()
+            _code_version = commit + ('-dirty' if changes else '')
+        except (OSError,subprocess.CalledProcessError):
+            _code_version = 'unknown'
+
+    return _code_version
+
+def point_key(point):
+
+    '''
+    A short key that identifies a point, i.e. a dict {parameter:value} (the same values always give the same key)
+    '''
+
+    text = json.dumps({name:float(value) for name,value in point.items()},sort_keys=True)
+
+    return hashlib.sha1(text.encode()).hexdigest()[:16]
+
+def default_backend(path):
+
+    '''
+    The backend used for a store at path: 'csv' for a .csv file, 'hdf5' for a .h5 or .hdf5 file,
+    and otherwise 'parquet' if pyarrow is installed, or 'hdf5' (then 'csv') if it is not
+    '''
+
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        return 'csv'
+    if extension in ['.h5','.hdf5']:
+        return 'hdf5'
+    for backend,module in [('parquet','pyarrow.parquet'),('hdf5','tables')]:
+        try:
+            importlib.import_module(module)
+            return backend
+        except ImportError:
+            pass
+
+    return 'csv'
+
+def store_path(path,backend):
+
+    '''
+    The path of the file (or directory) of a store at path with the given backend (an extension
+    is added when a store without one falls back to HDF5 or csv)
+    '''
+
+    extension = os.path.splitext(path)[1].lower()
+    if backend == 'hdf5' and extension not in ['.h5','.hdf5']:
+        return path + '.h5'
+    if backend == 'csv' and extension != '.csv':
+        return path + '.csv'
+
+    return path
+
+def parquet_dataset(path):
+
+    '''
+    The Parquet dataset of a store at path (the values of the partition columns are read
+    from the names of the directories, as floating point numbers)
+    '''
+
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    partitioning = ds.partitioning(pa.schema([(name,pa.float64()) for name in PARTITION_COLUMNS]),flavor='hive')
+
+    return ds.dataset(path,format='parquet',partitioning=partitioning)
+
+class ResultStore:
+
+    def __init__(self,path,backend=None):
+
+        '''
+        path is the location of the store (a directory for Parquet, a file otherwise), and backend is
+        'parquet', 'hdf5' or 'csv' (chosen by default_backend if it is not given)
+        '''
+
+        if backend is None:
+            backend = default_backend(path)
+        if backend not in ['parquet','hdf5','csv']:
+            raise ValueError("Unknown backend "+str(backend))
+
+        self.backend = backend
+        self.path = store_path(path,backend)
+
+    def exists(self):
+
+        '''
+        Whether anything has been written to the store
+        '''
+
+        return os.path.exists(self.path)
+
+    def columns(self):
+
+        '''
+        Names of the columns of the store (an empty list if nothing has been written to it). With
+        Parquet, the partition columns come last
+        '''
+
+        if not self.exists():
+            return []
+
+        if self.backend == 'parquet':
+            return parquet_dataset(self.path).schema.names
+
+        if self.backend == 'hdf5':
+            return list(pd.read_hdf(self.path,key='results',start=0,stop=0).columns)
+
+        return list(pd.read_csv(self.path,nrows=0).columns)
+
+    def append(self,rows):
+
+        '''
+        Append rows (a DataFrame) to the store. The columns should have the same names and types
+        every time (see typed_rows)
+        '''
+
+        if len(rows) == 0:
+            return
+
+        if self.backend == 'parquet':
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            #every append is written to new files (one per partition), so earlier files are never rewritten
+            pq.write_to_dataset(pa.Table.from_pandas(rows,preserve_index=False),root_path=self.path,
+                                partition_cols=PARTITION_COLUMNS,compression='zstd',
+                                basename_template='part-'+uuid.uuid4().hex+'-{i}.parquet',
+                                existing_data_behavior='overwrite_or_ignore')
+
+        elif self.backend == 'hdf5':
+            string_sizes = {name:max(64,int(rows[name].str.len().max())) for name in rows.columns if rows[name].dtype == object}
+            rows.to_hdf(self.path,key='results',mode='a',format='table',append=True,complevel=5,complib='zlib',
+                        data_columns=[name for name in HDF5_DATA_COLUMNS if name in rows.columns],min_itemsize=string_sizes)
+
+        else:
+            rows.to_csv(self.path,mode='a',header=not self.exists(),index=False)
+
+    def read(self,filters=None,columns=None):
+
+        '''
+        Read the rows of the store that match every filter in filters, a list of (column,operator,value)
+        tuples (the operator is one of OPERATORS, e.g. [('bush_dens','==',1.625),('baffle_prop','<=',0.5)]).
+        columns is the list of columns to read (all of them if not given). Returns a DataFrame
+        '''
+
+        filters = list(filters or [])
+        for column,operator,value in filters:
+            if operator not in OPERATORS:
+                raise ValueError("Unknown operator "+str(operator))
+
+        if not self.exists():
+            return pd.DataFrame(columns=columns)
+
+        if self.backend == 'parquet':
+            import pyarrow.dataset as ds
+
+            expression = None
+            for column,operator,value in filters:
+                field = ds.field(column)
+                condition = {'==':lambda:field == value,'!=':lambda:field != value,'<':lambda:field < value,
+                             '<=':lambda:field <= value,'>':lambda:field > value,'>=':lambda:field >= value,
+                             'in':lambda:field.isin(list(value))}[operator]()
+                expression = condition if expression is None else expression & condition
+
+            return parquet_dataset(self.path).to_table(columns=columns,filter=expression).to_pandas()
+
+        if self.backend == 'hdf5':
+            #PyTables can only filter on the data columns, so the other filters are applied afterwards
+            where = [column+' '+operator+' '+repr(list(value) if operator == 'in' else value)
+                     for column,operator,value in filters if column in HDF5_DATA_COLUMNS]
+            rows = pd.read_hdf(self.path,key='results',where=where or None)
+            filters = [condition for condition in filters if condition[0] not in HDF5_DATA_COLUMNS]
+        else:
+            rows = pd.read_csv(self.path,dtype={'point':str,'engine':str,'code_version':str},float_precision='round_trip')
+
+        keep = np.ones(len(rows),dtype=bool)
+        for column,operator,value in filters:
+            values = rows[column]
+            keep &= {'==':lambda:values == value,'!=':lambda:values != value,'<':lambda:values < value,
+                     '<=':lambda:values <= value,'>':lambda:values > value,'>=':lambda:values >= value,
+                     'in':lambda:values.isin(list(value))}[operator]().to_numpy()
+        rows = rows[keep].reset_index(drop=True)
+
+        return rows if columns is None else rows[columns]
+
+    def fingerprint(self):
+
+        '''
+        A key that changes whenever rows are appended to the store (computed from the names, sizes
+        and modification times of its files), e.g. to tell whether results computed from the store
+        are out of date
+        '''
+
+        if os.path.isdir(self.path):
+            paths = sorted(os.path.join(directory,name) for directory,subdirectories,names in os.walk(self.path) for name in names)
+        else:
+            paths = [self.path] if self.exists() else []
+
+        text = json.dumps([[os.path.relpath(path,self.path),os.stat(path).st_size,os.stat(path).st_mtime_ns] for path in paths])
+
+        return hashlib.sha1(text.encode()).hexdigest()[:16]
+
+    def point_counts(self):
+
+        '''
+        Number of rows (runs) of every point in the store, as a Series indexed by the key of the point
+        '''
+
+        if not self.exists():
+            return pd.Series(dtype=np.int64)
+
+        return self.read(columns=['point'])['point'].value_counts()
+
+def typed_rows(records,columns):
+
+    '''
+    Make a DataFrame from a list of rows (records) with the given columns, in which every column has
+    a fixed type: text for the key of the point, the engine and the code version, integers for
+    the run number and the seeds, and floating point numbers for everything else
+    '''
+
+    rows = pd.DataFrame(records,columns=columns)
+    for name in columns:
+        if name in ['point','engine','code_version']:
+            rows[name] = rows[name].astype(str)
+        elif name in ['run','replicate','landscape_seed','run_seed']:
+            rows[name] = rows[name].astype(np.int64)
+        else:
+            rows[name] = rows[name].astype(np.float64)
+
+    return rows
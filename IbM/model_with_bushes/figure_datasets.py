@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 20:52:19
+Date last modified: 2026-10-18 20:52:19
+Purpose: This script computes the datasets that the R scripts in figurewise_plotting read
+(e.g. main_dataset.csv or silent_males_females_only.csv) directly from the runs in a result
+store (see class_result_store.py), instead of putting them together by hand.
+
+Broad idea:
+Every dataset of every figure is described by a FigureDataset: which runs it is made of (filters
+on the parameters, and the values of the static parameters that were changed for it), which
+response variables it summarises, and whether it has one row per tactic ('long', like main_dataset.csv)
+or one row per set of parameters ('wide', like silent_males_females_only.csv). For every set of
+parameters, a response variable is summarised by its mean over the runs, its standard deviation,
+and the half width of its 95% confidence interval (1.96 sd/sqrt(runs), as in the datasets of the
+paper). Only the columns and partitions of the store that a dataset needs are read.
+The fingerprint of the store is saved with the datasets, so datasets whose runs have not changed
+since they were last written are not computed again.
+'''
+
+import os
+import json
+import hashlib
+import numpy as np
+import pandas as pd
+from class_params import DEFAULT_PARAMS, param_names
+from class_result_store import ResultStore
+from typing import NamedTuple
+
+#z value of a two-sided 95% confidence interval
+Z_95 = 1.96
+
+#response variables: {name:columns of the store that are added up for every run}
+SUCCESS = {'baffler':['baffle_success_mean'],'caller':['caller_success_mean'],'silent':['silent_success_mean']}
+TACTIC_SUCCESS = {'baffle_success':['baffle_success_mean'],'caller_success':['caller_success_mean'],'silent_success':['silent_success_mean']}
+FEMALE_MOVEMENT = {'phonotaxis_steps':['female_within_bush_phonotaxis_steps_mean','female_across_bush_phonotaxis_steps_mean'],
+                   'random_steps':['female_within_bush_random_steps_mean','female_across_bush_random_steps_mean'],
+                   'total_steps':['female_total_steps_mean']}
+
+#densities that are left out of the figures of the paper
+LOW_DENSITIES = [('density','!=',0.01),('density','!=',0.1)]
+
+class FigureDataset(NamedTuple):
+
+    '''
+    A dataset read by the R script of a figure. filename is the name of its .csv file, responses are the
+    response variables (see SUCCESS), layout is 'long' (one row per set of parameters and response variable,
+    in the columns tactic, mean_success, sd and ci) or 'wide' (one row per set of parameters, with columns
+    mean_<response>, sd_<response> and ci_<response>), filters are filters on the runs (see ResultStore.read)
+    and overrides are the values of the static parameters that were changed for the runs (every other static
+    parameter must have its value in static_params.py)
+    '''
+
+    filename: str
+    responses: dict
+    layout: str = 'long'
+    filters: list = []
+    overrides: dict = {}
+
+#the datasets of every folder of figurewise_plotting (bush_dens = 0 denotes the homogeneous habitat)
+FIGURES = {
+    'Fig_2_and_Fig_3':[FigureDataset('main_dataset.csv',SUCCESS,filters=LOW_DENSITIES+[('bush_dens','!=',1.625)])],
+    'Fig_S1':[FigureDataset('main_dataset.csv',SUCCESS,filters=LOW_DENSITIES+[('bush_dens','==',1.0)])],
+    'Fig_S2':[FigureDataset('main_dataset.csv',SUCCESS,filters=LOW_DENSITIES+[('bush_dens','==',0.0)]),
+              FigureDataset('homogenous_no_male_movement.csv',SUCCESS,filters=[('bush_dens','==',0.0)],
+                            overrides={'male_mov_prop_across_bush':0.0,'male_mov_prop_within_bush':0.0})],
+    'Fig_S3':[FigureDataset('main_dataset.csv',SUCCESS,filters=LOW_DENSITIES+[('bush_dens','==',1.0)]),
+              FigureDataset('bush_density_1.0_no_male_movement.csv',SUCCESS,filters=[('bush_dens','==',1.0),('density','==',0.5)],
+                            overrides={'male_mov_prop_across_bush':0.0,'male_mov_prop_within_bush':0.0})],
+    'Fig_S4':[FigureDataset('silent_males_females_only.csv',TACTIC_SUCCESS,'wide',LOW_DENSITIES+[('bush_dens','!=',1.625),('baffle_prop','==',0.0)],
+                            overrides={'male_call_prop':0.0})],
+    'Fig_S5':[FigureDataset('female_movement.csv',FEMALE_MOVEMENT,'wide')],
+    'Fig_S6':[FigureDataset('main_dataset.csv',SUCCESS,filters=[('bush_dens','==',0.0),('density','==',0.5)])]
+             + [FigureDataset('homogenous_male_within_bush_prob_'+str(value)+'.csv',SUCCESS,filters=[('bush_dens','==',0.0),('density','==',0.5)],
+                              overrides={'male_mov_prop_within_bush':value}) for value in [0.5,0.9]],
+    'Fig_S7':[FigureDataset('main_dataset.csv',SUCCESS,filters=[('bush_dens','==',0.0),('density','==',0.5)])]
+             + [FigureDataset('homogenous_female_within_bush_prob_'+str(value)+'.csv',SUCCESS,filters=[('bush_dens','==',0.0),('density','==',0.5)],
+                              overrides={'fem_mov_prop_within_bush':value}) for value in [0.2,0.5]],
+    'Fig_S8':[FigureDataset('main_dataset.csv',SUCCESS,filters=[('bush_dens','==',0.0),('density','==',0.5)])]
+             + [FigureDataset('female_mated_phonotaxis_prob_'+str(value)+'.csv',SUCCESS,filters=[('bush_dens','==',0.0),('density','==',0.5)],
+                              overrides={'mated_phonotaxis_prop':value}) for value in [0.5,1.0]],
+    'Fig_S9':[FigureDataset('main_dataset.csv',SUCCESS,filters=[('bush_dens','==',0.0),('density','==',0.5)])]
+             + [FigureDataset('homogenous_caller_to_silent_ratio_equals_'+ratio+'.csv',SUCCESS,filters=[('bush_dens','==',0.0),('density','==',0.5)],
+                              overrides={'male_call_prop':value}) for ratio,value in [('1_is_to_3',0.25),('3_is_to_1',0.75)]],
+    'Fig_S10':[FigureDataset('main_dataset.csv',SUCCESS,filters=[('bush_dens','==',1.0),('density','==',0.5)])]
+              + [FigureDataset('bushdens_1.0_male_within_bush_prob_'+str(value)+'.csv',SUCCESS,filters=[('bush_dens','==',1.0),('density','==',0.5)],
+                               overrides={'male_mov_prop_within_bush':value}) for value in [0.5,0.9]],
+    'Fig_S11':[FigureDataset('main_dataset.csv',SUCCESS,filters=[('bush_dens','==',1.0),('density','==',0.5)])]
+              + [FigureDataset('bushdens_1.0_female_within_bush_prob_'+str(value)+'.csv',SUCCESS,filters=[('bush_dens','==',1.0),('density','==',0.5)],
+                               overrides={'fem_mov_prop_within_bush':value}) for value in [0.2,0.5]],
+    'Fig_S12':[FigureDataset('main_dataset.csv',SUCCESS,filters=[('bush_dens','==',1.0),('density','==',0.5)])]
+              + [FigureDataset('bushdens_1.0_male_across_bush_prob_'+str(value)+'.csv',SUCCESS,filters=[('bush_dens','==',1.0),('density','==',0.5)],
+                               overrides={'male_mov_prop_across_bush':value}) for value in [0.5,0.9]],
+    'Fig_S13':[FigureDataset('main_dataset.csv',SUCCESS,filters=[('bush_dens','==',1.0),('density','==',0.5)])]
+              + [FigureDataset('bushdens_1.0_female_across_bush_prob_'+str(value)+'.csv',SUCCESS,filters=[('bush_dens','==',1.0),('density','==',0.5)],
+                               overrides={'fem_mov_prop_across_bush':value}) for value in [0.4,0.8]],
+    'Fig_S14':[FigureDataset('main_dataset.csv',SUCCESS,filters=[('bush_dens','==',1.0),('density','==',0.5)])]
+              + [FigureDataset('bush_density_1.0_female_mated_phonotaxis_prob_'+str(value)+'.csv',SUCCESS,filters=[('bush_dens','==',1.0),('density','==',0.5)],
+                               overrides={'mated_phonotaxis_prop':value}) for value in [0.5,1.0]],
+    'Fig_S15':[FigureDataset('main_dataset.csv',SUCCESS,filters=[('bush_dens','==',1.0),('density','==',0.5)])]
+              + [FigureDataset('bush_dens_1.0_caller_to_silent_ratio_equals_'+ratio+'.csv',SUCCESS,filters=[('bush_dens','==',1.0),('density','==',0.5)],
+                               overrides={'male_call_prop':value}) for ratio,value in [('1_is_to_3',0.25),('3_is_to_1',0.75)]],
+}
+
+#parameters that identify a set of parameters in a dataset, and their names in the datasets
+PARAMETERS = {'baffle_prop':'baffle_prop','density':'density','bush_dens':'bush_density','prop_males':'male_prop'}
+
+def run_filters(dataset,store_columns):
+
+    '''
+    The filters (see ResultStore.read) that select the runs of a dataset from a store with the given
+    columns: the filters of the dataset, plus one filter for every static parameter that was changed in
+    any run of the store, which must have the value given in the overrides of the dataset (or its value in
+    static_params.py). Returns None if the store cannot have any runs of the dataset (i.e. if a parameter
+    is overridden by the dataset but never changed in the store)
+    '''
+
+    filters = list(dataset.filters)
+    for name,value in dataset.overrides.items():
+        if name in store_columns:
+            filters.append((name,'==',value))
+        elif value != getattr(DEFAULT_PARAMS,name):
+            return None
+
+    #every other static parameter that the store has as a column must have its default value
+    for name in store_columns:
+        if name in param_names() and name not in dataset.overrides and name not in PARAMETERS:
+            filters.append((name,'==',getattr(DEFAULT_PARAMS,name)))
+
+    return filters
+
+def summarise(runs,responses,layout='long'):
+
+    '''
+    Summarise the runs (a DataFrame with one row per run, see ResultStore) of every set of parameters:
+    the mean, the standard deviation and the half width of the 95% confidence interval of every response
+    variable (runs in which a response variable is not defined, e.g. the success of bafflers when there
+    are no bafflers, are left out). Returns a DataFrame in the given layout (see FigureDataset)
+    '''
+
+    values = pd.DataFrame({name:runs[columns].sum(axis=1,min_count=len(columns)) for name,columns in responses.items()})
+    groups = values.groupby([runs[name] for name in PARAMETERS],sort=True)
+
+    mean = groups.mean()
+    sd = groups.std(ddof=1)
+    ci = Z_95*sd/np.sqrt(groups.count())
+
+    if layout == 'wide':
+        summary = pd.concat([mean.add_prefix('mean_'),sd.add_prefix('sd_'),ci.add_prefix('ci_')],axis=1)
+        return summary.reset_index().rename(columns={'bush_dens':'bush_density'})
+
+    #one row per response variable (tactic) and set of parameters, with the tactics one after the other
+    summary = pd.concat([pd.DataFrame({'tactic':name,'mean_success':mean[name],'sd':sd[name],'ci':ci[name]}) for name in responses])
+
+    return summary.reset_index().rename(columns=PARAMETERS)
+
+def figure_dataset(store,dataset):
+
+    '''
+    Compute a dataset (a FigureDataset) from the runs in a ResultStore. Only the columns that the dataset
+    needs are read, and only the runs that match its filters. Returns None if the store has none of its runs
+    '''
+
+    store_columns = store.columns()
+    filters = run_filters(dataset,store_columns)
+    if filters is None:
+        return None
+
+    columns = list(PARAMETERS) + sorted({column for columns in dataset.responses.values() for column in columns})
+    runs = store.read(filters=filters,columns=columns)
+    if len(runs) == 0:
+        return None
+
+    return summarise(runs,dataset.responses,dataset.layout)
+
+def export_figures(store_path,output_dir,figures=None,force=False):
+
+    '''
+    Write the datasets of the given figures (the names of folders in FIGURES, all of them if None) to
+    output_dir/<figure>/<filename>, computed from the runs in the ResultStore at store_path. The key of
+    every dataset that is written (the fingerprint of the store and the description of the dataset) is
+    saved in output_dir/figure_datasets.json, and datasets whose key has not changed and whose file is
+    still there are not computed again unless force is True (a file that has been deleted is computed again).
+    Datasets of which the store has no runs are not written.
+    Returns a dict {path of the dataset:'written', 'unchanged' or 'no runs'}
+    '''
+
+    store = ResultStore(store_path)
+    cache_path = os.path.join(output_dir,'figure_datasets.json')
+    cache = {}
+    if os.path.exists(cache_path) and not force:
+        with open(cache_path) as cache_file:
+            cache = json.load(cache_file)
+
+    fingerprint = store.fingerprint()
+    status = {}
+    for figure in (FIGURES if figures is None else figures):
+        for dataset in FIGURES[figure]:
+            path = os.path.join(figure,dataset.filename)
+            key = hashlib.sha1((fingerprint+repr(dataset)).encode()).hexdigest()[:16]
+            if cache.get(path) == key and os.path.exists(os.path.join(output_dir,path)):
+                status[path] = 'unchanged'
+                continue
+
+            summary = figure_dataset(store,dataset)
+            if summary is None:
+                status[path] = 'no runs'
+                cache.pop(path,None)
+            else:
+                os.makedirs(os.path.join(output_dir,figure),exist_ok=True)
+                summary.to_csv(os.path.join(output_dir,path),index=False)
+                status[path] = 'written'
+                cache[path] = key
+
+    with open(cache_path,'w') as cache_file:
+        json.dump(cache,cache_file,indent=1,sort_keys=True)
+
+    return status
@@ -22,10 +22,23 @@ The code for this model is modularized for organizational ease. This script is
 the parallelized version of the 'main' script that brings it all together.
 
 
-This main script is meant to be submitted as an array job in a HPC which allows us to parallelize over multiple nodes
+This main script is meant to be submitted as an array job in a HPC which allows us to parallelize over multiple nodes.
+Every task of the array job can either run a single set of parameters (-f and -d), or a shard (a share) of a whole
+grid of parameter values (-g, see set_up_sweep.py), in which case the shard is given by --shard-index and --shard-count
+or, if these are not given, by the SLURM_ARRAY_TASK_ID environment variables of the task.
+With --store, the results of every task are appended to a single result store (see class_result_store.py)
+instead of a file per task. A Parquet store can be written to by all the tasks at once; other stores get
+a file per shard.
 '''
 import argparse
+import os
+import numpy as np
 from set_up_parallelization import simulate_and_save
+from class_result_store import ResultStore
+from set_up_sweep import load_grid, run_sweep, shard_from_environment
+
+#with -t, the minimum number of runs of a set of parameters before its confidence intervals are checked
+MIN_RUNS = 10
 
 ################ Take arguments as input (for looping over in the array job) ################################
 
@@ -37,23 +50,76 @@ if __name__ == "__main__":
 
      parser = argparse.ArgumentParser(description="IbM of alternative reproductive tactics in tree crickets")
 
-     parser.add_argument("-f", "--freq", dest="frequency", help="Baffling trait frequency", required=True)
-     parser.add_argument("-d", "--dens", dest="density", help="Population density (inds/sq m)", required=True)
+     parser.add_argument("-f", "--freq", dest="frequency", help="Baffling trait frequency (required without -g)")
+     parser.add_argument("-d", "--dens", dest="density", help="Population density (inds/sq m) (required without -g)")
      parser.add_argument("-file","--filename",dest='file',help='unique index for the filename',required=True)
+     parser.add_argument("-o","--output-dir",dest='output_dir',help="Directory in which the output files are written (default: ./output/, created if needed)",default="output")
+     parser.add_argument("--habitat",dest='habitat',help="Habitat ('bushes' or 'homogeneous', see class_habitat.py; with -g, give bush_dens 0 in the grid instead)",choices=['bushes','homogeneous'],default='bushes')
+     parser.add_argument("-r","--runs",dest='runs',help="Number of runs per set of parameters (with -t, the maximum number of runs, at least 10; default 2)",type=int,default=2)
+     parser.add_argument("-e","--engine",dest='engine',help="Simulation engine ('object' or 'array')",choices=['object','array'],default='object')
+     parser.add_argument("-c","--cores",dest='cores',help="Number of cores to use (default 1)",type=int,default=1)
+     parser.add_argument("-t","--target",dest='target',help="Run replicates until the confidence interval of each tactic's mean mating success is at most this wide on either side of the mean (runs is then the maximum number of runs)",type=float,default=None)
+     parser.add_argument("-s","--seed",dest='seed',help="Seed of the random number generators (runs are not reproducible if it is not given)",type=int,default=None)
+     parser.add_argument("--crn",dest='crn',help="Use common random numbers: run k of every set of parameters uses the same seeds (use with -s so that separate jobs share them)",action='store_true')
+     parser.add_argument("-g","--grid",dest='grid',help="Path to a .json file with a grid of parameter values to run instead of -f and -d (see set_up_sweep.py)",default=None)
+     parser.add_argument("--shard-index",dest='shard_index',help="Which shard of the grid to run (0 to shard count - 1, default: from SLURM_ARRAY_TASK_ID)",type=int,default=None)
+     parser.add_argument("--shard-count",dest='shard_count',help="Number of shards the grid is split into (default: from SLURM_ARRAY_TASK_COUNT)",type=int,default=None)
+     parser.add_argument("--cache",dest='cache',help="Directory of a cache of runs, shared by the tasks of the array job (only with -g, see class_result_cache.py)",default=None)
+     parser.add_argument("--diagnostics",dest='diagnostics',help="Also write the number of cut off distances drawn during across bush phonotaxis, and the expected number of draws the original rejection sampling would have needed, of every run to a separate file (not with -g)",action='store_true')
+     parser.add_argument("--store",dest='store',help="Path to a result store to append the results to (a directory for Parquet, or a .h5 or .csv file)",default=None)
 
      args = parser.parse_args() 
-     freq = float(args.frequency)
-     dens = float(args.density)
+     if args.grid is None and (args.frequency is None or args.density is None):
+          parser.error("either -f and -d, or -g, are required")
+     if args.grid is not None and args.target is not None:
+          parser.error("-t cannot be used with -g")
+     if args.target is not None and args.runs < MIN_RUNS:
+          parser.error("with -t, -r must be at least "+str(MIN_RUNS)+" (the minimum number of runs before the confidence intervals are checked)")
+     if args.grid is not None and args.habitat != 'bushes':
+          parser.error("--habitat cannot be used with -g (give bush_dens 0 in the grid for the homogeneous habitat)")
+     if args.grid is not None and args.diagnostics:
+          parser.error("--diagnostics cannot be used with -g")
+     if args.grid is None and args.cache is not None:
+          parser.error("--cache can only be used with -g")
+     if (args.shard_index is None) != (args.shard_count is None):
+          parser.error("--shard-index and --shard-count must be given together")
+
      file = str(args.file)
+     engine = str(args.engine)
+     cores = int(args.cores) #Number of cores to use while running the simulation
+     target = args.target #Target half-width of the confidence intervals (None to always make all the runs)
+     crn = bool(args.crn) #Whether to use common random numbers across sets of parameters
+     overrides = {'bush_dens':0.0} if args.habitat == 'homogeneous' else {} #a bush density of 0 is the homogeneous habitat
+
+     if args.seed is not None:
+          np.random.seed(args.seed)
+
+     #Location to which output should be stored
+     os.makedirs(args.output_dir,exist_ok=True)
+     save_path = os.path.join(args.output_dir,"")
 
+     ##################### Simulation parameters (for computing) ###################
+     runs = int(args.runs) #Number of realizations over which to average the results
+     N = 500    #Number of individuals to use in the simulation
 
-#Location to which output should be stored
-save_path = "D:/github/Sadiq_et_al_2023_oecanthus_ART_IbM/output/"
+     #Run the model (inside the if condition, so that worker processes which import this file don't run it again)
+     if args.grid is None:
+          freq = float(args.frequency)
+          dens = float(args.density)
+          simulate_and_save([[freq,dens,0.5]],runs, N, cores, save_path, file, engine, target_half_width=target, min_runs=MIN_RUNS, crn=crn, store_path=args.store, overrides=overrides, diagnostics=args.diagnostics)
+     else:
+          #the shard of the grid that this task runs (the whole grid if this is not an array job)
+          if args.shard_index is not None:
+               shard_index,shard_count = args.shard_index,args.shard_count
+          else:
+               shard_index,shard_count = shard_from_environment() or (0,1)
 
-##################### Simulation parameters (for computing) ###################
-runs = 2 #Number of realizations over which to average the results
-cores = 1 #Number of cores to use while running the simulation
-N = 500    #Number of individuals to use in the simulation
+          if args.store is None:
+               store_path,extension = save_path+"sweep_"+str(N)+"_individuals_" + "array_"+file,".csv"
+          else:
+               store_path,extension = os.path.splitext(args.store)
 
-#Run the model
-simulate_and_save([[freq,dens,0.5]],runs, N, cores, save_path, file)
\ No newline at end of file
+          #only a Parquet store can be appended to by several shards at once
+          if shard_count > 1 and ResultStore(store_path+extension).backend != 'parquet':
+               store_path += "_shard_"+str(shard_index)+"_of_"+str(shard_count)
+          run_sweep(load_grid(args.grid),runs,N,cores,store_path+extension,engine,args.seed,crn,shard_index,shard_count,cache_path=args.cache)
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 21:05:47
+Date last modified: 2026-10-18 21:05:47
+Purpose: Write the datasets read by the R scripts in figurewise_plotting (one folder per figure)
+from the runs in a result store, in a single command (see figure_datasets.py).
+
+Datasets whose runs have not changed since they were last written are skipped, so the command
+can simply be run again after every sweep.
+'''
+import os
+import argparse
+from figure_datasets import FIGURES, export_figures
+
+if __name__ == "__main__":
+
+     parser = argparse.ArgumentParser(description="Datasets of the figures of the IbM of alternative reproductive tactics in tree crickets")
+
+     parser.add_argument("-s","--store",dest='store',help="Path to the result store with the runs (see class_result_store.py)",required=True)
+     parser.add_argument("-o","--output",dest='output',help="Folder in which every figure has its folder (default: figurewise_plotting)",
+                         default=os.path.join(os.path.dirname(os.path.abspath(__file__)),'..','..','figurewise_plotting'))
+     parser.add_argument("-f","--figures",dest='figures',help="Figures to write the datasets of (default: all of them)",nargs='*',choices=list(FIGURES),default=None)
+     parser.add_argument("--force",dest='force',help="Write every dataset, even those whose runs have not changed",action='store_true')
+
+     args = parser.parse_args()
+
+     status = export_figures(args.store,args.output,args.figures,args.force)
+     for path,state in status.items():
+          print(path+":",state)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 22:18:25
+Date last modified: 2026-10-18 22:18:25
+Purpose: Run the scenarios of the supplementary material (see scenarios.py), all of them or only
+some, as a single parameter sweep on all the cores of the computer.
+
+The results of every run are written to a single result store. If the store already exists, the sets
+of parameters that are already in it are skipped, so an interrupted batch can simply be started again.
+'''
+import argparse
+import numpy as np
+import multiprocessing as mp
+from scenarios import SCENARIOS, run_scenarios
+
+if __name__ == "__main__":
+
+     #the if condition makes sure that arguments are asked for only when this file is the main program
+     #and not when it is imported in another piece of code (e.g. by the worker processes)
+
+     parser = argparse.ArgumentParser(description="Scenarios of the supplementary material of the IbM of alternative reproductive tactics in tree crickets")
+
+     parser.add_argument("-o","--output",dest='output',help="Path to the result store (a directory for Parquet, or a .h5 or .csv file, see class_result_store.py)")
+     parser.add_argument("-S","--scenarios",dest='scenarios',help="Scenarios to run (default: all of them)",nargs='*',choices=list(SCENARIOS),default=None)
+     parser.add_argument("-r","--runs",dest='runs',help="Number of runs per set of parameters (default 100)",type=int,default=100)
+     parser.add_argument("-n","--individuals",dest='N',help="Number of individuals in the simulation (default 500)",type=int,default=500)
+     parser.add_argument("-e","--engine",dest='engine',help="Simulation engine ('object' or 'array')",choices=['object','array'],default='object')
+     parser.add_argument("-c","--cores",dest='cores',help="Number of cores to use (default: all of them)",type=int,default=mp.cpu_count())
+     parser.add_argument("-s","--seed",dest='seed',help="Seed of the sweep (runs are not reproducible if it is not given)",type=int,default=None)
+     parser.add_argument("--cache",dest='cache',help="Directory of a cache of runs: runs that are in it are loaded instead of being run again, and new runs are added to it",default=None)
+     parser.add_argument("-t","--timings",dest='timings',help="Result stores of earlier sweeps, whose run times are used to predict how long each run will take",nargs='*',default=[])
+     parser.add_argument("-l","--list",dest='list',help="List the scenarios and exit",action='store_true')
+
+     args = parser.parse_args()
+
+     if args.list:
+          for name,scenario in SCENARIOS.items():
+               print(name+":",scenario.description,scenario.overrides)
+          parser.exit()
+
+     if args.output is None:
+          parser.error("the following arguments are required: -o/--output")
+
+     if args.seed is not None:
+          np.random.seed(args.seed)
+
+     #Run the scenarios
+     report = run_scenarios(args.scenarios,args.runs,args.N,args.cores,args.output,args.engine,args.seed,args.timings,args.cache)
+     print("Ran",report.tasks,"runs of",report.points,"sets of parameters ("+str(report.cached_tasks),"of them loaded from the cache)")
+     print("Predicted time: %.1f s, actual time: %.1f s" % (report.predicted_makespan,report.actual_makespan))
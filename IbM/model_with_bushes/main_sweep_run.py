@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 18:58:02
+Date last modified: 2026-10-18 18:58:02
+Purpose: Run the IbM over a whole grid of parameter values (a parameter sweep) in a single
+program, instead of calling main_array_run.py once per set of parameters.
+
+The grid is read from a .json file (see set_up_sweep.py), and the results of every run of every
+set of parameters are written to a single result store. If the store already exists, the sets of
+parameters that are already in it are skipped, so an interrupted sweep can simply be started again.
+'''
+import argparse
+import numpy as np
+from set_up_sweep import load_grid, run_sweep
+
+if __name__ == "__main__":
+
+     #the if condition makes sure that arguments are asked for only when this file is the main program
+     #and not when it is imported in another piece of code (e.g. by the worker processes)
+
+     parser = argparse.ArgumentParser(description="Parameter sweep of the IbM of alternative reproductive tactics in tree crickets")
+
+     parser.add_argument("-g","--grid",dest='grid',help="Path to the .json file with the grid of parameter values",required=True)
+     parser.add_argument("-o","--output",dest='output',help="Path to the result store (a directory for Parquet, or a .h5 or .csv file, see class_result_store.py)",required=True)
+     parser.add_argument("-r","--runs",dest='runs',help="Number of runs per set of parameters (default 100)",type=int,default=100)
+     parser.add_argument("-n","--individuals",dest='N',help="Number of individuals in the simulation (default 500)",type=int,default=500)
+     parser.add_argument("-e","--engine",dest='engine',help="Simulation engine ('object' or 'array')",choices=['object','array'],default='object')
+     parser.add_argument("-c","--cores",dest='cores',help="Number of cores to use (default 1)",type=int,default=1)
+     parser.add_argument("-s","--seed",dest='seed',help="Seed of the sweep (runs are not reproducible if it is not given)",type=int,default=None)
+     parser.add_argument("--crn",dest='crn',help="Use common random numbers: run k of every set of parameters uses the same seeds",action='store_true')
+     parser.add_argument("--cache",dest='cache',help="Directory of a cache of runs: runs that are in it are loaded instead of being run again, and new runs are added to it",default=None)
+     parser.add_argument("-t","--timings",dest='timings',help="Result stores of earlier sweeps, whose run times are used to predict how long each run will take",nargs='*',default=[])
+
+     args = parser.parse_args()
+
+     if args.seed is not None:
+          np.random.seed(args.seed)
+
+     #Run the sweep
+     report = run_sweep(load_grid(args.grid),args.runs,args.N,args.cores,args.output,args.engine,args.seed,args.crn,timing_paths=args.timings,cache_path=args.cache)
+     print("Ran",report.tasks,"runs of",report.points,"sets of parameters ("+str(report.cached_tasks),"of them loaded from the cache)")
+     print("Predicted time: %.1f s, actual time: %.1f s" % (report.predicted_makespan,report.actual_makespan))
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 15:04:52
+Date last modified: 2026-10-18 15:04:52
+Purpose: Random sampling functions used by the Model and ArrayModel classes.
+
+Broad idea:
+During across bush phonotaxis, a female used to draw cut off distances from a lognormal
+distribution until at least one of the loudest bushes was within the cut off. If the
+nearest of these bushes is at a distance d, this is the lognormal distribution conditioned
+on the cut off being at least d. Since bushes are usually much further apart than the
+median of the lognormal distribution, the loop could take thousands of draws. Here the
+conditional distribution is sampled directly with a single uniform random number, using
+the inverse of the (log) survival function of the lognormal distribution.
+'''
+
+import numpy as np
+from scipy.special import log_ndtr, ndtri_exp
+
+def conditional_lognormal(mean,sd,lower,u):
+
+    '''
+    Draw from a lognormal distribution with parameters mean and sd (the mean and standard
+    deviation of the underlying normal distribution, as in np.random.lognormal), conditioned
+    on the value being at least lower. lower can be a number or an array (one draw is made
+    for every element). u holds uniform random values in [0,1) (one for every draw, from the
+    random streams of the model, see class_random_streams.py).
+
+    Returns (cut_off,legacy_iterations), where legacy_iterations is the expected number of
+    unconditional draws that rejection sampling (redrawing until the value is at least lower)
+    would have needed, i.e. 1/P(value >= lower).
+    '''
+
+    lower = np.asarray(lower,dtype=float)
+
+    #log of the probability that an unconditional draw is at least lower
+    log_survival = log_ndtr((mean - np.log(lower))/sd)
+
+    #the survival function of the conditional distribution is uniform on (0,1]
+    u = 1 - np.asarray(u)
+    cut_off = np.exp(mean - sd*ndtri_exp(np.log(u) + log_survival))
+
+    #guard against rounding, so that the nearest bush is always within the cut off
+    cut_off = np.maximum(cut_off,lower)
+
+    return cut_off,np.exp(-log_survival)
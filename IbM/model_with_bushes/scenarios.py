@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 22:10:41
+Date last modified: 2026-10-18 22:10:41
+Purpose: This script defines the scenarios of the supplementary material (e.g. no male movement, or
+other within-bush movement propensities), so that all of them can be run in a single sweep instead of
+with hand-modified copies of the model.
+
+Broad idea:
+A scenario is a named set of changes to the static parameters (see Params.with_overrides in class_params.py),
+together with the grids of parameter values (see set_up_sweep.py) on which it is run in the supplementary
+figures (a bush density of 0 is the homogeneous habitat, see class_habitat.py). Changes of behaviour are also made through the static parameters, e.g. males that never move are
+males whose movement propensities within and across bushes are 0, and only silent males (no callers) is a
+call propensity of 0. The grids of all the chosen scenarios are run as a single sweep (see run_scenarios),
+in which all the runs with the same density and bushes share a landscape, whichever scenario they belong to,
+so every worker process makes each landscape once. The datasets of the supplementary figures are then
+computed from the result store of the sweep (see figure_datasets.py).
+'''
+
+from set_up_sweep import run_sweep
+from typing import NamedTuple
+
+#the values of the parameters in the supplementary figures
+BAFFLE_PROPS = [round(0.01 + 0.04*i,2) for i in range(25)]
+DENSITIES = [0.01,0.05,0.1,0.25,0.5,0.75,1.0]
+BUSH_DENSITIES = [0.0,0.5,1.0,1.5,1.625,2.0]
+
+#the grids of the supplementary figures that compare scenarios, in the homogeneous habitat (Fig S6 to S9)
+#and with bushes (Fig S10 to S15)
+HOMOGENEOUS_GRID = {'baffle_prop':BAFFLE_PROPS,'density':[0.5],'bush_dens':[0.0]}
+COMPARISON_GRID = {'baffle_prop':BAFFLE_PROPS,'density':[0.5],'bush_dens':[1.0]}
+
+class Scenario(NamedTuple):
+
+    '''
+    A scenario of the supplementary material. overrides are the values of the static parameters that are
+    changed in it (a dict {name:value}, see Params.with_overrides), grids are the grids of parameter values
+    (see expand_grid in set_up_sweep.py) on which it is run, and description says what it is
+    '''
+
+    overrides: dict
+    grids: list
+    description: str = ''
+
+#every scenario, by name
+SCENARIOS = {
+    'baseline':Scenario({},[{'baffle_prop':BAFFLE_PROPS,'density':DENSITIES,'bush_dens':[0.0,1.0]}],
+                        "The static parameters as in static_params.py (the runs with which the other scenarios are compared)"),
+    'no_male_movement':Scenario({'male_mov_prop_across_bush':0.0,'male_mov_prop_within_bush':0.0},
+                                [{'baffle_prop':BAFFLE_PROPS,'density':DENSITIES,'bush_dens':[0.0]},COMPARISON_GRID],
+                                "Males never move"),
+    'silent_males_only':Scenario({'male_call_prop':0.0},[{'baffle_prop':[0.0],'density':DENSITIES,'bush_dens':BUSH_DENSITIES}],
+                                 "No bafflers or callers: all the males are silent, and females only find them by random movement"),
+}
+SCENARIOS.update({'male_within_bush_prob_'+str(value):Scenario({'male_mov_prop_within_bush':value},[HOMOGENEOUS_GRID,COMPARISON_GRID],
+                                                               "Males move within a bush with probability "+str(value))
+                  for value in [0.5,0.9]})
+SCENARIOS.update({'female_within_bush_prob_'+str(value):Scenario({'fem_mov_prop_within_bush':value},[HOMOGENEOUS_GRID,COMPARISON_GRID],
+                                                                 "Females move within a bush with probability "+str(value))
+                  for value in [0.2,0.5]})
+SCENARIOS.update({'male_across_bush_prob_'+str(value):Scenario({'male_mov_prop_across_bush':value},[COMPARISON_GRID],
+                                                               "Males move across bushes with probability "+str(value))
+                  for value in [0.5,0.9]})
+SCENARIOS.update({'female_across_bush_prob_'+str(value):Scenario({'fem_mov_prop_across_bush':value},[COMPARISON_GRID],
+                                                                 "Females move across bushes with probability "+str(value))
+                  for value in [0.4,0.8]})
+SCENARIOS.update({'female_mated_phonotaxis_prob_'+str(value):Scenario({'mated_phonotaxis_prop':value},[HOMOGENEOUS_GRID,COMPARISON_GRID],
+                                                                      "Mated females do phonotaxis with probability "+str(value))
+                  for value in [0.5,1.0]})
+SCENARIOS.update({'caller_to_silent_ratio_equals_'+ratio:Scenario({'male_call_prop':value},[HOMOGENEOUS_GRID,COMPARISON_GRID],
+                                                                  "Non-baffling males call with probability "+str(value)+" (callers:silent males = "+ratio.replace('_is_to_',':')+")")
+                  for ratio,value in [('1_is_to_3',0.25),('3_is_to_1',0.75)]})
+
+def scenario_grids(names=None):
+
+    '''
+    The grids (see expand_grid in set_up_sweep.py) of the given scenarios (all of them if names is None),
+    with the static parameters of every scenario set in its grids
+    '''
+
+    names = list(SCENARIOS) if names is None else names
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        raise ValueError("Unknown scenarios: "+", ".join(unknown))
+
+    return [dict(grid,**{name:[value] for name,value in SCENARIOS[scenario].overrides.items()})
+            for scenario in names for grid in SCENARIOS[scenario].grids]
+
+def run_scenarios(names,runs,N,cores,store_path,engine='object',seed=None,timing_paths=(),cache_path=None):
+
+    '''
+    Run runs replicates (with N individuals each) of the given scenarios (all of them if names is None)
+    as a single sweep over a pool of cores worker processes, and append the results to the ResultStore
+    at store_path (see run_sweep in set_up_sweep.py for the other arguments). All the runs with the same
+    density and bushes share a landscape (see point_tasks). Returns a SweepReport
+    '''
+
+    return run_sweep(scenario_grids(names),runs,N,cores,store_path,engine,seed,timing_paths=timing_paths,
+                     cache_path=cache_path,share_landscapes=True)
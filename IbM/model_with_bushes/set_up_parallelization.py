@@ -12,116 +12,468 @@ cores of the computing system simultaneously.
 '''
 
 import numpy as np
+import contextlib
+import functools
+import threading
 import multiprocessing as mp
 import pandas as pd
 from class_model import Model
+from class_array_model import ArrayModel
 from class_landscape import Landscape
-from static_params import *
+from summary_statistics import column_names
+from class_accumulator import Accumulator, save_checkpoint
+from class_result_store import ResultStore, typed_rows, point_key, code_version
+from class_random_streams import SETUP
+from class_params import DEFAULT_PARAMS
+from class_habitat import habitat_of
 
-def combined_run(values,runs,N):
+#the simulation engines that can be used to run the model
+engines = {'object':Model,'array':ArrayModel}
+
+def make_landscape(values,N,seed=None,params=DEFAULT_PARAMS):
 
     '''
-    This function runs the model for a given set of parameters and returns
-    the mate counts for each of the strategies. We will loop over this function
-    to scan the parameter space.
-    
-    values is a tuple of the form (freq,density,sex ratio).
-    N is the number of individuals in the simulation.
-    runs is the number of runs to average over while returning output.
+    Create the landscape for a given set of parameters and fill it with bushes.
+    values is a tuple of the form (freq,density,sex ratio) and N is the number
+    of individuals in the simulation (together, they set the size of the landscape).
+    seed is the seed of the bushes (see Landscape.make_bushes), and params holds the
+    static parameters (see class_params.py)
     '''
-    
+
+    area = N/values[1]         #Area of the grid. Set according to specified N and density
+    side = np.sqrt(area)*100   #Side length of the grid in cm (the grid is a square)
+
+    #create a landscape and fill it with bushes
+    landscape = Landscape([0,side,5],[0,side,5],params)
+    landscape.make_bushes(seed=seed)
+    landscape.make_distance_list()
+
+    return landscape
+
+def landscape_key(values,N,seed,params):
+
+    '''
+    Everything that the landscape made by make_landscape depends on: runs with the same key can
+    share a landscape, even if the other parameters (e.g. the movement propensities) differ.
+    The landscape of the homogeneous habitat (a single bush) only depends on its size
+    '''
+
+    if not habitat_of(params).across_bushes:
+        return (values[1],N,'homogeneous')
+
+    return (values[1],N,seed,params.bush_dens,params.bush_size_mean,params.bush_size_sd,params.threshold_bush_dist)
+
+def output_columns():
+
+    '''
+    Names of the columns of a row of the output file (see single_run)
+    '''
+
+    return ['baffle_prop','density','prop_males','area(m^2)'] + column_names()
+
+#diagnostics of a run that are not part of its row of the output file (see single_run): the number of cut off distances
+#drawn during across bush phonotaxis, and the expected number of lognormal draws that redrawing each of them until a
+#loud bush was within the cut off (as the model used to) would have needed. The latter is the sum of 1/P(X >= nearest
+#loud bush) over the draws (see conditional_lognormal in sampling.py), not a count of simulated draws
+DIAGNOSTIC_COLUMNS = ['cut_off_draws','expected_legacy_cut_off_draws']
+
+def single_run(values,N,landscape,engine='object',seed=None,params=None,diagnostics=False):
+
+    '''
+    Run the model once (for one night) on the given landscape and return a row of
+    the output file (an array of 289 values). The arguments are as in combined_run,
+    and seed is the seed of the random streams of the run (see class_random_streams.py).
+    params holds the static parameters of the run (those of the landscape if not given).
+    If diagnostics is True, the values of DIAGNOSTIC_COLUMNS are appended to the row.
+    '''
+
+    if params is None:
+        params = landscape.params
+
     baffle_prop = values[0]    #Proportion of males that are bafflers
     dens = values[1]           #Population density (inds/sq m)
     ratio = values[2]          #Sex ratio
     area = N/dens              #Area of the grid. Set according to specified N and density
     side = np.sqrt(area)*100   #Side length of the grid in cm (the grid is a square)
-    
-    #create a landscape and fill it with bushes
-    landscape = Landscape([0,side,5],[0,side,5])
-    landscape.make_bushes(bush_dens,bush_size_mean,bush_size_sd)
-    landscape.make_distance_list()
-    
+
     #figure out how many males and females to make
     N_sig =  min(N,round(ratio*N))
     N_rec = max(0,N - N_sig)
 
-    results = np.zeros(shape=(runs,289)) #289 is the number of columns of the output file
-                
-    for run in range(runs):
+    #remove the individuals of the previous run from the bushes
+    landscape.clear_bushes()
 
-        #create a model
-        model = Model(N_sig,N_rec,landscape)
+    #create a model
+    model = engines[engine](N_sig,N_rec,landscape,seed=seed,params=params)
 
-        #fill it with males and females
-        model.gen_callers(baffle_prop,SPL,side)
+    #fill it with males and females
+    model.gen_callers(baffle_prop,params.SPL,side)
 
-        #draw female velociteis from a lognormal dist
-        fem_vel = np.random.lognormal(fem_vel_mean,fem_vel_sd,size=N_rec)
+    #draw female velociteis from a lognormal dist
+    fem_vel = model.streams.lognormal('female_speed',SETUP,N_rec,params.fem_vel_mean,params.fem_vel_sd)
 
-        #decompose into orthogonal components
-        fem_vel /= np.sqrt(2)
+    #decompose into orthogonal components
+    fem_vel /= np.sqrt(2)
 
-        model.gen_receivers(fem_vel,fem_vel,side)
+    model.gen_receivers(fem_vel,fem_vel,side)
 
-        #Run for one night
-        model.run(night_dur,side)
+    #Run for one night
+    model.run(params.night_dur,side)
 
-        #extract results
-        model_out = model.get_mate_counts(baffle_prop)
+    #extract results
+    model_out = model.get_mate_counts(baffle_prop)
 
-        run_results = [baffle_prop,dens,ratio,area]
-        for param in model_out:
-            for val in model_out[param]:
-                run_results.append(val)
+    row = np.concatenate(([baffle_prop,dens,ratio,area],model_out.as_row()))
+    if diagnostics:
+        row = np.concatenate((row,[getattr(model,name) for name in DIAGNOSTIC_COLUMNS]))
 
+    return row
 
-        results[run] = run_results
+def combined_run(values,runs,N,engine='object',params=DEFAULT_PARAMS,landscape_seed=None,run_seeds=None):
+
+    '''
+    This function runs the model for a given set of parameters and yields
+    the mate counts for each of the strategies, one run (one row of the output file)
+    at a time, so that the results of all the runs are never held in memory together.
+    We will loop over this function to scan the parameter space.
+    
+    values is a tuple of the form (freq,density,sex ratio).
+    N is the number of individuals in the simulation.
+    runs is the number of runs to average over while returning output.
+    engine is either 'object' (the Model class, where each cricket is an object) or
+    'array' (the ArrayModel class, where the population is stored in numpy arrays).
+    params holds the static parameters (see class_params.py).
+    landscape_seed is the seed of the landscape, and run_seeds is the list of the seeds of
+    the runs (see make_tasks). The seeds are drawn from numpy's global random state if
+    they are not given. Run k gives the same row as run_task with the same seeds.
+    '''
 
-    return results
+    #all runs for this set of parameters take place on the same landscape
+    landscape = make_landscape(values,N,landscape_seed,params)
 
-def simulate_and_save(params,runs,N,cores,save_path,filename):
+    if run_seeds is None:
+        run_seeds = [int(seed) for seed in np.random.randint(0,2**63,size=runs,dtype=np.int64)]
+
+    for run_seed in run_seeds[:runs]:
+        yield single_run(values,N,landscape,engine,run_seed,params)
+
+#landscapes used by the last tasks that ran in this (worker) process, stored as {key:landscape} from the
+#least to the most recently used. Tasks that run one after the other often belong to the same set of parameters
+#(or to sets of parameters that share a landscape, see landscape_key), so their landscapes can be reused.
+#A few landscapes are kept, since the tasks of a sweep that share landscapes (e.g. the scenarios in scenarios.py)
+#are interleaved with other tasks when they are scheduled by their run times
+LANDSCAPE_CACHE_SIZE = 8
+_task_landscape = {}
+
+def run_task(task,diagnostics=False):
 
     '''
-    This function runs the previous function (combined_run) in parallel for a specified
-    region in parameter space. runs represents how many runs to average over.
+    Run a single replicate of the model in a worker process of simulate_and_save.
+    task is a tuple (values,N,engine,landscape_seed,run_seed,overrides), where landscape_seed is the
+    seed of the landscape, run_seed is the seed of the run (see make_tasks) and overrides is a dict
+    of static parameters to change for this run (see Params.with_overrides).
+    Returns a row of the output file (followed by the values of DIAGNOSTIC_COLUMNS if diagnostics is True).
     '''
-    
-    #run the combined_run in parallel over specified number of cores
+
+    values,N,engine,landscape_seed,run_seed,overrides = task
+    params = DEFAULT_PARAMS.with_overrides(overrides)
+
+    key = landscape_key(values,N,landscape_seed,params)
+    if key in _task_landscape:
+        _task_landscape[key] = _task_landscape.pop(key)
+    else:
+        if len(_task_landscape) >= LANDSCAPE_CACHE_SIZE:
+            del _task_landscape[next(iter(_task_landscape))]
+        _task_landscape[key] = make_landscape(values,N,landscape_seed,params)
+
+    np.random.seed(run_seed)
+
+    return single_run(values,N,_task_landscape[key],engine,run_seed,params,diagnostics)
+
+def make_tasks(params,runs,N,engine='object',crn=False,overrides=None):
+
     '''
-#    pool = mp.Pool(cores)
-#    results = [pool.apply(combined_run, args=(values, runs,N)) for values in params]
-#    pool.close()
+    Split a set of parameter values into one task (see run_task) per replicate,
+    in the same order as the rows of the output file. The seeds of the tasks are
+    derived from the global numpy random state, so seeding numpy makes the
+    output reproducible regardless of the number of cores.
+
+    Normally, all the replicates of a set of parameters share a landscape seed (and hence the
+    landscape, as in combined_run), and every replicate has its own run seed.
+    With crn = True (common random numbers), replicate k of every set of parameters instead
+    gets the same landscape seed and the same run seed, so that sets of parameters are compared
+    on the same bushes, with males and females that make the same random draws (SPL, call effort,
+    velocity, movement...) as far as the difference in parameters allows. Differences between
+    sets of parameters then contain much less noise from the differences between replicates.
+    overrides is a dict of static parameters to change for all the tasks (see run_task).
     '''
-    #format the output so that it looks nicer
-#    results= []
-#   for values in params:
-    results = [combined_run(values, runs,N) for values in params]
 
-    result_array = np.vstack(results)
-    data_final= pd.DataFrame(result_array)
-    
-    colnames = ['baffle_prop','density','prop_males','area(m^2)']
-
-    for stat_type in ['mean','sd','kurtosis','skew','min','max','median']:
-        for out_type in ['baffle_success','caller_success','silent_success','total_male_success','total_female_success',
-        'baffle_call_effort','baffle_within_bush_steps','baffle_within_bush_distance','baffle_across_bush_steps','baffle_across_bush_distance', 'baffle_total_steps','baffle_total_distance',
-        'caller_call_effort','caller_within_bush_steps','caller_within_bush_distance','caller_across_bush_steps','caller_across_bush_distance', 'caller_total_steps','caller_total_distance',
-        'silent_call_effort','silent_within_bush_steps','silent_within_bush_distance','silent_across_bush_steps','silent_across_bush_distance', 'silent_total_steps','silent_total_distance',
-        'female_within_bush_random_steps','female_within_bush_random_distance',
-        'female_across_bush_random_steps','female_across_bush_random_distance',
-        'female_within_bush_phonotaxis_steps','female_within_bush_phonotaxis_distance',
-        'female_across_bush_phonotaxis_steps','female_across_bush_phonotaxis_distance',
-        'female_within_bush_total_steps','female_within_bush_total_distance',
-        'female_across_bush_total_steps','female_across_bush_total_distance',
-        'female_total_steps','female_total_distance']:
-            
-            
-            colnames.append(str(out_type+"_"+stat_type))
-
-    for ind_type in ['baffle','caller','silent','total_male','total_female']:
-        colnames.append(str(ind_type+'_'+'proportion_mated'))
-    
-    data_final.columns = colnames
-    #save to file
-    data_final.to_csv(save_path+"output_"+str(N)+"_individuals_" + "array_"+str(filename)+".csv")
-        
+    overrides = {} if overrides is None else dict(overrides)
+
+    root = np.random.SeedSequence(int(np.random.randint(0,2**32,dtype=np.int64)))
+
+    if crn:
+        replicate_seeds = [[int(seed) for seed in replicate_seed.generate_state(2)] for replicate_seed in root.spawn(runs)]
+        return [(list(values),N,engine,landscape_seed,run_seed,overrides) for values in params
+                for landscape_seed,run_seed in replicate_seeds]
+
+    tasks = []
+    for values,point_seed in zip(params,root.spawn(len(params))):
+        seeds = [int(seed.generate_state(1)[0]) for seed in point_seed.spawn(runs+1)]
+        for run in range(runs):
+            tasks.append((list(values),N,engine,seeds[0],seeds[run+1],overrides))
+
+    return tasks
+
+def has_converged(accumulator,colnames,target_half_width,min_runs,level=0.95):
+
+    '''
+    Check whether enough runs have been made for a set of parameters in the adaptive mode of
+    simulate_and_save: at least min_runs runs, and the confidence interval (at the given level)
+    of the mean mating success of every tactic is at most target_half_width on either side of
+    the mean. Tactics that were absent from every run (e.g. bafflers when baffle_prop = 0) are ignored
+    '''
+
+    if accumulator.count[0] < min_runs:
+        return False
+
+    columns = [colnames.index(metric+'_mean') for metric in ['baffle_success','caller_success','silent_success']]
+    lower,upper = accumulator.confidence_interval(level)
+    half_width = (upper[columns] - lower[columns])/2
+    absent = accumulator.count[columns] == 0
+
+    return bool(np.all(absent | (half_width <= target_half_width)))
+
+def indexed_run_task(indexed_task,diagnostics=False):
+
+    '''
+    Run a task (see run_task) given as a tuple (index,task), and return (index,row of the output file)
+    '''
+
+    index,task = indexed_task
+    return index,run_task(task,diagnostics)
+
+def point_rows(params,runs,N,engine,pool,cores,stop=None,crn=False,overrides=None,diagnostics=False):
+
+    '''
+    Run the replicates of every set of parameters, and yield (index of the set of parameters,task,row
+    of the output file). pool is None to run everything in this process, or a pool of cores worker
+    processes. The replicates are run as tasks (see make_tasks and run_task) in both cases, so the rows
+    do not depend on the number of cores.
+    overrides is a dict of static parameters to change for all the runs (see Params.with_overrides).
+    If diagnostics is True, the values of DIAGNOSTIC_COLUMNS are appended to every row (see run_task).
+
+    If stop is None, all the replicates are run, and the rows are yielded in the order of the tasks. In
+    parallel, the workers receive the tasks in chunks (as in pool.imap), so they are never idle.
+
+    Otherwise, stop(point) is checked after every row of the set of parameters point that is yielded
+    (i.e. after the row has been dealt with), and no more replicates of that set of parameters are run once
+    it returns True. In parallel, the replicates of all the sets of parameters are interleaved (replicate 0
+    of every set of parameters, then replicate 1...) and run as soon as a worker is free, with no more than
+    2*cores tasks submitted at any time, so that the tasks of a set of parameters that has stopped are
+    not submitted at all. The rows of every set of parameters are yielded in the order of its replicates,
+    and the rows of replicates that finish after the stopping point are thrown away, so the rows that are
+    kept (and the number of runs used) do not depend on the number of cores (only the order in which the
+    rows of different sets of parameters are yielded does).
+    '''
+
+    tasks = make_tasks(params,runs,N,engine,crn,overrides)
+    task_runner = functools.partial(run_task,diagnostics=diagnostics)
+
+    if stop is None:
+        if pool is None:
+            rows = map(task_runner,tasks)
+        else:
+            rows = pool.imap(task_runner,tasks,chunksize=max(1,len(tasks)//(4*cores)))
+        for i,(task,row) in enumerate(zip(tasks,rows)):
+            yield i//runs,task,row
+        return
+
+    num_points = len(params)
+    done = [runs == 0]*num_points #whether each set of parameters has stopped
+    next_run = [0]*num_points #the next replicate of each set of parameters whose row is yielded
+    waiting = [{} for point in range(num_points)] #rows that finished before an earlier replicate, as {replicate:row}
+
+    #the order in which the tasks are submitted (with a single process, the sets of parameters are run one after the other)
+    if pool is None:
+        order = range(len(tasks))
+    else:
+        order = [point*runs + run for run in range(runs) for point in range(num_points)]
+
+    #number of tasks that may still be submitted before a row comes back
+    window = threading.Semaphore(2*cores)
+    finished = threading.Event()
+
+    def submitted_tasks():
+        #the tasks are taken from this generator as they are submitted (by the thread of the pool that hands them out)
+        for index in order:
+            window.acquire()
+            if finished.is_set():
+                return
+            if done[index//runs]:
+                window.release()
+                continue
+            yield index,tasks[index]
+
+    indexed_task_runner = functools.partial(indexed_run_task,diagnostics=diagnostics)
+    if pool is None:
+        results = map(indexed_task_runner,submitted_tasks())
+    else:
+        results = pool.imap_unordered(indexed_task_runner,submitted_tasks())
+
+    try:
+        for index,row in results:
+            window.release()
+            point,run = divmod(index,runs)
+            if done[point]:
+                continue
+            waiting[point][run] = row
+            while not done[point] and next_run[point] in waiting[point]:
+                run = next_run[point]
+                yield point,tasks[point*runs + run],waiting[point].pop(run)
+                next_run[point] += 1
+                done[point] = stop(point) or next_run[point] == runs
+            if done[point]:
+                waiting[point].clear()
+    finally:
+        #let the tasks that are not submitted yet go
+        finished.set()
+        window.release()
+
+def simulate_and_save(params,runs,N,cores,save_path,filename,engine='object',checkpoint_every=10,
+                      target_half_width=None,min_runs=10,level=0.95,crn=False,store_path=None,overrides=None,
+                      diagnostics=False):
+
+    '''
+    This function runs the model in parallel for a specified region in parameter space.
+    runs represents how many runs to average over.
+
+    Every replicate of every parameter set is a separate task (see make_tasks), with seeds derived
+    from numpy's global random state. With cores = 1, the tasks are run one after the other in this
+    process. Otherwise, they are spread over a pool of cores worker processes. Each worker receives the
+    tasks in chunks, and the results are collected in order, so the rows of the output file are the
+    same in both cases.
+
+    If target_half_width is given, the number of runs is chosen adaptively instead: replicates of
+    a set of parameters are run until the confidence interval (at the given level) of the mean
+    mating success of every tactic is at most target_half_width on either side of the mean (see
+    has_converged, with at least min_runs runs), and runs is the maximum number of runs. The sets of
+    parameters are then run side by side, so with several cores their rows may be interleaved in the
+    output file (see point_rows), but the rows that are kept do not depend on the number of cores.
+
+    With crn = True, replicate k of every set of parameters uses the same seeds (common random
+    numbers, see make_tasks), also with cores = 1. The replicate number and the seeds of every
+    run are then added as the last columns of the output file.
+
+    Every row is written to the output file as soon as it is available, and is added to the
+    Accumulator of its set of parameters (see class_accumulator). The accumulators are saved
+    to a checkpoint file after every checkpoint_every rows and at the end, so the mean and
+    confidence interval of every output variable of every set of parameters can be looked
+    at (using load_checkpoint) while the simulations are still running. At the end, the number
+    of runs used for every set of parameters and the mean and confidence interval of the mating
+    success of each tactic are saved to a summary file.
+
+    If store_path is given, the rows are appended to the ResultStore at store_path (see
+    class_result_store.py) instead of being written to an output file, in the same format as the
+    rows of a sweep over baffle_prop, density and prop_males (see run_sweep in set_up_sweep.py),
+    so that the results of many jobs can be kept in a single store. The rows are appended whenever
+    the checkpoint is saved.
+    overrides is a dict of static parameters (see static_params.py) to change for all the runs, e.g.
+    {'bush_dens':0} for the homogeneous habitat (see class_habitat.py). The changed parameters are
+    columns of the store, as in a sweep.
+    If diagnostics is True, the values of DIAGNOSTIC_COLUMNS of every run are written to a separate
+    diagnostics file, with the parameters and run number of the run (the output file is not changed).
+    Returns the list of accumulators (one per set of parameters).
+    '''
+
+    overrides = {} if overrides is None else dict(overrides)
+    run_params = DEFAULT_PARAMS.with_overrides(overrides)
+    colnames = output_columns()
+    accumulators = [Accumulator(len(colnames)) for values in params]
+
+    if target_half_width is None:
+        stop = None
+    else:
+        stop = lambda point: has_converged(accumulators[point],colnames,target_half_width,min_runs,level)
+
+    #run the replicates in parallel over specified number of cores
+    pool = mp.Pool(cores) if cores > 1 else None
+    rows = point_rows(params,runs,N,engine,pool,cores,stop,crn,overrides,diagnostics)
+
+    #replicate number and seeds of every run (only with common random numbers)
+    seed_colnames = ['replicate','landscape_seed','run_seed'] if crn else []
+
+    output_path = save_path+"output_"+str(N)+"_individuals_" + "array_"+str(filename)+".csv"
+    checkpoint_path = save_path+"checkpoint_"+str(N)+"_individuals_" + "array_"+str(filename)+".npz"
+    summary_path = save_path+"summary_"+str(N)+"_individuals_" + "array_"+str(filename)+".csv"
+    diagnostics_path = save_path+"diagnostics_"+str(N)+"_individuals_" + "array_"+str(filename)+".csv"
+    diagnostic_colnames = ['baffle_prop','density','prop_males','run'] + DIAGNOSTIC_COLUMNS
+
+    #rows that have not been appended to the store yet
+    store = None if store_path is None else ResultStore(store_path)
+    param_names = list(overrides) + ([] if 'bush_dens' in overrides else ['bush_dens'])
+    store_colnames = ['point','run'] + param_names + colnames + ['landscape_seed','run_seed','engine','run_time','code_version']
+    records = []
+
+    try:
+        with open(output_path,'w',newline='') if store is None else contextlib.nullcontext() as output_file, \
+             open(diagnostics_path,'w',newline='') if diagnostics else contextlib.nullcontext() as diagnostics_file:
+
+            #header of the output file
+            if store is None:
+                pd.DataFrame(columns=colnames+seed_colnames).to_csv(output_file)
+            if diagnostics:
+                pd.DataFrame(columns=diagnostic_colnames).to_csv(diagnostics_file)
+
+            for i,(point,task,row) in enumerate(rows):
+
+                if diagnostics:
+                    #the diagnostics go to their own file, the row of the output file is the same as without them
+                    row,diagnostic_values = row[:len(colnames)],row[len(colnames):]
+                    pd.DataFrame([list(params[point]) + [int(accumulators[point].count[0])] + list(diagnostic_values)],
+                                 columns=diagnostic_colnames,index=[i]).to_csv(diagnostics_file,header=False)
+                    diagnostics_file.flush()
+
+                if store is None:
+                    #save to file (in the same format as a DataFrame of all the rows)
+                    row_data = pd.DataFrame([row],columns=colnames,index=[i])
+                    if crn:
+                        row_data['replicate'] = int(accumulators[point].count[0])
+                        row_data['landscape_seed'] = task[3]
+                        row_data['run_seed'] = task[4]
+                    row_data.to_csv(output_file,header=False)
+                    output_file.flush()
+                else:
+                    key = point_key(dict(zip(['baffle_prop','density','prop_males'],params[point]),**overrides))
+                    records.append([key,int(accumulators[point].count[0])] + [getattr(run_params,name) for name in param_names] + list(row) + [task[3],task[4],engine,np.nan,code_version()])
+
+                accumulators[point].add(row)
+                if (i+1) % checkpoint_every == 0:
+                    if store is not None:
+                        store.append(typed_rows(records,store_colnames))
+                        records = []
+                    save_checkpoint(checkpoint_path,accumulators,colnames)
+
+        if store is not None:
+            store.append(typed_rows(records,store_colnames))
+    finally:
+        rows.close()
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    save_checkpoint(checkpoint_path,accumulators,colnames)
+
+    #number of runs used, and the mean mating success of each tactic with its confidence interval
+    summary = pd.DataFrame([list(values) for values in params],columns=['baffle_prop','density','prop_males'])
+    summary['runs'] = [int(accumulator.count[0]) for accumulator in accumulators]
+    if target_half_width is not None:
+        summary['converged'] = [has_converged(accumulator,colnames,target_half_width,min_runs,level) for accumulator in accumulators]
+    intervals = [accumulator.confidence_interval(level) for accumulator in accumulators]
+    for metric in ['baffle_success','caller_success','silent_success']:
+        column = colnames.index(metric+'_mean')
+        summary[metric+'_mean'] = [accumulator.mean[column] if accumulator.count[column] else np.nan for accumulator in accumulators]
+        summary[metric+'_ci_half_width'] = [(upper[column] - lower[column])/2 for lower,upper in intervals]
+    summary.to_csv(summary_path,index=False)
+
+    return accumulators
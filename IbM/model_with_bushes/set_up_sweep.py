@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 18:41:17
+Date last modified: 2026-10-18 18:41:17
+Purpose: This script sets up parameter sweeps, i.e. runs of the model over a whole grid of
+parameter values in a single program.
+
+Broad idea:
+A grid is a dict {parameter:list of values}. baffle_prop and density are required, prop_males
+(the sex ratio) is 0.5 unless given, and any other key is the name of a static parameter
+(see static_params.py, e.g. bush_dens or fem_mov_prop_across_bush) whose value is changed
+for the runs (see Params.with_overrides in class_params.py). Every combination of values is a point of the sweep.
+A sweep can also be made of a list of grids (e.g. the scenarios in scenarios.py), in which case its points are
+the points of all the grids, and a static parameter that is not in a grid has its default value in the points of that grid.
+All the replicates of all the points are run as tasks (see run_task in set_up_parallelization.py)
+on a pool of worker processes, and the rows of every point are appended to a single result store
+(see class_result_store.py) as soon as all the runs of the point are done. Every point is identified
+by a key computed from its parameter values, so when a sweep is started again with the same store,
+the points that already have all their runs in the store are skipped (and only the missing runs are
+run for points that have fewer, e.g. when the number of runs is increased).
+'''
+
+import os
+import time
+import json
+import itertools
+import numpy as np
+import multiprocessing as mp
+from set_up_parallelization import run_task, output_columns
+from class_result_store import ResultStore, typed_rows, point_key, code_version
+from class_params import DEFAULT_PARAMS, check_overrides
+from class_cost_model import CostModel, lpt_makespan
+from class_result_cache import ResultCache
+from typing import NamedTuple
+
+#the parameters that every grid has (with their default values, if any)
+GRID_AXES = {'baffle_prop':None,'density':None,'prop_males':[0.5]}
+
+#the parameters of a point that its landscape depends on (see landscape_key in set_up_parallelization.py)
+LANDSCAPE_PARAMS = ['density','bush_dens','bush_size_mean','bush_size_sd','threshold_bush_dist']
+
+class SweepReport(NamedTuple):
+
+    '''
+    What run_sweep did: the number of points and tasks that were run, the makespan (the time
+    from the start of the first task to the end of the last one, in seconds) predicted by the
+    cost model, the actual makespan, and the number of tasks that were loaded from the cache
+    instead of being run
+    '''
+
+    points: int
+    tasks: int
+    predicted_makespan: float
+    actual_makespan: float
+    cached_tasks: int = 0
+
+def load_grid(path):
+
+    '''
+    Read a grid (or a list of grids) from a .json file, e.g. {"baffle_prop":[0,0.5,1],"density":[1,2],"bush_dens":[1.625,3.25]}
+    '''
+
+    with open(path) as grid_file:
+        return json.load(grid_file)
+
+def expand_grid(grid):
+
+    '''
+    Returns the list of points of a grid (or of a list of grids, see the description of this script),
+    each of which is a dict {parameter:value} (with the parameters in GRID_AXES first, then the static
+    parameters in the order of the grid). Points that are in more than one grid are only listed once
+    '''
+
+    if isinstance(grid,dict):
+        return grid_points(grid)
+
+    points = [point for single_grid in grid for point in grid_points(single_grid)]
+    names = list(dict.fromkeys(name for point in points for name in point))
+
+    unique_points = {}
+    for point in points:
+        point = {name:point.get(name,getattr(DEFAULT_PARAMS,name,None)) for name in names}
+        unique_points.setdefault(point_key(point),point)
+
+    return list(unique_points.values())
+
+def grid_points(grid):
+
+    '''
+    Returns the list of points of a single grid (see expand_grid)
+    '''
+
+    grid = {name:(values if isinstance(values,list) else [values]) for name,values in grid.items()}
+
+    axes = {}
+    for name,default in GRID_AXES.items():
+        if name in grid:
+            axes[name] = grid[name]
+        elif default is not None:
+            axes[name] = default
+        else:
+            raise ValueError("The grid has no values of "+name)
+
+    overrides = {name:values for name,values in grid.items() if name not in GRID_AXES}
+    check_overrides(overrides)
+    axes.update(overrides)
+
+    return [dict(zip(axes,point)) for point in itertools.product(*axes.values())]
+
+def landscape_point(point):
+
+    '''
+    The parameters of a point that its landscape depends on (see landscape_key in set_up_parallelization.py)
+    '''
+
+    return {name:point.get(name,getattr(DEFAULT_PARAMS,name,None)) for name in LANDSCAPE_PARAMS}
+
+def point_tasks(point,runs,N,engine,seed,crn=False,share_landscapes=False):
+
+    '''
+    The tasks (see run_task) of all the replicates of a point. Their seeds are derived from the seed of
+    the sweep and from the key of the point, so they do not depend on which other points are in the sweep.
+    As in make_tasks (see set_up_parallelization.py), all the replicates of a point share a landscape seed,
+    unless crn is True, in which case replicate k of every point gets the same seeds (common random numbers).
+    With share_landscapes = True, the landscape seed is instead derived from the parameters that the landscape
+    depends on (see landscape_point), so all the points with the same density and bushes (e.g. the same point in
+    different scenarios, or points with different baffle_prop) are run on the same landscape, which every worker
+    process then makes only once (see run_task). The run seeds are not changed.
+    '''
+
+    values = [point['baffle_prop'],point['density'],point['prop_males']]
+    overrides = {name:value for name,value in point.items() if name not in GRID_AXES}
+
+    if crn:
+        seeds = [[int(seed) for seed in replicate_seed.generate_state(2)] for replicate_seed in np.random.SeedSequence(seed).spawn(runs)]
+        return [(values,N,engine,landscape_seed,run_seed,overrides) for landscape_seed,run_seed in seeds]
+
+    point_seed = np.random.SeedSequence(seed,spawn_key=(int(point_key(point),16),))
+    seeds = [int(child.generate_state(1)[0]) for child in point_seed.spawn(runs+1)]
+
+    if share_landscapes:
+        landscape_seed = np.random.SeedSequence(seed,spawn_key=(int(point_key(landscape_point(point)),16),))
+        seeds[0] = int(landscape_seed.spawn(1)[0].generate_state(1)[0])
+
+    return [(values,N,engine,seeds[0],seeds[run+1],overrides) for run in range(runs)]
+
+def shard_points(points,shard_index,shard_count):
+
+    '''
+    The points that belong to shard shard_index (0 to shard_count-1) when a sweep is split into
+    shard_count shards, e.g. over the tasks of an array job on a cluster. Points are dealt out to
+    the shards in turn, so that every shard gets points from all over the grid (points that are
+    next to each other in the grid usually take about as long to run), and the numbers of points
+    of any two shards differ by at most one.
+    '''
+
+    if not 0 <= shard_index < shard_count:
+        raise ValueError("Shard index "+str(shard_index)+" is not between 0 and "+str(shard_count-1))
+
+    return points[shard_index::shard_count]
+
+def shard_from_environment(environ=os.environ):
+
+    '''
+    The (shard index,shard count) of this program when it is a task of a SLURM array job,
+    from the SLURM_ARRAY_TASK_ID, SLURM_ARRAY_TASK_MIN and SLURM_ARRAY_TASK_COUNT environment
+    variables (so that e.g. --array=1-20 gives shards 0 to 19 out of 20). Returns None if this
+    is not an array job.
+    '''
+
+    if 'SLURM_ARRAY_TASK_ID' not in environ:
+        return None
+
+    task_id = int(environ['SLURM_ARRAY_TASK_ID'])
+    task_min = int(environ.get('SLURM_ARRAY_TASK_MIN',0))
+    if 'SLURM_ARRAY_TASK_COUNT' in environ:
+        task_count = int(environ['SLURM_ARRAY_TASK_COUNT'])
+    else:
+        task_count = int(environ['SLURM_ARRAY_TASK_MAX']) - task_min + 1
+
+    return task_id - task_min,task_count
+
+def combine_stores(store_paths,output_path):
+
+    '''
+    Combine the result stores of the shards of a sweep into a single store at output_path (the rows
+    are appended to it if it already exists). Shards that write to the same Parquet store do not
+    need to be combined.
+    '''
+
+    stores = [ResultStore(path) for path in store_paths]
+    output = ResultStore(output_path)
+    columns = [sorted(store.columns()) for store in stores + ([output] if output.exists() else [])]
+    if any(names != columns[0] for names in columns):
+        raise ValueError("The stores do not have the same columns")
+
+    #the rows are appended with the columns in the same order as in the first store
+    order = (output if output.exists() else stores[0]).columns()
+    for store in stores:
+        output.append(typed_rows(store.read()[order],order))
+
+def timed_run_task(indexed_task):
+
+    '''
+    Run a task (see run_task) and measure how long it takes. indexed_task is a tuple (index,task),
+    and (index,row of the output,run time in seconds) is returned, so that the results of tasks
+    that finish in any order can be matched to their tasks
+    '''
+
+    index,task = indexed_task
+
+    start = time.perf_counter()
+    row = run_task(task)
+
+    return index,row,time.perf_counter() - start
+
+def stored_runs(store,columns):
+
+    '''
+    Number of runs of every point that are already in a ResultStore, as a dict {key of the point:runs}.
+    Only whole points are ever written to a store, so runs 0 to runs-1 of these points are done
+    '''
+
+    if store.exists() and sorted(store.columns()) != sorted(columns):
+        raise ValueError("The columns of "+store.path+" do not match this sweep (use a new store for a different grid)")
+
+    return store.point_counts().to_dict()
+
+def run_sweep(grid,runs,N,cores,store_path,engine='object',seed=None,crn=False,shard_index=0,shard_count=1,timing_paths=(),cache_path=None,
+              share_landscapes=False):
+
+    '''
+    Run runs replicates (with N individuals each) of every point of a grid or list of grids (see expand_grid) over
+    a pool of cores worker processes (everything runs in this process if cores = 1), and append the
+    results to the ResultStore at store_path. Each row of the store holds the key of its point, the
+    number of the run, the static parameters of the point (always including bush_dens, by which the
+    store is partitioned), the output of the run (see single_run), the seeds of the run, the engine,
+    the run time and the version of the code. The rows of a point are appended to the store together,
+    once all its runs are done, so points that are already in the store are skipped (see stored_runs).
+
+    Run times differ a lot between points, so the run time of every task is predicted by a CostModel
+    fitted to the run times recorded in the store and in the stores at timing_paths (e.g. of earlier
+    sweeps). The tasks are handed out one at a time, longest first, to whichever worker is free
+    (longest processing time first scheduling), so that the longest tasks do not end up running
+    alone at the end of the sweep. Points are therefore stored in the order in which they are completed.
+    seed is the seed of the sweep (drawn from numpy's global random state if it is not given), and
+    crn switches on common random numbers, and share_landscapes makes all the points with the same density
+    and bushes share a landscape (see point_tasks).
+    With shard_count > 1, only the points of shard shard_index are run (see shard_points). Since the
+    seeds of a point do not depend on the other points, the results are the same however the sweep is
+    split, as long as every shard is given the same seed.
+    If cache_path is given, every run is also saved in the ResultCache at cache_path, and runs that
+    are already in it (e.g. from an earlier sweep with an overlapping grid, or with the same grid but
+    a new store) are loaded instead of being run, as long as the code of the model has not changed.
+    Returns a SweepReport.
+    '''
+
+    grid_points = expand_grid(grid)
+    override_names = [name for name in grid_points[0] if name not in GRID_AXES]
+    param_names = override_names + ([] if 'bush_dens' in override_names else ['bush_dens'])
+    points = shard_points(grid_points,shard_index,shard_count)
+    columns = ['point','run'] + param_names + output_columns() + ['landscape_seed','run_seed','engine','run_time','code_version']
+
+    if seed is None:
+        seed = int(np.random.randint(0,2**32,dtype=np.int64))
+
+    store = ResultStore(store_path)
+    done = stored_runs(store,columns)
+    pending = [point for point in points if done.get(point_key(point),0) < runs]
+
+    #one task per replicate of every point that still needs to be run
+    labels = []
+    tasks = []
+    for point in pending:
+        values = [point.get(name,getattr(DEFAULT_PARAMS,name)) for name in param_names]
+        for run,task in enumerate(point_tasks(point,runs,N,engine,seed,crn,share_landscapes)):
+            if run >= done.get(point_key(point),0):
+                labels.append([point_key(point),run] + values)
+                tasks.append(task)
+
+    #runs that are in the cache are loaded, with the run times they took when they were made
+    cache = None if cache_path is None else ResultCache(cache_path)
+    cached = []
+    to_run = []
+    for index,task in enumerate(tasks):
+        entry = None if cache is None else cache.get(task)
+        if entry is None:
+            to_run.append(index)
+        else:
+            cached.append((index,) + entry)
+    loaded = {index for index,row,run_time in cached}
+
+    #longest tasks first, according to the predicted run times
+    cost_model = CostModel().fit_stores([store.path] + list(timing_paths))
+    predicted_makespan,order = lpt_makespan(cost_model.predict([tasks[index] for index in to_run]),cores)
+    indexed_tasks = [(to_run[index],tasks[to_run[index]]) for index in order]
+
+    start = time.perf_counter()
+    if cores > 1:
+        #every worker takes the next task as soon as it is free
+        pool = mp.Pool(cores)
+        results = pool.imap_unordered(timed_run_task,indexed_tasks,chunksize=1)
+    else:
+        pool = None
+        results = map(timed_run_task,indexed_tasks)
+
+    #rows of the points that are not complete yet, and the number of rows that each of them still needs
+    waiting = {}
+    missing = {}
+    for label in labels:
+        missing[label[0]] = missing.get(label[0],0) + 1
+
+    try:
+        for index,row,run_time in itertools.chain(cached,results):
+            task = tasks[index]
+            if cache is not None and index not in loaded:
+                cache.put(task,row,run_time)
+            key = labels[index][0]
+            waiting.setdefault(key,[]).append(labels[index] + list(row) + [task[3],task[4],engine,run_time,code_version()])
+            missing[key] -= 1
+            if missing[key] == 0:
+                store.append(typed_rows(sorted(waiting.pop(key),key=lambda record:record[1]),columns))
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    return SweepReport(len(pending),len(tasks),predicted_makespan,time.perf_counter() - start,len(cached))
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 16:58:21
+Date last modified: 2026-10-18 16:58:21
+Purpose: Summary statistics of a run of the model (the 'output' of the Model and
+ArrayModel classes, see get_mate_counts).
+
+Broad idea:
+Every individual has a number of metrics (matings, call effort, steps taken, distance moved...),
+and the output of a run is a set of statistics (mean, sd, kurtosis, skew, min, max, median) of
+each metric over all the individuals of a given tactic (bafflers, callers, silent males, females).
+Instead of building a separate list for every (tactic,metric) pair and reducing each list
+separately, the metrics of all the individuals are stored in one 2-D array (one row per
+individual, one column per metric) together with the tactic of every individual. The rows are
+sorted by tactic once, and every moment of every (tactic,metric) pair is then computed together
+using grouped reductions. Tactics without any individuals (e.g. bafflers when baffle_prop = 0)
+give NaN.
+'''
+
+import numpy as np
+from typing import NamedTuple
+
+#the statistics that are reported for every metric, in the order of the output columns
+STATISTICS = ['mean','sd','kurtosis','skew','min','max','median']
+
+#the metrics that are reported, in the order of the output columns
+METRICS = ['baffle_success','caller_success','silent_success','total_male_success','total_female_success',
+           'baffle_call_effort','baffle_within_bush_steps','baffle_within_bush_distance','baffle_across_bush_steps','baffle_across_bush_distance','baffle_total_steps','baffle_total_distance',
+           'caller_call_effort','caller_within_bush_steps','caller_within_bush_distance','caller_across_bush_steps','caller_across_bush_distance','caller_total_steps','caller_total_distance',
+           'silent_call_effort','silent_within_bush_steps','silent_within_bush_distance','silent_across_bush_steps','silent_across_bush_distance','silent_total_steps','silent_total_distance',
+           'female_within_bush_random_steps','female_within_bush_random_distance',
+           'female_across_bush_random_steps','female_across_bush_random_distance',
+           'female_within_bush_phonotaxis_steps','female_within_bush_phonotaxis_distance',
+           'female_across_bush_phonotaxis_steps','female_across_bush_phonotaxis_distance',
+           'female_within_bush_total_steps','female_within_bush_total_distance',
+           'female_across_bush_total_steps','female_across_bush_total_distance',
+           'female_total_steps','female_total_distance']
+
+#the groups of individuals for which the proportion that obtained mates is reported
+MATED_GROUPS = ['baffle','caller','silent','total_male','total_female']
+
+#tactics of the males (the values of the tactic argument of mate_counts)
+BAFFLER = 0
+CALLER = 1
+SILENT = 2
+NUM_TACTICS = 3
+
+class MateCounts(NamedTuple):
+
+    '''
+    The output of a run of the model. Every field except proportion_mated holds the
+    statistic for every metric in METRICS (in that order), and proportion_mated holds the
+    proportion of individuals of every group in MATED_GROUPS that obtained at least one mate
+    '''
+
+    mean: np.ndarray
+    sd: np.ndarray
+    kurtosis: np.ndarray
+    skew: np.ndarray
+    min: np.ndarray
+    max: np.ndarray
+    median: np.ndarray
+    proportion_mated: np.ndarray
+
+    def as_row(self):
+
+        '''
+        All the values as a single array, in the order of the columns of the output file
+        '''
+
+        return np.concatenate(self)
+
+def column_names():
+
+    '''
+    Names of the output columns of a run (see MateCounts.as_row)
+    '''
+
+    colnames = [metric+'_'+stat_type for stat_type in STATISTICS for metric in METRICS]
+    colnames += [group+'_proportion_mated' for group in MATED_GROUPS]
+
+    return colnames
+
+def grouped_statistics(values,groups,num_groups):
+
+    '''
+    Compute every statistic in STATISTICS for every column of values (a 2-D array with one row
+    per individual) over the rows of each group. groups holds the group (0 to num_groups-1)
+    of every row. Returns a dict {stat_type:array of shape (num_groups,number of columns)}.
+    As in np.std, scipy.stats.kurtosis and scipy.stats.skew, the moments are not corrected
+    for bias, and the kurtosis and skew of a group whose values are all equal are NaN.
+    '''
+
+    values = np.asarray(values,dtype=float)
+    num_cols = values.shape[1]
+
+    #sort the rows by group, so that every group is a contiguous block of rows
+    order = np.argsort(groups,kind='stable')
+    values = values[order]
+    counts = np.bincount(groups,minlength=num_groups)
+    ends = np.cumsum(counts)
+    starts = ends - counts
+
+    #empty groups stay NaN
+    output = {stat_type:np.full((num_groups,num_cols),np.nan) for stat_type in STATISTICS}
+    present = np.flatnonzero(counts)
+    if len(present) == 0:
+        return output
+
+    n = counts[present,None]
+    group_of_row = np.repeat(np.arange(len(present)),counts[present])
+
+    #central moments of every group
+    mean = np.add.reduceat(values,starts[present],axis=0)/n
+    deviation = values - mean[group_of_row]
+    squares = deviation*deviation
+    m2 = np.add.reduceat(squares,starts[present],axis=0)/n
+    m3 = np.add.reduceat(squares*deviation,starts[present],axis=0)/n
+    m4 = np.add.reduceat(squares*squares,starts[present],axis=0)/n
+
+    with np.errstate(all='ignore'):
+        zero = m2 <= (np.finfo(float).eps*mean)**2
+        output['skew'][present] = np.where(zero,np.nan,m3/m2**1.5)
+        output['kurtosis'][present] = np.where(zero,np.nan,m4/m2**2 - 3)
+    output['mean'][present] = mean
+    output['sd'][present] = np.sqrt(m2)
+
+    #order statistics of every group, from its sorted block of rows
+    for group in present:
+        block = np.sort(values[starts[group]:ends[group]],axis=0)
+        half = counts[group]//2
+        output['min'][group] = block[0]
+        output['max'][group] = block[-1]
+        if counts[group] % 2:
+            output['median'][group] = block[half]
+        else:
+            output['median'][group] = (block[half-1] + block[half])/2
+
+    return output
+
+def mate_counts(male_metrics,tactic,female_metrics):
+
+    '''
+    Compute the output of a run of the model (a MateCounts record).
+    male_metrics has one row per male, with the columns (mated count, call effort, within bush steps,
+    within bush distance, across bush steps, across bush distance), and tactic holds the tactic
+    (BAFFLER, CALLER or SILENT) of every male.
+    female_metrics has one row per female, with the columns (mated count, within bush steps,
+    within bush distance, across bush steps, across bush distance, within bush phonotaxis steps,
+    within bush phonotaxis distance, across bush phonotaxis steps, across bush phonotaxis distance)
+    '''
+
+    male_metrics = np.asarray(male_metrics,dtype=float).reshape(-1,6)
+    female_metrics = np.asarray(female_metrics,dtype=float).reshape(-1,9)
+    tactic = np.asarray(tactic,dtype=np.int64)
+
+    #add the totals to the metrics of the males
+    males = np.column_stack((male_metrics,male_metrics[:,2]+male_metrics[:,4],male_metrics[:,3]+male_metrics[:,5]))
+
+    #add the totals to the metrics of the females
+    random_steps = female_metrics[:,1:5]
+    phonotaxis_steps = female_metrics[:,5:9]
+    within_total = random_steps[:,0:2] + phonotaxis_steps[:,0:2]
+    across_total = random_steps[:,2:4] + phonotaxis_steps[:,2:4]
+    females = np.column_stack((female_metrics,within_total,across_total,within_total+across_total))
+
+    #mated count of all the males is its own group. The rows of the males are therefore used twice:
+    #once grouped by tactic (groups 0 to 2) and once all together (group 3)
+    all_males = np.full(len(tactic),NUM_TACTICS)
+    male_stats = grouped_statistics(np.concatenate((males,males)),np.concatenate((tactic,all_males)),NUM_TACTICS+1)
+    female_stats = grouped_statistics(females,np.zeros(len(females),dtype=np.int64),1)
+
+    #arrange in the order of METRICS
+    output = {}
+    for stat_type in STATISTICS:
+        male_stat = male_stats[stat_type]
+        female_stat = female_stats[stat_type]
+        output[stat_type] = np.concatenate((male_stat[:,0],female_stat[:,0],male_stat[:NUM_TACTICS,1:].flatten(),female_stat[0,1:]))
+
+    #proportion of inds who obtained mates
+    mated = np.concatenate((males[:,0] > 0,males[:,0] > 0,females[:,0] > 0))
+    groups = np.concatenate((tactic,all_males,np.full(len(females),NUM_TACTICS+1)))
+    num_inds = np.bincount(groups,minlength=NUM_TACTICS+2)
+    with np.errstate(all='ignore'):
+        output['proportion_mated'] = np.bincount(groups,weights=mated,minlength=NUM_TACTICS+2)/np.where(num_inds > 0,num_inds,np.nan)
+
+    return MateCounts(**output)
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 23:05:10
+Date last modified: 2026-10-18 23:05:10
+Purpose: Lets the tests import the modules of the model, which are run as scripts from
+model_with_bushes rather than installed as a package. Run the tests with
+python -m pytest tests from model_with_bushes.
+'''
+
+import os
+import sys
+
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
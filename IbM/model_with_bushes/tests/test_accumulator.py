@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 23:05:10
+Date last modified: 2026-10-18 23:05:10
+Purpose: Tests that the moments kept by an Accumulator (class_accumulator.py), row by row and
+after merging, match those that numpy and scipy compute from all the rows at once.
+'''
+
+import numpy as np
+import scipy.stats as st
+from class_accumulator import Accumulator, save_checkpoint, load_checkpoint
+
+def random_rows(seed,num_rows=200,num_columns=5):
+    rng = np.random.default_rng(seed)
+    rows = rng.lognormal(0,1,size=(num_rows,num_columns))
+    #some NaN values, as in the columns of tactics that are absent from a run
+    rows[rng.random(rows.shape) < 0.1] = np.nan
+    return rows
+
+def accumulate(rows):
+    accumulator = Accumulator(rows.shape[1])
+    for row in rows:
+        accumulator.add(row)
+    return accumulator
+
+def assert_matches(accumulator,rows):
+    for column in range(rows.shape[1]):
+        values = rows[:,column][~np.isnan(rows[:,column])]
+        assert accumulator.count[column] == len(values)
+        np.testing.assert_allclose(accumulator.mean[column],np.mean(values),rtol=1e-12)
+        np.testing.assert_allclose(accumulator.sd()[column],np.std(values,ddof=1),rtol=1e-10)
+        np.testing.assert_allclose(accumulator.skew()[column],st.skew(values),rtol=1e-9)
+        np.testing.assert_allclose(accumulator.kurtosis()[column],st.kurtosis(values),rtol=1e-9)
+        assert accumulator.min[column] == np.min(values)
+        assert accumulator.max[column] == np.max(values)
+
+def test_add_matches_numpy_and_scipy():
+    rows = random_rows(1)
+
+    assert_matches(accumulate(rows),rows)
+
+def test_merge_matches_numpy_and_scipy():
+    rows = random_rows(2)
+
+    #batches of different sizes, including an empty one
+    accumulator = Accumulator(rows.shape[1])
+    for batch in np.split(rows,[0,7,120]):
+        accumulator.merge(accumulate(batch))
+
+    assert_matches(accumulator,rows)
+
+def test_confidence_interval():
+    rows = random_rows(3)
+    accumulator = accumulate(rows)
+
+    lower,upper = accumulator.confidence_interval()
+
+    values = rows[:,0][~np.isnan(rows[:,0])]
+    expected = st.t.interval(0.95,len(values)-1,loc=np.mean(values),scale=st.sem(values))
+    np.testing.assert_allclose([lower[0],upper[0]],expected,rtol=1e-10)
+
+def test_checkpoint_round_trip(tmp_path):
+    rows = random_rows(4)
+    accumulators = [accumulate(rows[:100]),accumulate(rows[100:])]
+    colnames = ['column_'+str(column) for column in range(rows.shape[1])]
+    path = str(tmp_path/'checkpoint.npz')
+
+    save_checkpoint(path,accumulators,colnames)
+    loaded,loaded_colnames = load_checkpoint(path)
+
+    assert list(loaded_colnames) == colnames
+    assert len(loaded) == len(accumulators)
+    for loaded_accumulator,accumulator in zip(loaded,accumulators):
+        for name,values in accumulator.state().items():
+            np.testing.assert_array_equal(loaded_accumulator.state()[name],values)
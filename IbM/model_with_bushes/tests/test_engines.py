@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 23:05:10
+Date last modified: 2026-10-18 23:05:10
+Purpose: Tests that the object version of the model (class_model.py) and the NumPy version
+(class_array_model.py) give the same row of the output for the same task, in both habitats.
+'''
+
+import numpy as np
+import pytest
+from set_up_parallelization import run_task, output_columns
+
+#(baffle_prop,density,prop_males) of the tasks
+VALUES = [[0.5,1,0.5],[0.2,2,0.5]]
+
+#bush_dens = 0 denotes the homogeneous habitat
+HABITATS = [{},{'bush_dens':0}]
+
+@pytest.mark.parametrize('values',VALUES)
+@pytest.mark.parametrize('overrides',HABITATS)
+@pytest.mark.parametrize('seeds',[(1,2),(3,4)])
+def test_engines_give_the_same_row(values,overrides,seeds):
+    landscape_seed,run_seed = seeds
+
+    rows = [run_task((values,40,engine,landscape_seed,run_seed,overrides)) for engine in ['object','array']]
+
+    assert len(rows[0]) == len(output_columns())
+    #the two engines sum the same values in a different order, so the higher moments can differ in the last bits
+    np.testing.assert_allclose(rows[1],rows[0],rtol=1e-9,atol=1e-12,equal_nan=True)
+
+def test_seeded_task_is_reproducible():
+    task = (VALUES[0],40,'array',5,6,{})
+
+    np.testing.assert_array_equal(run_task(task),run_task(task))
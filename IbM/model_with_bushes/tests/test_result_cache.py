@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 23:05:10
+Date last modified: 2026-10-18 23:05:10
+Purpose: Tests that a ResultCache (class_result_cache.py) returns a run exactly when the same
+task has been saved with the same code of the model, and misses it when the task, a static
+parameter or the code of the modules in MODEL_MODULES changes.
+'''
+
+import os
+import shutil
+import numpy as np
+import pytest
+import class_result_cache
+import static_params
+from class_result_cache import ResultCache, task_key
+
+TASK = ([0.5,1,0.5],40,'array',1,2,{})
+
+@pytest.fixture
+def model_copy(tmp_path,monkeypatch):
+    #a copy of the modules of the model, whose source can be changed without changing the repository
+    model_dir = os.path.dirname(os.path.abspath(static_params.__file__))
+    copy_dir = tmp_path/'model'
+    copy_dir.mkdir()
+    for module in class_result_cache.MODEL_MODULES:
+        shutil.copy(os.path.join(model_dir,module+'.py'),copy_dir)
+
+    monkeypatch.setattr(static_params,'__file__',str(copy_dir/'static_params.py'))
+    monkeypatch.setattr(class_result_cache,'_model_version',None)
+    return copy_dir
+
+def changed_version(monkeypatch):
+    #the version of the model is computed once per process, so it has to be reset to see a change
+    monkeypatch.setattr(class_result_cache,'_model_version',None)
+
+def test_hit_and_miss(tmp_path,model_copy):
+    cache = ResultCache(str(tmp_path/'cache'))
+    row = np.arange(5,dtype=float)
+
+    assert cache.get(TASK) is None
+    cache.put(TASK,row,1.5)
+
+    cached_row,run_time = cache.get(TASK)
+    np.testing.assert_array_equal(cached_row,row)
+    assert run_time == 1.5
+
+    #another seed, or another value of a static parameter, is another run
+    assert cache.get(TASK[:4] + (3,{})) is None
+    assert cache.get(TASK[:5] + ({'bush_dens':0},)) is None
+
+def test_change_to_model_module_misses(tmp_path,model_copy,monkeypatch):
+    cache = ResultCache(str(tmp_path/'cache'))
+    cache.put(TASK,np.zeros(3),1.0)
+    key = task_key(TASK)
+
+    with open(model_copy/'class_habitat.py','a') as source:
+        source.write('\n#a change to the model\n')
+    changed_version(monkeypatch)
+
+    assert task_key(TASK) != key
+    assert cache.get(TASK) is None
+
+def test_change_to_module_list_misses(tmp_path,model_copy,monkeypatch):
+    cache = ResultCache(str(tmp_path/'cache'))
+    cache.put(TASK,np.zeros(3),1.0)
+
+    #a module that a run starts to depend on
+    shutil.copy(os.path.join(os.path.dirname(os.path.abspath(class_result_cache.__file__)),'scenarios.py'),model_copy)
+    monkeypatch.setattr(class_result_cache,'MODEL_MODULES',class_result_cache.MODEL_MODULES + ['scenarios'])
+    changed_version(monkeypatch)
+
+    assert cache.get(TASK) is None
+
+def test_change_to_other_module_hits(tmp_path,model_copy,monkeypatch):
+    cache = ResultCache(str(tmp_path/'cache'))
+    cache.put(TASK,np.zeros(3),1.0)
+
+    #modules that a run does not execute are not part of the version of the model
+    (model_copy/'scenarios.py').write_text('#not a module of the model\n')
+    changed_version(monkeypatch)
+
+    assert cache.get(TASK) is not None
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 23:05:10
+Date last modified: 2026-10-18 23:05:10
+Purpose: Tests that the rows appended to a ResultStore (class_result_store.py) are read back
+unchanged with every backend, with and without filters.
+'''
+
+import numpy as np
+import pandas as pd
+import pytest
+from class_result_store import ResultStore, point_key, typed_rows
+
+COLUMNS = ['point','run','engine','code_version','landscape_seed','run_seed','bush_dens','density','baffle_prop','baffle_success_mean']
+
+#the module that every backend needs (None if it needs none)
+BACKENDS = {'parquet':'pyarrow.parquet','hdf5':'tables','csv':None}
+
+def make_rows(bush_dens,first_run,runs):
+    rng = np.random.default_rng(first_run)
+    records = []
+    for baffle_prop in [0,0.5]:
+        point = {'baffle_prop':baffle_prop,'density':1,'bush_dens':bush_dens}
+        for run in range(first_run,first_run+runs):
+            records.append([point_key(point),run,'array','abc1234',int(rng.integers(2**32)),int(rng.integers(2**32)),
+                            bush_dens,1.0,baffle_prop,rng.random()])
+    return typed_rows(records,COLUMNS)
+
+def sorted_rows(rows):
+    return rows[COLUMNS].sort_values(['point','run']).reset_index(drop=True)
+
+@pytest.fixture(params=list(BACKENDS))
+def store(request,tmp_path):
+    if BACKENDS[request.param] is not None:
+        pytest.importorskip(BACKENDS[request.param])
+    return ResultStore(str(tmp_path/'results'),backend=request.param)
+
+def test_append_and_read(store):
+    assert not store.exists()
+    assert len(store.read()) == 0
+
+    #two appends, the second to a partition that is already in the store and to a new one
+    first = make_rows(1.625,0,3)
+    second = pd.concat([make_rows(1.625,3,2),make_rows(0,0,2)],ignore_index=True)
+    store.append(first)
+    store.append(second)
+
+    expected = sorted_rows(pd.concat([first,second],ignore_index=True))
+    pd.testing.assert_frame_equal(sorted_rows(store.read()),expected,check_dtype=False)
+    assert sorted(store.columns()) == sorted(COLUMNS)
+
+    counts = store.point_counts()
+    assert counts.sum() == len(expected)
+    assert counts[point_key({'baffle_prop':0.5,'density':1,'bush_dens':1.625})] == 5
+
+def test_read_with_filters(store):
+    rows = pd.concat([make_rows(1.625,0,3),make_rows(0,0,3)],ignore_index=True)
+    store.append(rows)
+
+    filters = [('bush_dens','==',0),('baffle_prop','>',0),('run','in',[0,2])]
+    read = store.read(filters=filters,columns=['point','run','baffle_success_mean'])
+
+    expected = rows[(rows['bush_dens'] == 0) & (rows['baffle_prop'] > 0) & rows['run'].isin([0,2])]
+    assert list(read.columns) == ['point','run','baffle_success_mean']
+    pd.testing.assert_frame_equal(read.sort_values('run').reset_index(drop=True),
+                                  expected[['point','run','baffle_success_mean']].sort_values('run').reset_index(drop=True),
+                                  check_dtype=False)
+
+def test_unknown_operator(store):
+    with pytest.raises(ValueError):
+        store.read(filters=[('run','~',1)])
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 23:05:10
+Date last modified: 2026-10-18 23:05:10
+Purpose: Tests that conditional_lognormal (sampling.py) draws from the same distribution as the
+rejection sampling loop it replaces (redrawing from the lognormal distribution until the value
+is at least the lower bound).
+'''
+
+import numpy as np
+import pytest
+import scipy.stats as st
+from sampling import conditional_lognormal
+
+MEAN = 2.1
+SD = 0.82
+
+def rejection_sample(rng,lower,size):
+    draws = rng.lognormal(MEAN,SD,size=200*size)
+    return draws[draws >= lower][:size]
+
+@pytest.mark.parametrize('lower',[1,10,60])
+def test_matches_rejection_sampling(lower):
+    rng = np.random.default_rng(lower)
+    expected = rejection_sample(rng,lower,5000)
+    assert len(expected) == 5000
+
+    cut_off,legacy_iterations = conditional_lognormal(MEAN,SD,np.full(5000,lower),rng.random(5000))
+
+    assert np.all(cut_off >= lower)
+    assert st.ks_2samp(cut_off,expected).pvalue > 0.001
+    np.testing.assert_allclose(legacy_iterations,1/st.lognorm.sf(lower,SD,scale=np.exp(MEAN)),rtol=1e-10)
+
+def test_far_lower_bound():
+    #a lower bound so far in the tail that rejection sampling would never finish
+    cut_off,legacy_iterations = conditional_lognormal(MEAN,SD,[1e5],[0.5])
+
+    assert np.isfinite(cut_off[0]) and cut_off[0] >= 1e5
+    assert legacy_iterations[0] > 1e20
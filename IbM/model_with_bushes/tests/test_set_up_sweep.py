@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 23:05:10
+Date last modified: 2026-10-18 23:05:10
+Purpose: Tests how a sweep (set_up_sweep.py) expands its grid into points, splits them into shards,
+and derives the seeds of the tasks of every point.
+'''
+
+import pytest
+from class_result_store import point_key
+from set_up_sweep import expand_grid, point_tasks, shard_from_environment, shard_points
+
+GRID = {'baffle_prop':[0,0.5,1],'density':[0.5,1],'bush_dens':[0,1.625]}
+
+def test_expand_grid():
+    points = expand_grid(GRID)
+
+    assert len(points) == 12
+    assert points[0] == {'baffle_prop':0,'density':0.5,'prop_males':0.5,'bush_dens':0}
+
+    #points that are in more than one grid are listed once
+    assert len(expand_grid([GRID,{'baffle_prop':[1,2],'density':[1],'bush_dens':[0]}])) == 13
+
+def test_shards_cover_every_point_once():
+    points = expand_grid(GRID)
+
+    shards = [shard_points(points,shard_index,5) for shard_index in range(5)]
+
+    assert sorted(point_key(point) for shard in shards for point in shard) == sorted(point_key(point) for point in points)
+    assert max(map(len,shards)) - min(map(len,shards)) <= 1
+    with pytest.raises(ValueError):
+        shard_points(points,5,5)
+
+def test_shard_from_environment():
+    assert shard_from_environment({}) is None
+    assert shard_from_environment({'SLURM_ARRAY_TASK_ID':'3','SLURM_ARRAY_TASK_MIN':'1','SLURM_ARRAY_TASK_COUNT':'20'}) == (2,20)
+    assert shard_from_environment({'SLURM_ARRAY_TASK_ID':'3','SLURM_ARRAY_TASK_MIN':'1','SLURM_ARRAY_TASK_MAX':'20'}) == (2,20)
+
+def test_point_tasks():
+    point = expand_grid(GRID)[4]
+
+    tasks = point_tasks(point,3,40,'array',seed=1)
+
+    assert tasks == point_tasks(dict(point),3,40,'array',seed=1)
+    #all the replicates share a landscape, and every replicate has its own run seed
+    assert len({task[3] for task in tasks}) == 1
+    assert len({task[4] for task in tasks}) == 3
+    assert tasks[0][5] == {'bush_dens':point['bush_dens']}
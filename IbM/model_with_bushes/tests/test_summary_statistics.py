@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Author: Shikhara Bhat
+Email ID: shikharabhat@gmail.com
+Date created: 2026-10-18 23:05:10
+Date last modified: 2026-10-18 23:05:10
+Purpose: Tests that grouped_statistics (summary_statistics.py) gives the statistics that the model
+used to compute from a separate list per group with numpy and scipy, including for empty groups
+and groups whose values are all equal.
+'''
+
+import warnings
+import numpy as np
+import scipy.stats as st
+from summary_statistics import STATISTICS, grouped_statistics
+
+def list_statistics(values):
+    #the reductions that were made on the list of every group
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        return {'mean':np.mean(values),'sd':np.std(values),'kurtosis':st.kurtosis(values),'skew':st.skew(values),
+                'min':np.min(values) if len(values) else np.nan,'max':np.max(values) if len(values) else np.nan,
+                'median':np.median(values)}
+
+def test_matches_per_group_reductions():
+    rng = np.random.default_rng(1)
+    num_groups = 5
+    values = rng.gamma(2,size=(300,3))
+    #group 3 is empty, and group 4 has a single row
+    groups = rng.choice([0,1,2],size=300)
+    groups[0] = 4
+    #every value of column 2 is the same in group 1
+    values[groups == 1,2] = 7.0
+
+    output = grouped_statistics(values,groups,num_groups)
+
+    for group in range(num_groups):
+        for column in range(values.shape[1]):
+            expected = list_statistics(values[groups == group,column])
+            for stat_type in STATISTICS:
+                np.testing.assert_allclose(output[stat_type][group,column],expected[stat_type],rtol=1e-10,atol=1e-12,
+                                           equal_nan=True,err_msg=stat_type+' of group '+str(group)+', column '+str(column))
+
+def test_no_rows():
+    output = grouped_statistics(np.zeros((0,2)),np.zeros(0,dtype=int),3)
+
+    for stat_type in STATISTICS:
+        assert output[stat_type].shape == (3,2)
+        assert np.all(np.isnan(output[stat_type]))
@@ -9,19 +9,26 @@ Purpose: This script is used to visualize the
 simulation, just to get a visual idea of what is
 going on. This is NOT necessary for the final output.
 '''
+import numpy as np
 from class_model import Model
 from class_landscape import Landscape
-from class_bush import Bush
-from static_params import *
+from class_params import DEFAULT_PARAMS
 
-np.random.seed(3)
+#the habitat to show: 'bushes' (Fig 1B) or 'homogeneous' (Fig 1A, see class_habitat.py)
+habitat = 'bushes'
+seed,figure = {'bushes':(3,'fig_1_B.png'),'homogeneous':(5,'fig_1_A.png')}[habitat]
+
+np.random.seed(seed)
+
+#static parameters of the run (see class_params.py)
+params = DEFAULT_PARAMS
 
 N = 20 #Total number of individuals
 #dens = 1 #Population density (in inds/sq m)
 #side = ((N/dens)**0.5)*100 #times 100 to convert from m to cm
 side = 1000
-landscape = Landscape([0,side,5],[0,side,5])
-landscape.make_bushes(0.5,bush_size_mean,bush_size_sd)
+landscape = Landscape([0,side,5],[0,side,5],habitat=habitat)
+landscape.make_bushes(0.5,params.bush_size_mean,params.bush_size_sd)
 #bush1 = Bush(100,200,100)
 #bush2 = Bush(300,200,100)
 
@@ -29,10 +36,10 @@ landscape.make_bushes(0.5,bush_size_mean,bush_size_sd)
 #landscape.bushcenters = [(100,200),(300,200)]
 landscape.make_distance_list()
 sim = Model(int(round(0.5*N)),int(round(0.5*N)),landscape) #sex ratio is 1:1
-sim.gen_callers(0.2,SPL,side) #baffle_prop is 0.2
+sim.gen_callers(0.2,params.SPL,side) #baffle_prop is 0.2
 
 #draw female velocities from a lognormal dist
-fem_vel = np.random.lognormal(fem_vel_mean,fem_vel_sd,size=int(round(0.5*N)))
+fem_vel = np.random.lognormal(params.fem_vel_mean,params.fem_vel_sd,size=int(round(0.5*N)))
 
 #decompose into orthogonal components
 fem_vel /= np.sqrt(2)
@@ -43,6 +50,6 @@ sim.gen_receivers(fem_vel,fem_vel,side)
 save_dir = "D:\github\Sadiq_et_al_2023_oecanthus_ART_IbM\output"
 
 sim.run(10,side)
-sim.visualize(1,save=True, filename = (save_dir+str('fig_1_B.png')))
+sim.visualize(1,save=True, filename = (save_dir+str(figure)))
 
 